@@ -0,0 +1,72 @@
+"""
+Benchmark a burst of concurrent conversions over the default HTTP/1.1
+transport versus the multiplexed HTTP/2 transport, against local stand-in
+servers that answer after a fixed delay.
+
+Reports the throughput and the number of connections each transport opened.
+The HTTP/2 transport needs the h2 package.
+
+Run with: uv run --package api --with h2 -- python libs/api_sdk/benchmarks/bench_http2.py
+"""
+
+import importlib.util
+import time
+from collections.abc import Callable
+
+from api_sdk import ApiClient, Configuration, TimestampApi
+from api_sdk.test.local_server import LocalHTTP2Server, LocalServer, convert
+
+REQUESTS = 2000
+IN_FLIGHT = 64
+# simulated server processing time per request
+SERVER_DELAY = 0.005
+
+
+def slow_convert(path: str, query: dict, headers: object) -> tuple:
+    time.sleep(SERVER_DELAY)
+    return convert(path, query, headers)
+
+
+def run(server_class: Callable[..., LocalServer | LocalHTTP2Server], http2: bool) -> tuple[float, int]:
+    """
+    Send `REQUESTS` conversions with `IN_FLIGHT` of them in flight at a time.
+
+    Args:
+        server_class: Local stand-in server to send the requests to.
+        http2: Whether to use the HTTP/2 transport.
+
+    Returns:
+        Requests per second and the number of connections the server accepted.
+    """
+    with server_class(slow_convert) as server:
+        configuration = Configuration(host=server.host)
+        configuration.http2 = http2
+        # one worker thread, and for HTTP/1.1 one connection, per request in flight
+        configuration.connection_pool_maxsize = IN_FLIGHT
+        with ApiClient(configuration) as client:
+            api = TimestampApi(client)
+            start = time.perf_counter()
+            for _ in client.imap(lambda ts: api.convert_timestamp(s=ts), range(REQUESTS), IN_FLIGHT):
+                pass
+            elapsed = time.perf_counter() - start
+            client.rest_client.transport.clear()
+        return REQUESTS / elapsed, server.connections
+
+
+def main() -> None:
+    if importlib.util.find_spec("h2") is None:
+        print("h2 is not installed, skipping the HTTP/2 transport benchmark")
+        return
+
+    print(f"{REQUESTS} conversions, {IN_FLIGHT} in flight, {SERVER_DELAY * 1000:.0f} ms server delay")
+    base_rps, base_connections = run(LocalServer, http2=False)
+    print(f"  {'HTTP/1.1 (urllib3 pool)':<40} {base_rps:10.0f} req/s  {base_connections:4d} connections")
+    h2_rps, h2_connections = run(LocalHTTP2Server, http2=True)
+    print(
+        f"  {'HTTP/2 (multiplexed)':<40} {h2_rps:10.0f} req/s  {h2_connections:4d} connections"
+        f"  ({h2_rps / base_rps:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
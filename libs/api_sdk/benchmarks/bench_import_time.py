@@ -0,0 +1,80 @@
+"""
+Benchmark the cold import of `TimestampApi` with `python -X importtime`
+and fail when it exceeds the startup-time budget.
+
+Every pytest-xdist worker pays this cost before its first request. Set
+`API_SDK_IMPORT_BUDGET_MS` to override the budget on slower machines.
+
+Run with: uv run --package api -- python libs/api_sdk/benchmarks/bench_import_time.py
+"""
+
+import os
+import subprocess
+import sys
+
+IMPORT_BUDGET_MS = float(os.environ.get("API_SDK_IMPORT_BUDGET_MS", 400))
+RUNS = 5
+STATEMENT = "from api_sdk import TimestampApi; TimestampApi"
+
+# dependencies that must not be loaded until they are actually needed
+DEFERRED_MODULES = ("dateutil", "multiprocessing", "asyncio")
+
+
+def import_times() -> dict[str, int]:
+    """
+    Import `TimestampApi` in a fresh interpreter.
+
+    Returns:
+        Cumulative import time in microseconds of every top-level import.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", STATEMENT],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # nested imports are indented below the module importing them
+        if not name.startswith("  "):
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def loaded_deferred_modules() -> list[str]:
+    """
+    Import `TimestampApi` in a fresh interpreter.
+
+    Returns:
+        The deferred modules that got imported anyway.
+    """
+    check = f"import sys; {STATEMENT}; print(' '.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", check], capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+
+def main() -> None:
+    runs = [import_times() for _ in range(RUNS)]
+    best = min(runs, key=lambda times: sum(times.values()))
+    total_ms = sum(best.values()) / 1000
+
+    print(f"cold import of TimestampApi (best of {RUNS})")
+    for name, cumulative in sorted(best.items(), key=lambda item: -item[1])[:10]:
+        print(f"  {name:<45} {cumulative / 1000:10.2f} ms")
+    print(f"  {'total':<45} {total_ms:10.2f} ms  (budget {IMPORT_BUDGET_MS:.0f} ms)")
+
+    failures = []
+    if total_ms > IMPORT_BUDGET_MS:
+        failures.append(f"import time {total_ms:.0f} ms exceeds the {IMPORT_BUDGET_MS:.0f} ms budget")
+    loaded = loaded_deferred_modules()
+    if loaded:
+        failures.append(f"deferred modules imported eagerly: {', '.join(loaded)}")
+    if failures:
+        sys.exit("\n".join(failures))
+
+
+if __name__ == "__main__":
+    main()
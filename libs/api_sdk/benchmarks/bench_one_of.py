@@ -0,0 +1,35 @@
+"""
+Benchmark oneOf model deserialization: single-parse fast path versus
+validating the payload against every schema in turn.
+
+Run with: uv run --package api -- python libs/api_sdk/benchmarks/bench_one_of.py
+"""
+
+import json
+
+from timing import per_call, report
+
+from api_sdk.models.convert_timestamp200_response import ConvertTimestamp200Response
+
+PAYLOADS = [1672531200, "2023-01-01 12:00:00", False]
+
+
+def main() -> None:
+    for value in PAYLOADS:
+        json_str = json.dumps(value)
+        report(
+            f"ConvertTimestamp200Response.from_dict({value!r})",
+            ("single-parse", per_call(lambda: ConvertTimestamp200Response.from_dict(value))),
+            ("per-schema (json.dumps + 3x json.loads)", per_call(
+                lambda: ConvertTimestamp200Response._from_json_each_schema(json.dumps(value))
+            )),
+        )
+        report(
+            f"ConvertTimestamp200Response.from_json({json_str!r})",
+            ("single-parse (TypeAdapter)", per_call(lambda: ConvertTimestamp200Response.from_json(json_str))),
+            ("per-schema", per_call(lambda: ConvertTimestamp200Response._from_json_each_schema(json_str))),
+        )
+
+
+if __name__ == "__main__":
+    main()
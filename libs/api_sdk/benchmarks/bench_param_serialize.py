@@ -0,0 +1,39 @@
+"""
+Benchmark request serialization of `convert_timestamp`: the generic
+`ApiClient.param_serialize` path versus the compiled request template.
+
+Run with: uv run --package api -- python libs/api_sdk/benchmarks/bench_param_serialize.py
+"""
+
+from timing import per_call, report
+
+from api_sdk import ApiClient, Configuration, TimestampApi
+
+
+def main() -> None:
+    api = TimestampApi(ApiClient(Configuration(host="https://helloacm.com")))
+    accept = {"Accept": "application/json"}
+
+    report(
+        "TimestampApi._convert_timestamp_serialize('', '1672531200')",
+        ("compiled template", per_call(
+            lambda: api._convert_timestamp_serialize("", "1672531200", None, None, None, 0)
+        )),
+        # per-request headers force the generic path
+        ("generic param_serialize", per_call(
+            lambda: api._convert_timestamp_serialize("", "1672531200", None, None, dict(accept), 0)
+        )),
+    )
+    report(
+        "TimestampApi._convert_timestamp_serialize('', '2023-01-01 12:00:00')",
+        ("compiled template", per_call(
+            lambda: api._convert_timestamp_serialize("", "2023-01-01 12:00:00", None, None, None, 0)
+        )),
+        ("generic param_serialize", per_call(
+            lambda: api._convert_timestamp_serialize("", "2023-01-01 12:00:00", None, None, dict(accept), 0)
+        )),
+    )
+
+
+if __name__ == "__main__":
+    main()
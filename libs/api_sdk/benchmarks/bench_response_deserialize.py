@@ -0,0 +1,44 @@
+"""
+Benchmark `ApiClient.response_deserialize` with the compiled deserializer
+registry, against resolving the response type on every call as the
+string-driven implementation did.
+
+Run with: uv run --package api -- python libs/api_sdk/benchmarks/bench_response_deserialize.py
+"""
+
+from timing import per_call, report
+
+from api_sdk import ApiClient
+from api_sdk.api_client import parse_content_type
+from api_sdk.cache import CachedResponse
+from api_sdk.rest import RESTResponse
+
+HEADERS = {"content-type": "application/json"}
+RESPONSE_TYPES_MAP = {"200": "ConvertTimestamp200Response", "404": "str"}
+BODIES = [b'"2023-01-01 12:00:00"', b"1672531200", b"false"]
+
+
+def main() -> None:
+    api_client = ApiClient()
+
+    def uncompiled(response: RESTResponse) -> object:
+        # forget every resolved type, as if nothing had been compiled yet
+        api_client._deserializers.clear()
+        api_client._response_deserializers.clear()
+        parse_content_type.cache_clear()
+        return api_client.response_deserialize(response, RESPONSE_TYPES_MAP)
+
+    for body in BODIES:
+        response = RESTResponse(CachedResponse(200, "OK", HEADERS, body))
+        response.read()
+        report(
+            f"ApiClient.response_deserialize({body!r})",
+            ("compiled deserializer", per_call(
+                lambda: api_client.response_deserialize(response, RESPONSE_TYPES_MAP)
+            )),
+            ("resolved per call (regex + getattr)", per_call(lambda: uncompiled(response))),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Benchmark the per-call cost of pydantic argument validation on
+`TimestampApi.convert_timestamp_with_http_info`, with and without
+`Configuration.client_side_validation`.
+
+The REST transport is replaced by a stub returning a canned response, so
+only the client-side work is measured.
+
+Run with: uv run --package api -- python libs/api_sdk/benchmarks/bench_validate_call.py
+"""
+
+from timing import per_call, report
+
+from api_sdk import ApiClient, Configuration, TimestampApi
+from api_sdk.cache import CachedResponse
+from api_sdk.rest import RESTResponse
+
+
+class StubRESTClient:
+    """REST client returning the same response for every request."""
+
+    def request(self, *args: object, **kwargs: object) -> RESTResponse:
+        return RESTResponse(CachedResponse(200, "OK", {"Content-Type": "application/json"}, b'"2023-01-01 12:00:00"'))
+
+
+def make_api(client_side_validation: bool) -> TimestampApi:
+    configuration = Configuration()
+    configuration.client_side_validation = client_side_validation
+    api_client = ApiClient(configuration)
+    api_client.rest_client = StubRESTClient()  # type: ignore[assignment]
+    return TimestampApi(api_client)
+
+
+def main() -> None:
+    validated, trusted = make_api(True), make_api(False)
+    kwargs = {"cached": "", "s": 1672531200, "_request_timeout": (3.0, 10.0), "_headers": {"X-Test": "1"}}
+
+    report(
+        "TimestampApi.convert_timestamp_with_http_info",
+        ("trusted (client_side_validation=False)", per_call(lambda: trusted.convert_timestamp_with_http_info(**kwargs))),
+        ("validated (@validate_call)", per_call(lambda: validated.convert_timestamp_with_http_info(**kwargs))),
+    )
+
+
+if __name__ == "__main__":
+    main()
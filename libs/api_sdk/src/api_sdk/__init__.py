@@ -19,9 +19,13 @@ __version__ = "1.0.0"
 # Define package exports
 __all__ = [
     "TimestampApi",
+    "AsyncTimestampApi",
     "ApiResponse",
+    "RequestTimings",
     "ApiClient",
+    "AsyncApiClient",
     "Configuration",
+    "FrozenConfiguration",
     "OpenApiException",
     "ApiTypeError",
     "ApiValueError",
@@ -35,11 +39,15 @@ __all__ = [
 if __import__("typing").TYPE_CHECKING:
     # import apis into sdk package
     from api_sdk.api.timestamp_api import TimestampApi as TimestampApi
+    from api_sdk.api.async_timestamp_api import AsyncTimestampApi as AsyncTimestampApi
     
     # import ApiClient
     from api_sdk.api_response import ApiResponse as ApiResponse
+    from api_sdk.timings import RequestTimings as RequestTimings
     from api_sdk.api_client import ApiClient as ApiClient
+    from api_sdk.async_api_client import AsyncApiClient as AsyncApiClient
     from api_sdk.configuration import Configuration as Configuration
+    from api_sdk.configuration import FrozenConfiguration as FrozenConfiguration
     from api_sdk.exceptions import OpenApiException as OpenApiException
     from api_sdk.exceptions import ApiTypeError as ApiTypeError
     from api_sdk.exceptions import ApiValueError as ApiValueError
@@ -61,11 +69,15 @@ else:
             ("__all__", __all__),
             """# import apis into sdk package
 from api_sdk.api.timestamp_api import TimestampApi as TimestampApi
+from api_sdk.api.async_timestamp_api import AsyncTimestampApi as AsyncTimestampApi
 
 # import ApiClient
 from api_sdk.api_response import ApiResponse as ApiResponse
+from api_sdk.timings import RequestTimings as RequestTimings
 from api_sdk.api_client import ApiClient as ApiClient
+from api_sdk.async_api_client import AsyncApiClient as AsyncApiClient
 from api_sdk.configuration import Configuration as Configuration
+from api_sdk.configuration import FrozenConfiguration as FrozenConfiguration
 from api_sdk.exceptions import OpenApiException as OpenApiException
 from api_sdk.exceptions import ApiTypeError as ApiTypeError
 from api_sdk.exceptions import ApiValueError as ApiValueError
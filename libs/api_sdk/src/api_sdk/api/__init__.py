@@ -3,6 +3,7 @@
 if __import__("typing").TYPE_CHECKING:
     # import apis into api package
     from api_sdk.api.timestamp_api import TimestampApi
+    from api_sdk.api.async_timestamp_api import AsyncTimestampApi
     
 else:
     from lazy_imports import LazyModule, as_package, load
@@ -12,6 +13,7 @@ else:
             *as_package(__file__),
             """# import apis into api package
 from api_sdk.api.timestamp_api import TimestampApi
+from api_sdk.api.async_timestamp_api import AsyncTimestampApi
 
 """,
             name=__name__,
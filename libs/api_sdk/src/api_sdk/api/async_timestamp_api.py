@@ -0,0 +1,540 @@
+# coding: utf-8
+
+"""
+    Unix Timestamp Converter API
+
+    An API to convert between Unix timestamps and human-readable date strings
+
+    The version of the OpenAPI document: 1.0.0
+
+    asyncio flavour of `TimestampApi`.
+"""  # noqa: E501
+
+from pydantic import Field, StrictFloat, StrictStr, StrictInt
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union
+from typing_extensions import Annotated
+
+from api_sdk.models.convert_timestamp200_response import ConvertTimestamp200Response
+
+from api_sdk.api.timestamp_api import TimestampApi
+from api_sdk.async_api_client import AsyncApiClient
+from api_sdk.api_response import ApiResponse
+from api_sdk.validation import validate_call
+from api_sdk.async_rest import AsyncHTTPResponse
+
+
+class AsyncTimestampApi(TimestampApi):
+    """Coroutine variants of the `TimestampApi` operations.
+
+    Requests are serialized and responses deserialized exactly as in
+    `TimestampApi`; only the transport is asynchronous, so the methods must
+    be awaited and the API client must be an `AsyncApiClient`.
+    """
+
+    def __init__(self, api_client=None) -> None:
+        if api_client is None:
+            api_client = AsyncApiClient.get_default()
+        self.api_client = api_client
+
+
+    @validate_call
+    async def convert_timestamp(
+        self,
+        cached: Annotated[Optional[StrictStr], Field(description="Enable caching for the conversion")] = None,
+        s: Annotated[Optional[Any], Field(description="The Unix timestamp (integer) or date string (YYYY-MM-DD HH:MM:SS) to convert")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ConvertTimestamp200Response:
+        """Convert Unix timestamp or date-time string
+
+
+        :param cached: Enable caching for the conversion
+        :type cached: str
+        :param s: The Unix timestamp (integer) or date string (YYYY-MM-DD HH:MM:SS) to convert
+        :type s: ConvertTimestampSParameter
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._convert_timestamp_serialize(
+            cached=cached,
+            s=s,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "ConvertTimestamp200Response",
+            '404': "str",
+        }
+        response_data = await self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout,
+            _cacheable=cached is not None
+        )
+        await response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        ).data
+
+
+    @validate_call
+    async def convert_timestamp_with_http_info(
+        self,
+        cached: Annotated[Optional[StrictStr], Field(description="Enable caching for the conversion")] = None,
+        s: Annotated[Optional[Any], Field(description="The Unix timestamp (integer) or date string (YYYY-MM-DD HH:MM:SS) to convert")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[ConvertTimestamp200Response]:
+        """Convert Unix timestamp or date-time string
+
+
+        :param cached: Enable caching for the conversion
+        :type cached: str
+        :param s: The Unix timestamp (integer) or date string (YYYY-MM-DD HH:MM:SS) to convert
+        :type s: ConvertTimestampSParameter
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._convert_timestamp_serialize(
+            cached=cached,
+            s=s,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "ConvertTimestamp200Response",
+            '404': "str",
+        }
+        response_data = await self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout,
+            _cacheable=cached is not None
+        )
+        await response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        )
+
+
+    @validate_call
+    async def convert_timestamp_without_preload_content(
+        self,
+        cached: Annotated[Optional[StrictStr], Field(description="Enable caching for the conversion")] = None,
+        s: Annotated[Optional[Any], Field(description="The Unix timestamp (integer) or date string (YYYY-MM-DD HH:MM:SS) to convert")] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> AsyncHTTPResponse:
+        """Convert Unix timestamp or date-time string
+
+
+        :param cached: Enable caching for the conversion
+        :type cached: str
+        :param s: The Unix timestamp (integer) or date string (YYYY-MM-DD HH:MM:SS) to convert
+        :type s: ConvertTimestampSParameter
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._convert_timestamp_serialize(
+            cached=cached,
+            s=s,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "ConvertTimestamp200Response",
+            '404': "str",
+        }
+        response_data = await self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout,
+            _cacheable=cached is not None
+        )
+        return response_data.response
+
+
+    def convert_timestamps(
+        self,
+        timestamps: Iterable[Any],
+        cached: Optional[StrictStr] = None,
+        max_in_flight: Optional[int] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+    ) -> AsyncIterator[ConvertTimestamp200Response]:
+        """Convert many Unix timestamps or date-time strings concurrently
+
+        :param timestamps: The Unix timestamps (integer) or date strings (YYYY-MM-DD HH:MM:SS) to convert,
+                           a sync or async iterable
+        :type timestamps: Iterable[ConvertTimestampSParameter]
+        :param cached: Enable caching for the conversion
+        :type cached: str
+        :param max_in_flight: maximum number of concurrent requests,
+                              defaults to the connection pool size.
+        :type max_in_flight: int, optional
+        :param _request_timeout: timeout setting for each request.
+        :type _request_timeout: int, tuple(int, int), optional
+        :return: Returns an async iterator over the result objects.
+        """ # noqa: E501
+        async def convert(s):
+            return await self.convert_timestamp(
+                cached=cached,
+                s=s,
+                _request_timeout=_request_timeout,
+            )
+
+        return self.api_client.imap(convert, timestamps, max_in_flight=max_in_flight)
+
+
+    def convert_timestamps_with_http_info(
+        self,
+        timestamps: Iterable[Any],
+        cached: Optional[StrictStr] = None,
+        max_in_flight: Optional[int] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+    ) -> AsyncIterator[ApiResponse[ConvertTimestamp200Response]]:
+        """Convert many Unix timestamps or date-time strings concurrently
+
+        :param timestamps: The Unix timestamps (integer) or date strings (YYYY-MM-DD HH:MM:SS) to convert,
+                           a sync or async iterable
+        :type timestamps: Iterable[ConvertTimestampSParameter]
+        :param cached: Enable caching for the conversion
+        :type cached: str
+        :param max_in_flight: maximum number of concurrent requests,
+                              defaults to the connection pool size.
+        :type max_in_flight: int, optional
+        :param _request_timeout: timeout setting for each request.
+        :type _request_timeout: int, tuple(int, int), optional
+        :return: Returns an async iterator over the response objects.
+        """ # noqa: E501
+        async def convert(s):
+            return await self.convert_timestamp_with_http_info(
+                cached=cached,
+                s=s,
+                _request_timeout=_request_timeout,
+            )
+
+        return self.api_client.imap(convert, timestamps, max_in_flight=max_in_flight)
+
+
+    @validate_call
+    async def convert_timestamps_bulk(
+        self,
+        request_body: Annotated[List[Any], Field(description="The Unix timestamps (integers) or date strings (YYYY-MM-DD HH:MM:SS) to convert")],
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> List[ConvertTimestamp200Response]:
+        """Convert many Unix timestamps or date-time strings in one request
+
+        Served by the reference server in packages/api only, the live API
+        has no bulk endpoint.
+
+        :param request_body: The Unix timestamps (integers) or date strings (YYYY-MM-DD HH:MM:SS) to convert (required)
+        :type request_body: List[ConvertTimestampSParameter]
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request. With
+                              application/octet-stream the timestamps are
+                              sent as little-endian 64-bit integers, which
+                              excludes date strings.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._convert_timestamps_bulk_serialize(
+            request_body=request_body,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "List[ConvertTimestamp200Response]",
+            '400': "bool",
+            '415': "bool",
+        }
+        response_data = await self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        await response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        ).data
+
+
+    @validate_call
+    async def convert_timestamps_bulk_with_http_info(
+        self,
+        request_body: Annotated[List[Any], Field(description="The Unix timestamps (integers) or date strings (YYYY-MM-DD HH:MM:SS) to convert")],
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[List[ConvertTimestamp200Response]]:
+        """Convert many Unix timestamps or date-time strings in one request
+
+        Served by the reference server in packages/api only, the live API
+        has no bulk endpoint.
+
+        :param request_body: The Unix timestamps (integers) or date strings (YYYY-MM-DD HH:MM:SS) to convert (required)
+        :type request_body: List[ConvertTimestampSParameter]
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request. With
+                              application/octet-stream the timestamps are
+                              sent as little-endian 64-bit integers, which
+                              excludes date strings.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._convert_timestamps_bulk_serialize(
+            request_body=request_body,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "List[ConvertTimestamp200Response]",
+            '400': "bool",
+            '415': "bool",
+        }
+        response_data = await self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        await response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        )
+
+
+    @validate_call
+    async def convert_timestamps_bulk_without_preload_content(
+        self,
+        request_body: Annotated[List[Any], Field(description="The Unix timestamps (integers) or date strings (YYYY-MM-DD HH:MM:SS) to convert")],
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> AsyncHTTPResponse:
+        """Convert many Unix timestamps or date-time strings in one request
+
+        Served by the reference server in packages/api only, the live API
+        has no bulk endpoint.
+
+        :param request_body: The Unix timestamps (integers) or date strings (YYYY-MM-DD HH:MM:SS) to convert (required)
+        :type request_body: List[ConvertTimestampSParameter]
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request. With
+                              application/octet-stream the timestamps are
+                              sent as little-endian 64-bit integers, which
+                              excludes date strings.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._convert_timestamps_bulk_serialize(
+            request_body=request_body,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "List[ConvertTimestamp200Response]",
+            '400': "bool",
+            '415': "bool",
+        }
+        response_data = await self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        return response_data.response
@@ -12,17 +12,19 @@
 """  # noqa: E501
 
 import warnings
-from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
-from typing import Any, Dict, List, Optional, Tuple, Union
+from pydantic import Field, StrictFloat, StrictStr, StrictInt
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
 from pydantic import Field, StrictStr
-from typing import Any, Optional
+from typing import Any, List, Optional
 from typing_extensions import Annotated
 from api_sdk.models.convert_timestamp200_response import ConvertTimestamp200Response
+from api_sdk.models.convert_timestamp_s_parameter import ConvertTimestampSParameter
 
 from api_sdk.api_client import ApiClient, RequestSerialized
 from api_sdk.api_response import ApiResponse
+from api_sdk.validation import validate_call
 from api_sdk.rest import RESTResponseType
 
 
@@ -101,7 +103,8 @@ class TimestampApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _cacheable=cached is not None
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -172,7 +175,8 @@ class TimestampApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _cacheable=cached is not None
         )
         response_data.read()
         return self.api_client.response_deserialize(
@@ -243,11 +247,90 @@ class TimestampApi:
         }
         response_data = self.api_client.call_api(
             *_param,
-            _request_timeout=_request_timeout
+            _request_timeout=_request_timeout,
+            _cacheable=cached is not None
         )
         return response_data.response
 
 
+    def convert_timestamps(
+        self,
+        timestamps: Iterable[Any],
+        cached: Annotated[Optional[StrictStr], Field(description="Enable caching for the conversion")] = None,
+        max_in_flight: Optional[int] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+    ) -> Iterator[ConvertTimestamp200Response]:
+        """Convert many Unix timestamps or date-time strings concurrently
+
+        Requests are pipelined over the shared connection pool of the API
+        client, see `ApiClient.imap`. Results are yielded in input order and
+        at most `max_in_flight` requests are outstanding at any time.
+
+        :param timestamps: The Unix timestamp (integer) or date string (YYYY-MM-DD HH:MM:SS) to convert
+        :type timestamps: Iterable[ConvertTimestampSParameter]
+        :param cached: Enable caching for the conversion
+        :type cached: str, optional
+        :param max_in_flight: maximum number of concurrent requests,
+                              defaults to the connection pool size.
+        :type max_in_flight: int, optional
+        :param _request_timeout: timeout setting for each request.
+        :type _request_timeout: int, tuple(int, int), optional
+        :return: Returns an iterator over the result objects.
+        """ # noqa: E501
+        return (
+            response.data for response in self.convert_timestamps_with_http_info(
+                timestamps,
+                cached=cached,
+                max_in_flight=max_in_flight,
+                _request_timeout=_request_timeout,
+            )
+        )
+
+
+    def convert_timestamps_with_http_info(
+        self,
+        timestamps: Iterable[Any],
+        cached: Annotated[Optional[StrictStr], Field(description="Enable caching for the conversion")] = None,
+        max_in_flight: Optional[int] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+    ) -> Iterator[ApiResponse[ConvertTimestamp200Response]]:
+        """Convert many Unix timestamps or date-time strings concurrently
+
+        :param timestamps: The Unix timestamp (integer) or date string (YYYY-MM-DD HH:MM:SS) to convert
+        :type timestamps: Iterable[ConvertTimestampSParameter]
+        :param cached: Enable caching for the conversion
+        :type cached: str, optional
+        :param max_in_flight: maximum number of concurrent requests,
+                              defaults to the connection pool size.
+        :type max_in_flight: int, optional
+        :param _request_timeout: timeout setting for each request.
+        :type _request_timeout: int, tuple(int, int), optional
+        :return: Returns an iterator over the response objects.
+        """ # noqa: E501
+        def call(s):
+            return self.convert_timestamp_with_http_info(
+                cached=cached,
+                s=s,
+                _request_timeout=_request_timeout,
+            )
+
+        return self.api_client.imap(call, timestamps, max_in_flight=max_in_flight)
+
+
     def _convert_timestamp_serialize(
         self,
         cached,
@@ -287,6 +370,17 @@ class TimestampApi:
         # process the body parameter
 
 
+        if not _header_params and _request_auth is None and not _collection_formats:
+            return self.api_client.compiled_param_serialize(
+                method='GET',
+                resource_path='/api/unix-timestamp-converter/',
+                query_params=_query_params,
+                accepts=[
+                    'application/json'
+                ],
+                _host=_host
+            )
+
         # set the HTTP header `Accept`
         if 'Accept' not in _header_params:
             _header_params['Accept'] = self.api_client.select_header_accept(
@@ -316,3 +410,290 @@ class TimestampApi:
         )
 
 
+
+
+    @validate_call
+    def convert_timestamps_bulk(
+        self,
+        request_body: Annotated[List[ConvertTimestampSParameter], Field(description="The Unix timestamps (integers) or date strings (YYYY-MM-DD HH:MM:SS) to convert")],
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> List[ConvertTimestamp200Response]:
+        """Convert many Unix timestamps or date-time strings in one request
+
+        Served by the reference server in packages/api only, the live API has no bulk endpoint. As application/octet-stream, the timestamps are sent as little-endian signed 64-bit integers, which excludes date strings
+
+        :param request_body: The Unix timestamps (integers) or date strings (YYYY-MM-DD HH:MM:SS) to convert (required)
+        :type request_body: List[ConvertTimestampSParameter]
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._convert_timestamps_bulk_serialize(
+            request_body=request_body,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "List[ConvertTimestamp200Response]",
+            '400': "bool",
+            '413': None,
+            '415': "bool",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        ).data
+
+
+    @validate_call
+    def convert_timestamps_bulk_with_http_info(
+        self,
+        request_body: Annotated[List[ConvertTimestampSParameter], Field(description="The Unix timestamps (integers) or date strings (YYYY-MM-DD HH:MM:SS) to convert")],
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[List[ConvertTimestamp200Response]]:
+        """Convert many Unix timestamps or date-time strings in one request
+
+        Served by the reference server in packages/api only, the live API has no bulk endpoint. As application/octet-stream, the timestamps are sent as little-endian signed 64-bit integers, which excludes date strings
+
+        :param request_body: The Unix timestamps (integers) or date strings (YYYY-MM-DD HH:MM:SS) to convert (required)
+        :type request_body: List[ConvertTimestampSParameter]
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._convert_timestamps_bulk_serialize(
+            request_body=request_body,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "List[ConvertTimestamp200Response]",
+            '400': "bool",
+            '413': None,
+            '415': "bool",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        )
+
+
+    @validate_call
+    def convert_timestamps_bulk_without_preload_content(
+        self,
+        request_body: Annotated[List[ConvertTimestampSParameter], Field(description="The Unix timestamps (integers) or date strings (YYYY-MM-DD HH:MM:SS) to convert")],
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Convert many Unix timestamps or date-time strings in one request
+
+        Served by the reference server in packages/api only, the live API has no bulk endpoint. As application/octet-stream, the timestamps are sent as little-endian signed 64-bit integers, which excludes date strings
+
+        :param request_body: The Unix timestamps (integers) or date strings (YYYY-MM-DD HH:MM:SS) to convert (required)
+        :type request_body: List[ConvertTimestampSParameter]
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._convert_timestamps_bulk_serialize(
+            request_body=request_body,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "List[ConvertTimestamp200Response]",
+            '400': "bool",
+            '413': None,
+            '415': "bool",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        return response_data.response
+
+
+    def _convert_timestamps_bulk_serialize(
+        self,
+        request_body,
+        _request_auth,
+        _content_type,
+        _headers,
+        _host_index,
+    ) -> RequestSerialized:
+
+        _host = None
+
+        _collection_formats: Dict[str, str] = {
+            'request_body': '',
+        }
+
+        _path_params: Dict[str, str] = {}
+        _query_params: List[Tuple[str, str]] = []
+        _header_params: Dict[str, Optional[str]] = _headers or {}
+        _form_params: List[Tuple[str, str]] = []
+        _files: Dict[
+            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
+        ] = {}
+        _body_params: Optional[bytes] = None
+
+        # process the path parameters
+        # process the query parameters
+        # process the header parameters
+        # process the form parameters
+        # process the body parameter
+        if request_body is not None:
+            _body_params = request_body
+
+
+        # set the HTTP header `Accept`
+        if 'Accept' not in _header_params:
+            _header_params['Accept'] = self.api_client.select_header_accept(
+                [
+                    'application/json'
+                ]
+            )
+
+        # set the HTTP header `Content-Type`
+        if _content_type:
+            _header_params['Content-Type'] = _content_type
+        else:
+            _default_content_type = (
+                self.api_client.select_header_content_type(
+                    [
+                        'application/json', 
+                        'application/octet-stream'
+                    ]
+                )
+            )
+            if _default_content_type is not None:
+                _header_params['Content-Type'] = _default_content_type
+
+        if _header_params['Content-Type'] == 'application/octet-stream' and request_body is not None:
+            _body_params = self.api_client.pack_int64_array(request_body)
+
+        # authentication setting
+        _auth_settings: List[str] = [
+        ]
+
+        return self.api_client.param_serialize(
+            method='POST',
+            resource_path='/api/unix-timestamp-converter/bulk/',
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            auth_settings=_auth_settings,
+            collection_formats=_collection_formats,
+            _host=_host,
+            _request_auth=_request_auth
+        )
+
+
@@ -12,25 +12,30 @@
 """  # noqa: E501
 
 
+import collections
+from concurrent.futures import ThreadPoolExecutor
 import datetime
-from dateutil.parser import parse
 from enum import Enum
 import decimal
+import functools
+import hashlib
 import json
-import mimetypes
 import os
 import re
-import tempfile
+import struct
+import threading
 import uuid
 
 from urllib.parse import quote
-from typing import Tuple, Optional, List, Dict, Union
+from typing import Any, Callable, Iterable, Iterator, Tuple, Optional, List, Dict, TypeVar, Union
 from pydantic import SecretStr
 
-from api_sdk.configuration import Configuration
+from api_sdk.configuration import Configuration, FrozenConfiguration
 from api_sdk.api_response import ApiResponse, T as ApiResponseT
 import api_sdk.models
 from api_sdk import rest
+from api_sdk.cache import CachedResponse, PersistentResponseCache, ResponseCache
+from api_sdk.singleflight import SingleFlight
 from api_sdk.exceptions import (
     ApiValueError,
     ApiException,
@@ -43,6 +48,43 @@ from api_sdk.exceptions import (
 
 RequestSerialized = Tuple[str, str, Dict[str, str], Optional[str], List[str]]
 
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
+
+
+@functools.lru_cache(maxsize=64)
+def parse_content_type(content_type):
+    """Classifies a response `Content-Type` header value.
+
+    :param content_type: header value.
+    :return: tuple of (kind, encoding), kind being "json", "text" or None
+        for unsupported media types.
+    """
+    match = re.search(r"charset=([a-zA-Z\-\d]+)[\s;]?", content_type)
+    encoding = match.group(1) if match else "utf-8"
+    if re.match(r'^application/(json|[\w!#$&.+\-^_]+\+json)\s*(;|$)', content_type, re.IGNORECASE):
+        return "json", encoding
+    if re.match(r'^text\/[a-z.+-]+\s*(;|$)', content_type, re.IGNORECASE):
+        return "text", encoding
+    return None, encoding
+
+
+class RequestTemplate:
+    """Constant part of an operation request, compiled once per client.
+
+    Holds the URL without its query string and the final headers, so that
+    serializing a request only has to encode the query parameters.
+    """
+
+    __slots__ = ("method", "url", "headers", "default_headers", "cookie")
+
+    def __init__(self, method, url, headers, default_headers, cookie) -> None:
+        self.method = method
+        self.url = url
+        self.headers = headers
+        self.default_headers = default_headers
+        self.cookie = cookie
+
 class ApiClient:
     """Generic API client for OpenAPI client library builds.
 
@@ -71,7 +113,12 @@ class ApiClient:
         'decimal': decimal.Decimal,
         'object': object,
     }
+    # request headers the response may depend on, part of the response
+    # cache key; credentials are keyed by digest, the key is stored on disk
+    RESPONSE_VARYING_HEADERS = frozenset(('accept', 'accept-language', 'authorization', 'cookie'))
+    CREDENTIAL_HEADERS = frozenset(('authorization', 'cookie'))
     _pool = None
+    single_flight_class = SingleFlight
 
     def __init__(
         self,
@@ -85,7 +132,23 @@ class ApiClient:
             configuration = Configuration.get_default()
         self.configuration = configuration
 
-        self.rest_client = rest.RESTClientObject(configuration)
+        self.rest_client = self._create_rest_client(configuration)
+        self.response_cache = None
+        if configuration.response_cache_maxsize and configuration.response_cache_file:
+            self.response_cache = PersistentResponseCache(
+                configuration.response_cache_file,
+                maxsize=configuration.response_cache_maxsize,
+                ttl=configuration.response_cache_ttl,
+                max_bytes=configuration.response_cache_max_bytes,
+            )
+        elif configuration.response_cache_maxsize:
+            self.response_cache = ResponseCache(
+                maxsize=configuration.response_cache_maxsize,
+                ttl=configuration.response_cache_ttl,
+            )
+        self.single_flight = None
+        if configuration.coalesce_requests:
+            self.single_flight = self.single_flight_class()
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
@@ -93,12 +156,105 @@ class ApiClient:
         # Set default User-Agent.
         self.user_agent = 'OpenAPI-Generator/1.0.0/python'
         self.client_side_validation = configuration.client_side_validation
+        self._request_templates = {}
+        self._deserializers = {}
+        self._response_deserializers = {}
+
+    def _create_rest_client(self, configuration):
+        """Creates the REST transport used by this client.
+
+        Clients of equal configuration snapshots share one REST client,
+        see `Configuration.freeze`.
+
+        :param configuration: .Configuration object for this client
+        :return: RESTClientObject
+        """
+        if isinstance(configuration, FrozenConfiguration):
+            return rest.RESTClientObject.shared(configuration)
+        return rest.RESTClientObject(configuration)
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        pass
+        self.close()
+
+    def close(self) -> None:
+        """Shuts down the worker pool used for concurrent requests."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    def warm_up(self, connections: Optional[int] = None) -> Dict[str, Any]:
+        """Opens connections to the API host ahead of the first request.
+
+        The connections, including their TLS handshakes, are opened in
+        advance, so that the first requests do not pay for them. Failing to connect is not an error, the requests
+        retry on their own.
+
+        :param connections: number of connections to open, defaults to
+            `pool_threads`.
+        :return: dict of warm-up stats, see `RESTClientObject.warm_up`.
+        """
+        if connections is None:
+            connections = self.pool_threads
+        return self.rest_client.warm_up(self.configuration.host, connections)
+
+    @property
+    def pool(self):
+        """Create thread pool on first request
+         avoids instantiating unused threadpool for blocking clients.
+        """
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.pool_threads,
+                thread_name_prefix="api_sdk",
+            )
+        return self._pool
+
+    @property
+    def pool_threads(self):
+        """Number of worker threads, one per pooled connection."""
+        return self.configuration.connection_pool_maxsize or 1
+
+    def imap(
+        self,
+        func: Callable[[ItemT], ResultT],
+        iterable: Iterable[ItemT],
+        max_in_flight: Optional[int] = None,
+    ) -> Iterator[ResultT]:
+        """Applies `func` to every item concurrently, yielding results in input order.
+
+        At most `max_in_flight` calls are pending at any time. The iterable is
+        consumed lazily and no new calls are submitted while the caller is
+        not pulling results, so arbitrarily long inputs use bounded memory.
+        An exception raised by `func` is re-raised at the position of the
+        item that caused it.
+
+        :param func: callable applied to every item.
+        :param iterable: items to process.
+        :param max_in_flight: maximum number of pending calls,
+            defaults to `pool_threads`.
+        :return: iterator over the results.
+        """
+        if max_in_flight is None:
+            max_in_flight = self.pool_threads
+        if max_in_flight < 1:
+            raise ApiValueError("max_in_flight must be at least 1")
+        return self.__imap(func, iterable, max_in_flight)
+
+    def __imap(self, func, iterable, max_in_flight):
+        pending = collections.deque()
+        try:
+            for item in iterable:
+                if len(pending) >= max_in_flight:
+                    yield pending.popleft().result()
+                pending.append(self.pool.submit(func, item))
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
 
     @property
     def user_agent(self):
@@ -247,6 +403,79 @@ class ApiClient:
 
         return method, url, header_params, body, post_params
 
+    def request_template(self, method, resource_path, accepts, _host=None) -> RequestTemplate:
+        """Returns the compiled template of a request without parameters.
+
+        Templates are cached per operation and host, and rebuilt when the
+        default headers or the cookie of the client change.
+
+        :param method: Method to call.
+        :param resource_path: Path to method endpoint, without path parameters.
+        :param accepts: List of media types accepted by the operation.
+        :param _host: server/host defined in the operation, if any.
+        :return: RequestTemplate
+        """
+        if _host is None or self.configuration.ignore_operation_servers:
+            _host = self.configuration.host
+        key = (method, resource_path, tuple(accepts), _host)
+        template = self._request_templates.get(key)
+        if (
+            template is None
+            or template.cookie != self.cookie
+            or template.default_headers != self.default_headers
+        ):
+            headers = {}
+            accept = self.select_header_accept(accepts)
+            if accept is not None:
+                headers['Accept'] = accept
+            method, url, headers, _, _ = self.param_serialize(
+                method, resource_path, header_params=headers, _host=_host
+            )
+            template = RequestTemplate(
+                method, url, headers, dict(self.default_headers), self.cookie
+            )
+            self._request_templates[key] = template
+        return template
+
+    def compiled_param_serialize(
+        self,
+        method,
+        resource_path,
+        query_params,
+        accepts,
+        _host=None
+    ) -> RequestSerialized:
+        """Builds the HTTP request params of an operation from its template.
+
+        Equivalent to `param_serialize` for operations without path, header,
+        form or body parameters and without authentication, but only the
+        query string is built on each call.
+
+        :param method: Method to call.
+        :param resource_path: Path to method endpoint.
+        :param query_params: Query parameters in the url, as two-tuples.
+        :param accepts: List of media types accepted by the operation.
+        :param _host: server/host defined in the operation, if any.
+        :return: tuple of form (method, url, header_params, body, post_params)
+        """
+        template = self.request_template(method, resource_path, accepts, _host)
+        url = template.url
+        if query_params:
+            parts = []
+            for k, v in query_params:
+                if type(v) is str:
+                    parts.append(k + "=" + quote(v))
+                elif type(v) is int:
+                    parts.append(k + "=" + str(v))
+                else:
+                    break
+            else:
+                return method, url + "?" + "&".join(parts), dict(template.headers), None, []
+            url += "?" + self.parameters_to_url_query(
+                self.sanitize_for_serialization(query_params), None
+            )
+        return method, url, dict(template.headers), None, []
+
 
     def call_api(
         self,
@@ -255,7 +484,8 @@ class ApiClient:
         header_params=None,
         body=None,
         post_params=None,
-        _request_timeout=None
+        _request_timeout=None,
+        _cacheable=False
     ) -> rest.RESTResponse:
         """Makes the HTTP request (synchronous)
         :param method: Method to call.
@@ -266,9 +496,26 @@ class ApiClient:
         :param post_params dict: Request post form parameters,
             for `application/x-www-form-urlencoded`, `multipart/form-data`.
         :param _request_timeout: timeout setting for this request.
+        :param _cacheable: whether the response may be served from and
+            stored in the response cache.
         :return: RESTResponse
         """
 
+        cache_key = self._cache_key(method, url, header_params, _cacheable)
+        if cache_key is not None:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return rest.RESTResponse(cached)
+            header_params = self._conditional_headers(cache_key, header_params)
+
+        if self.single_flight is not None and method in ('GET', 'HEAD'):
+            # identical requests in flight share one network call
+            response_data = self.single_flight.do(
+                self._single_flight_key(method, url, header_params),
+                lambda: self._call_api_shared(method, url, header_params, _request_timeout),
+            )
+            return self._revalidated(response_data, cache_key)
+
         try:
             # perform request and return response
             response_data = self.rest_client.request(
@@ -281,8 +528,63 @@ class ApiClient:
         except ApiException as e:
             raise e
 
+        return self._revalidated(response_data, cache_key)
+
+    def _conditional_headers(self, cache_key, header_params):
+        """Adds the validators of an expired cache entry to the headers."""
+        validators = self.response_cache.validators(cache_key)
+        if not validators:
+            return header_params
+        return {**(header_params or {}), **validators}
+
+    def _revalidated(self, response_data, cache_key):
+        """Returns the cached response confirmed by a 304 Not Modified
+        `response_data`, or `response_data` itself for any other response.
+        """
+        if cache_key is not None and response_data.status == 304:
+            response_data.read()
+            cached = self.response_cache.revalidate(cache_key, response_data)
+            if cached is not None:
+                return rest.RESTResponse(cached)
+        response_data.cache_key = cache_key
+        return response_data
+
+    def _call_api_shared(self, method, url, header_params, _request_timeout):
+        """Performs a request whose response is shared between callers.
+
+        The body is read eagerly so that every caller can read it.
+        """
+        response_data = self.rest_client.request(
+            method, url,
+            headers=header_params,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        response_data.deserialize_lock = threading.Lock()
         return response_data
 
+    def _cache_key(self, method, url, header_params, cacheable):
+        """Returns the response cache key of a request, None if not cacheable."""
+        if not cacheable or self.response_cache is None or method != 'GET':
+            return None
+        varying = []
+        for name, value in (header_params or {}).items():
+            name = name.lower()
+            if name in self.RESPONSE_VARYING_HEADERS:
+                value = str(value)
+                if name in self.CREDENTIAL_HEADERS:
+                    value = hashlib.sha256(value.encode('utf-8')).hexdigest()
+                varying.append(name + ': ' + value)
+        return (method, url, *sorted(varying))
+
+    @staticmethod
+    def _single_flight_key(method, url, header_params):
+        """Returns the key of a request, identical requests in flight share
+        one network call. Any header may change the response."""
+        if not header_params:
+            return method, url
+        return method, url, frozenset((name, str(value)) for name, value in header_params.items())
+
     def response_deserialize(
         self,
         response_data: rest.RESTResponse,
@@ -293,17 +595,29 @@ class ApiClient:
         :param response_types_map: dict of response types.
         :return: ApiResponse
         """
+        if response_data.deserialize_lock is None:
+            return self.__response_deserialize(response_data, response_types_map)
+
+        # a coalesced response is shared by several callers,
+        # deserialize it only once
+        with response_data.deserialize_lock:
+            deserialized = response_data.deserialized
+            if deserialized is None or deserialized[0] != response_types_map:
+                deserialized = response_data.deserialized = (
+                    response_types_map,
+                    self.__response_deserialize(response_data, response_types_map),
+                )
+            return deserialized[1]
 
+    def __response_deserialize(self, response_data, response_types_map):
         msg = "RESTResponse.read() must be called before passing it to response_deserialize()"
         assert response_data.data is not None, msg
 
-        response_type = response_types_map.get(str(response_data.status), None)
-        if not response_type and isinstance(response_data.status, int) and 100 <= response_data.status <= 599:
-            # if not found, look for '1XX', '2XX', etc.
-            response_type = response_types_map.get(str(response_data.status)[0] + "XX", None)
+        response_type, deserializer = self.response_deserializer(
+            response_types_map, response_data.status
+        )
 
         # deserialize response data
-        response_text = None
         return_data = None
         try:
             if response_type == "bytearray":
@@ -311,26 +625,31 @@ class ApiClient:
             elif response_type == "file":
                 return_data = self.__deserialize_file(response_data)
             elif response_type is not None:
-                match = None
+                # UTF-8 JSON is handed to json.loads as bytes, which
+                # decodes it itself; the exception decodes the body
+                # only when its `body` is accessed
                 content_type = response_data.getheader('content-type')
-                if content_type is not None:
-                    match = re.search(r"charset=([a-zA-Z\-\d]+)[\s;]?", content_type)
-                encoding = match.group(1) if match else "utf-8"
-                response_text = response_data.data.decode(encoding)
-                return_data = self.deserialize(response_text, response_type, content_type)
+                return_data = deserializer(self.__load(response_data.data, content_type))
         finally:
             if not 200 <= response_data.status <= 299:
                 raise ApiException.from_response(
                     http_resp=response_data,
-                    body=response_text,
+                    body=None,
                     data=return_data,
                 )
 
+        if response_data.cache_key is not None:
+            self.response_cache.set(
+                response_data.cache_key,
+                CachedResponse.from_response(response_data),
+            )
+
         return ApiResponse(
             status_code = response_data.status,
             data = return_data,
             headers = response_data.getheaders(),
-            raw_data = response_data.data
+            raw_data = response_data.data,
+            timings = response_data.timings
         )
 
     def sanitize_for_serialization(self, obj):
@@ -385,8 +704,9 @@ class ApiClient:
             else:
                 obj_dict = obj.__dict__
 
-        if isinstance(obj_dict, list):
+        if not isinstance(obj_dict, dict):
             # here we handle instances that can either be a list or something else, and only became a real list by calling to_dict()
+            # (or a primitive, for oneOf models of primitive types)
             return self.sanitize_for_serialization(obj_dict)
 
         return {
@@ -394,10 +714,27 @@ class ApiClient:
             for key, val in obj_dict.items()
         }
 
-    def deserialize(self, response_text: str, response_type: str, content_type: Optional[str]):
+    def pack_int64_array(self, values) -> bytes:
+        """Packs integers as little-endian signed 64-bit integers, for
+        binary request bodies.
+
+        :param values: the integers, or models holding integers.
+        :return: the packed bytes.
+        """
+        values = self.sanitize_for_serialization(values)
+        if not all(type(value) is int for value in values):
+            raise ApiValueError("Only integers can be packed as int64")
+        try:
+            return struct.pack('<%dq' % len(values), *values)
+        except struct.error as e:
+            raise ApiValueError("Integer out of int64 range: %s" % e) from None
+
+    def deserialize(self, response_text: Union[str, bytes], response_type: str, content_type: Optional[str]):
         """Deserializes response into an object.
 
-        :param response: RESTResponse object to be deserialized.
+        :param response_text: response body, as text or as the raw bytes
+            received. Raw UTF-8 JSON bodies are passed to `json.loads` as
+            they are, other charsets are decoded here.
         :param response_type: class literal for
             deserialized object, or string of class name.
         :param content_type: content type of response.
@@ -405,52 +742,92 @@ class ApiClient:
         :return: deserialized object.
         """
 
-        # fetch data from response object
+        return self.deserializer(response_type)(self.__load(response_text, content_type))
+
+    def __load(self, response_text, content_type):
+        """Parses a response body according to its content type.
+
+        :param response_text: response body, as text or raw bytes.
+        :param content_type: content type of response.
+        :return: parsed JSON data, or the body as text.
+        """
         if content_type is None:
             try:
-                data = json.loads(response_text)
+                return json.loads(response_text)
             except ValueError:
-                data = response_text
-        elif re.match(r'^application/(json|[\w!#$&.+\-^_]+\+json)\s*(;|$)', content_type, re.IGNORECASE):
-            if response_text == "":
-                data = ""
-            else:
-                data = json.loads(response_text)
-        elif re.match(r'^text\/[a-z.+-]+\s*(;|$)', content_type, re.IGNORECASE):
-            data = response_text
-        else:
-            raise ApiException(
-                status=0,
-                reason="Unsupported content type: {0}".format(content_type)
-            )
+                return self.__text(response_text, "utf-8")
+
+        kind, encoding = parse_content_type(content_type)
+        if kind == "json":
+            if isinstance(response_text, (bytes, bytearray)) and encoding.lower().replace("-", "") != "utf8":
+                response_text = response_text.decode(encoding)
+            if not response_text:
+                return ""
+            return json.loads(response_text)
+        if kind == "text":
+            return self.__text(response_text, encoding)
+        raise ApiException(
+            status=0,
+            reason="Unsupported content type: {0}".format(content_type)
+        )
 
-        return self.__deserialize(data, response_type)
+    @staticmethod
+    def __text(response_text, encoding):
+        if isinstance(response_text, (bytes, bytearray)):
+            return response_text.decode(encoding)
+        return response_text
 
-    def __deserialize(self, data, klass):
-        """Deserializes dict, list, str into an object.
+    def response_deserializer(self, response_types_map, status):
+        """Returns the response type and deserializer of a response status.
 
-        :param data: dict, list or str.
-        :param klass: class literal, or string of class name.
+        The lookup, including the fallback on '1XX', '2XX', etc., is done
+        once per operation and status.
 
-        :return: object.
+        :param response_types_map: dict of response types of the operation.
+        :param status: HTTP status code of the response.
+        :return: tuple of (response type, deserializer callable), the
+            deserializer being None when the response type is None.
         """
-        if data is None:
-            return None
+        key = (tuple(response_types_map.items()), status)
+        compiled = self._response_deserializers.get(key)
+        if compiled is None:
+            response_type = response_types_map.get(str(status), None)
+            if not response_type and isinstance(status, int) and 100 <= status <= 599:
+                # if not found, look for '1XX', '2XX', etc.
+                response_type = response_types_map.get(str(status)[0] + "XX", None)
+            deserializer = None
+            if response_type is not None and response_type not in ("bytearray", "file"):
+                deserializer = self.deserializer(response_type)
+            compiled = self._response_deserializers[key] = (response_type, deserializer)
+        return compiled
+
+    def deserializer(self, klass):
+        """Returns a callable deserializing parsed data into `klass`.
+
+        The type is resolved once, the callable then skips the class name
+        parsing and lookups of `__deserialize`.
+
+        :param klass: class literal, or string of class name.
+        :return: callable taking dict, list or str and returning the object.
+        """
+        deserializer = self._deserializers.get(klass)
+        if deserializer is None:
+            deserializer = self._deserializers[klass] = self.__compile_deserializer(klass)
+        return deserializer
 
+    def __compile_deserializer(self, klass):
         if isinstance(klass, str):
             if klass.startswith('List['):
                 m = re.match(r'List\[(.*)]', klass)
                 assert m is not None, "Malformed List type definition"
-                sub_kls = m.group(1)
-                return [self.__deserialize(sub_data, sub_kls)
-                        for sub_data in data]
+                item = self.deserializer(m.group(1))
+                return lambda data: None if data is None else [item(sub_data) for sub_data in data]
 
             if klass.startswith('Dict['):
                 m = re.match(r'Dict\[([^,]*), (.*)]', klass)
                 assert m is not None, "Malformed Dict type definition"
-                sub_kls = m.group(2)
-                return {k: self.__deserialize(v, sub_kls)
-                        for k, v in data.items()}
+                value = self.deserializer(m.group(2))
+                return lambda data: None if data is None else {k: value(v) for k, v in data.items()}
 
             # convert str to class
             if klass in self.NATIVE_TYPES_MAPPING:
@@ -459,19 +836,21 @@ class ApiClient:
                 klass = getattr(api_sdk.models, klass)
 
         if klass in self.PRIMITIVE_TYPES:
-            return self.__deserialize_primitive(data, klass)
+            func = functools.partial(self.__deserialize_primitive, klass=klass)
         elif klass == object:
-            return self.__deserialize_object(data)
+            func = self.__deserialize_object
         elif klass == datetime.date:
-            return self.__deserialize_date(data)
+            func = self.__deserialize_date
         elif klass == datetime.datetime:
-            return self.__deserialize_datetime(data)
+            func = self.__deserialize_datetime
         elif klass == decimal.Decimal:
-            return decimal.Decimal(data)
+            func = decimal.Decimal
         elif issubclass(klass, Enum):
-            return self.__deserialize_enum(data, klass)
+            func = functools.partial(self.__deserialize_enum, klass=klass)
         else:
-            return self.__deserialize_model(data, klass)
+            # models deserialize themselves
+            func = klass.from_dict
+        return lambda data: None if data is None else func(data)
 
     def parameters_to_tuples(self, params, collection_formats):
         """Get parameters as list of tuples, formatting collections.
@@ -568,6 +947,7 @@ class ApiClient:
                 continue
             else:
                 raise ValueError("Unsupported file value")
+            import mimetypes
             mimetype = (
                 mimetypes.guess_type(filename)[0]
                 or 'application/octet-stream'
@@ -697,6 +1077,7 @@ class ApiClient:
         :param response:  RESTResponse.
         :return: file path.
         """
+        import tempfile
         fd, path = tempfile.mkstemp(dir=self.configuration.temp_folder_path)
         os.close(fd)
         os.remove(path)
@@ -745,6 +1126,7 @@ class ApiClient:
         :return: date.
         """
         try:
+            from dateutil.parser import parse
             return parse(string).date()
         except ImportError:
             return string
@@ -763,6 +1145,7 @@ class ApiClient:
         :return: datetime.
         """
         try:
+            from dateutil.parser import parse
             return parse(string)
         except ImportError:
             return string
@@ -792,13 +1175,3 @@ class ApiClient:
                     .format(data, klass)
                 )
             )
-
-    def __deserialize_model(self, data, klass):
-        """Deserializes list or dict to model.
-
-        :param data: dict, list.
-        :param klass: class literal.
-        :return: model object.
-        """
-
-        return klass.from_dict(data)
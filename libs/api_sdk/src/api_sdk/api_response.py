@@ -3,6 +3,7 @@
 from __future__ import annotations
 from typing import Optional, Generic, Mapping, TypeVar
 from pydantic import Field, StrictInt, StrictBytes, BaseModel
+from api_sdk.timings import RequestTimings
 
 T = TypeVar("T")
 
@@ -15,6 +16,7 @@ class ApiResponse(BaseModel, Generic[T]):
     headers: Optional[Mapping[str, str]] = Field(None, description="HTTP headers")
     data: T = Field(description="Deserialized data given the data type")
     raw_data: StrictBytes = Field(description="Raw data (HTTP response body)")
+    timings: Optional[RequestTimings] = Field(None, description="Latency breakdown of the HTTP request, None for cached responses")
 
     model_config = {
         "arbitrary_types_allowed": True
@@ -0,0 +1,191 @@
+# coding: utf-8
+
+"""
+    Unix Timestamp Converter API
+
+    An API to convert between Unix timestamps and human-readable date strings
+
+    The version of the OpenAPI document: 1.0.0
+
+    asyncio flavour of the generic API client.
+"""  # noqa: E501
+
+
+import asyncio
+import collections
+import threading
+
+from api_sdk.api_client import ApiClient
+from api_sdk import async_rest
+from api_sdk.exceptions import ApiException, ApiValueError
+from api_sdk.singleflight import AsyncSingleFlight
+
+
+async def _aiterate(iterable):
+    """Iterates over a synchronous or asynchronous iterable."""
+    if hasattr(iterable, "__aiter__"):
+        async for item in iterable:
+            yield item
+    else:
+        for item in iterable:
+            yield item
+
+
+class AsyncApiClient(ApiClient):
+    """asyncio API client.
+
+    Shares request serialization (`param_serialize`) and response
+    deserialization (`response_deserialize`) with `ApiClient`, only the
+    transport differs: `call_api` is a coroutine backed by
+    `async_rest.AsyncRESTClientObject`, so one event loop can keep many
+    requests in flight without a thread per request.
+
+    :param configuration: .Configuration object for this client
+    :param header_name: a header to pass when making calls to the API.
+    :param header_value: a header value to pass when making calls to
+        the API.
+    :param cookie: a cookie to include in the header when making calls
+        to the API
+    """
+
+    _default = None
+    single_flight_class = AsyncSingleFlight
+
+    def _create_rest_client(self, configuration):
+        return async_rest.AsyncRESTClientObject(configuration)
+
+    def __enter__(self):
+        raise TypeError("Use 'async with AsyncApiClient()' instead of 'with', close() is a coroutine")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Closes all pooled connections."""
+        await self.rest_client.close()
+
+    @classmethod
+    def get_default(cls):
+        """Return new instance of AsyncApiClient.
+
+        :return: The AsyncApiClient object.
+        """
+        if cls._default is None:
+            cls._default = AsyncApiClient()
+        return cls._default
+
+    def imap(self, func, iterable, max_in_flight=None):
+        """Awaits `func` for every item concurrently, yielding results in input order.
+
+        Asynchronous counterpart of `ApiClient.imap`: at most
+        `max_in_flight` coroutines run at the same time and the (a)sync
+        iterable is consumed lazily.
+
+        :param func: coroutine function applied to every item.
+        :param iterable: items to process, sync or async iterable.
+        :param max_in_flight: maximum number of pending calls,
+            defaults to `pool_threads`.
+        :return: async iterator over the results.
+        """
+        if max_in_flight is None:
+            max_in_flight = self.pool_threads
+        if max_in_flight < 1:
+            raise ApiValueError("max_in_flight must be at least 1")
+        return self.__imap(func, iterable, max_in_flight)
+
+    async def __imap(self, func, iterable, max_in_flight):
+        pending = collections.deque()
+        try:
+            async for item in _aiterate(iterable):
+                if len(pending) >= max_in_flight:
+                    yield await pending.popleft()
+                pending.append(asyncio.ensure_future(func(item)))
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def call_api(
+        self,
+        method,
+        url,
+        header_params=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+        _cacheable=False
+    ) -> async_rest.AsyncRESTResponse:
+        """Makes the HTTP request (asynchronous)
+        :param method: Method to call.
+        :param url: Path to method endpoint.
+        :param header_params: Header parameters to be
+            placed in the request header.
+        :param body: Request body.
+        :param post_params dict: Request post form parameters,
+            for `application/x-www-form-urlencoded`, `multipart/form-data`.
+        :param _request_timeout: timeout setting for this request.
+        :param _cacheable: whether the response may be served from and
+            stored in the response cache.
+        :return: AsyncRESTResponse
+        """
+
+        cache_key = self._cache_key(method, url, header_params, _cacheable)
+        if cache_key is not None:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                response_data = async_rest.AsyncRESTResponse(cached)
+                response_data.data = cached.data
+                return response_data
+            header_params = self._conditional_headers(cache_key, header_params)
+
+        if self.single_flight is not None and method in ('GET', 'HEAD'):
+            # identical requests in flight share one network call
+            response_data = await self.single_flight.do(
+                self._single_flight_key(method, url, header_params),
+                lambda: self._call_api_shared(method, url, header_params, _request_timeout),
+            )
+            return await self._revalidated_async(response_data, cache_key)
+
+        try:
+            # perform request and return response
+            response_data = await self.rest_client.request(
+                method, url,
+                headers=header_params,
+                body=body, post_params=post_params,
+                _request_timeout=_request_timeout
+            )
+
+        except ApiException as e:
+            raise e
+
+        return await self._revalidated_async(response_data, cache_key)
+
+    async def _revalidated_async(self, response_data, cache_key):
+        """Asynchronous `ApiClient._revalidated`."""
+        if cache_key is not None and response_data.status == 304:
+            await response_data.read()
+            cached = self.response_cache.revalidate(cache_key, response_data)
+            if cached is not None:
+                response_data = async_rest.AsyncRESTResponse(cached)
+                response_data.data = cached.data
+                return response_data
+        response_data.cache_key = cache_key
+        return response_data
+
+    async def _call_api_shared(self, method, url, header_params, _request_timeout):
+        """Performs a request whose response is shared between callers.
+
+        The body is read eagerly so that every caller can read it.
+        """
+        response_data = await self.rest_client.request(
+            method, url,
+            headers=header_params,
+            _request_timeout=_request_timeout
+        )
+        await response_data.read()
+        response_data.deserialize_lock = threading.Lock()
+        return response_data
@@ -0,0 +1,552 @@
+# coding: utf-8
+
+"""
+    Unix Timestamp Converter API
+
+    An API to convert between Unix timestamps and human-readable date strings
+
+    The version of the OpenAPI document: 1.0.0
+
+    asyncio-native HTTP/1.1 transport for the API client.
+"""  # noqa: E501
+
+
+import asyncio
+import collections
+import io
+import json
+import re
+import ssl
+import weakref
+from urllib.parse import urlencode, urlsplit
+
+import urllib3
+from urllib3.filepost import encode_multipart_formdata
+
+from api_sdk.exceptions import ApiException, ApiValueError
+from api_sdk.ratelimit import RateLimiter
+from api_sdk.timings import RequestTimings, clock
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+NO_BODY_STATUSES = {204, 304}
+# urllib3's defaults, used by the synchronous transport
+DEFAULT_RETRIES = urllib3.util.Retry.DEFAULT.total
+IDEMPOTENT_METHODS = urllib3.util.Retry.DEFAULT_ALLOWED_METHODS
+MAX_LINE_SIZE = 65536
+
+
+class _StaleConnectionError(ConnectionError):
+    """The server closed or reset the connection before sending a response byte."""
+
+
+class AsyncHTTPResponse:
+    """HTTP response read from an asyncio stream.
+
+    Mirrors the subset of `urllib3.HTTPResponse` used by the API client:
+    `status`, `reason`, `headers` and `data`. The body is read on the first
+    call to `read()`, after which the connection is handed back to its pool.
+    A response released or garbage collected before its body was read
+    closes its connection instead, so its pool slot is not lost. Use the
+    responses of `*_without_preload_content` calls as async context
+    managers to release them without relying on the garbage collector.
+    """
+
+    def __init__(self, status, reason, headers, connection, pool, method, read_timeout=None) -> None:
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self._connection = connection
+        self._pool = pool
+        self._method = method
+        self._read_timeout = read_timeout
+        self._body = None
+        self._finalizer = weakref.finalize(self, pool.discard_threadsafe, connection)
+        self._finalizer.atexit = False
+
+    @property
+    def data(self):
+        return self._body
+
+    async def read(self):
+        if self._body is None:
+            try:
+                self._body = await asyncio.wait_for(
+                    self._connection.read_body(self._method, self.status, self.headers),
+                    self._read_timeout,
+                )
+            except BaseException:
+                self.release_conn(reusable=False)
+                raise
+            self.release_conn()
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.release_conn()
+
+    def release_conn(self, reusable=True) -> None:
+        if self._connection is None:
+            return
+        connection, self._connection = self._connection, None
+        self._finalizer.detach()
+        self._pool.release(connection, reusable and self._body is not None)
+
+
+class _Connection:
+    """A single HTTP/1.1 connection made of an asyncio reader/writer pair."""
+
+    def __init__(self, reader, writer) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.keep_alive = True
+        self.requests = 0
+
+    @property
+    def is_open(self) -> bool:
+        return (
+            self.keep_alive
+            and not self.reader.at_eof()
+            and not self.writer.is_closing()
+        )
+
+    async def send(self, method, target, headers, body) -> None:
+        lines = ["%s %s HTTP/1.1" % (method, target)]
+        lines.extend("%s: %s" % (k, v) for k, v in headers.items())
+        head = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+        try:
+            self.writer.write(head + body if body else head)
+            await self.writer.drain()
+        except (BrokenPipeError, ConnectionResetError) as e:
+            raise _StaleConnectionError(str(e)) from e
+        self.requests += 1
+
+    async def read_head(self, read_timeout):
+        """Reads the status line and headers of the final response.
+
+        Raises `_StaleConnectionError` if the connection hit EOF or was reset
+        before the first byte of a response, so the request was not answered.
+        """
+        answered = False
+        while True:
+            try:
+                line = await self._readline(read_timeout)
+            except ConnectionResetError as e:
+                if answered:
+                    raise
+                raise _StaleConnectionError(str(e)) from e
+            if not line:
+                if answered:
+                    raise ConnectionError("connection closed by peer")
+                raise _StaleConnectionError("connection closed by peer")
+            answered = True
+            try:
+                version, status, *reason = line.decode("latin-1").rstrip("\r\n").split(" ", 2)
+                status = int(status)
+            except ValueError:
+                raise ApiException(status=0, reason="Malformed status line: %r" % line)
+
+            headers = urllib3.HTTPHeaderDict()
+            while True:
+                line = await self._readline(read_timeout)
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers.add(name.strip(), value.strip())
+
+            # interim responses carry no body, wait for the final one
+            if 100 <= status < 200 and status != 101:
+                continue
+
+            connection_header = headers.get("Connection", "").lower()
+            if version == "HTTP/1.0":
+                self.keep_alive = connection_header == "keep-alive"
+            else:
+                self.keep_alive = connection_header != "close"
+            return status, reason[0] if reason else "", headers
+
+    async def read_body(self, method, status, headers) -> bytes:
+        if method == "HEAD" or status in NO_BODY_STATUSES:
+            return b""
+
+        if "chunked" in headers.get("Transfer-Encoding", "").lower():
+            chunks = []
+            while True:
+                size_line = await self.reader.readline()
+                size = int(size_line.split(b";", 1)[0].strip() or b"0", 16)
+                if size == 0:
+                    # skip trailers
+                    while (await self.reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    return b"".join(chunks)
+                chunks.append(await self.reader.readexactly(size))
+                await self.reader.readexactly(2)
+
+        content_length = headers.get("Content-Length")
+        if content_length is not None:
+            return await self.reader.readexactly(int(content_length))
+
+        # body delimited by connection close
+        self.keep_alive = False
+        return await self.reader.read()
+
+    async def _readline(self, read_timeout) -> bytes:
+        if read_timeout is None:
+            line = await self.reader.readline()
+        else:
+            line = await asyncio.wait_for(self.reader.readline(), read_timeout)
+        if len(line) > MAX_LINE_SIZE:
+            raise ApiException(status=0, reason="HTTP header line too long")
+        return line
+
+    def close(self) -> None:
+        self.keep_alive = False
+        self.writer.close()
+
+
+class AsyncConnectionPool:
+    """Keep-alive connection pool for a single scheme/host/port.
+
+    At most `maxsize` connections are checked out at the same time, further
+    requests wait for a connection to be released.
+    """
+
+    def __init__(self, scheme, host, port, ssl_context, server_hostname, maxsize) -> None:
+        self.loop = asyncio.get_running_loop()
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.ssl_context = ssl_context
+        self.server_hostname = server_hostname
+        self.maxsize = maxsize
+        self._idle = collections.deque()
+        self._slots = asyncio.Semaphore(maxsize)
+        self.num_connections = 0
+
+    async def acquire(self, connect_timeout=None, timings=None):
+        """Returns an open connection, reusing an idle one when possible.
+
+        :param timings: RequestTimings receiving the checkout and connect
+            times, the latter including the TLS handshake.
+        """
+        await self._slots.acquire()
+        try:
+            if timings is not None:
+                timings.checkout = clock()
+                timings.connect_start = timings.connect_end = None
+            while self._idle:
+                connection = self._idle.pop()
+                if connection.is_open:
+                    return connection
+                connection.close()
+            if timings is not None:
+                timings.connect_start = clock()
+            connection = await self._connect(connect_timeout)
+            if timings is not None:
+                timings.connect_end = clock()
+            return connection
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, connection, reusable=True) -> None:
+        if reusable and connection.is_open:
+            self._idle.append(connection)
+        else:
+            connection.close()
+        self._slots.release()
+
+    def discard_threadsafe(self, connection) -> None:
+        """Closes a connection whose response was garbage collected unread.
+
+        The garbage collector may run in any thread, so the connection is
+        released on the pool's event loop.
+        """
+        try:
+            self.loop.call_soon_threadsafe(self.release, connection, False)
+        except RuntimeError:
+            # the event loop is closed, its connections with it
+            pass
+
+    async def _connect(self, connect_timeout):
+        kwargs = {}
+        if self.ssl_context is not None:
+            kwargs["ssl"] = self.ssl_context
+            kwargs["server_hostname"] = self.server_hostname or self.host
+        coro = asyncio.open_connection(self.host, self.port, **kwargs)
+        if connect_timeout is not None:
+            reader, writer = await asyncio.wait_for(coro, connect_timeout)
+        else:
+            reader, writer = await coro
+        self.num_connections += 1
+        return _Connection(reader, writer)
+
+    def close(self) -> None:
+        while self._idle:
+            self._idle.pop().close()
+
+
+class AsyncRESTResponse(io.IOBase):
+
+    def __init__(self, resp, timings=None) -> None:
+        self.response = resp
+        self.status = resp.status
+        self.reason = resp.reason
+        self.data = None
+        self.cache_key = None
+        self.deserialize_lock = None
+        self.deserialized = None
+        self.timings = timings
+
+    async def read(self):
+        if self.data is None:
+            self.data = await self.response.read()
+            if self.timings is not None:
+                self.timings.end = clock()
+        return self.data
+
+    def getheaders(self):
+        """Returns a dictionary of the response headers."""
+        return self.response.headers
+
+    def getheader(self, name, default=None):
+        """Returns a given response header."""
+        return self.response.headers.get(name, default)
+
+
+class AsyncRESTClientObject:
+    """asyncio counterpart of `api_sdk.rest.RESTClientObject`.
+
+    Speaks HTTP/1.1 directly over `asyncio` streams and keeps one
+    keep-alive pool per origin, so a single event loop can have up to
+    `configuration.connection_pool_maxsize` requests in flight per host.
+
+    Of the client-side resilience settings only the rate limiter applies.
+    Hedging, the adaptive concurrency limiter, the circuit breaker,
+    response compression, HTTP/2, the DNS cache and TLS session resumption
+    are features of the synchronous transport and are ignored here.
+    """
+
+    def __init__(self, configuration) -> None:
+        if configuration.proxy:
+            raise ApiValueError("Proxies are not supported by the asyncio transport.")
+        if configuration.retries is None:
+            self.retries = DEFAULT_RETRIES
+        elif isinstance(configuration.retries, int):
+            self.retries = max(configuration.retries, 0)
+        else:
+            raise ApiValueError("The asyncio transport only supports a number of retries.")
+
+        self.ssl_context = None
+        self.server_hostname = configuration.tls_server_name
+        self.maxsize = configuration.connection_pool_maxsize or 1
+        self.pools = {}
+        self.rate_limiter = RateLimiter.from_configuration(configuration)
+
+        self._configuration = configuration
+
+    def _create_ssl_context(self):
+        configuration = self._configuration
+        context = ssl.create_default_context(
+            cafile=configuration.ssl_ca_cert,
+            cadata=configuration.ca_cert_data,
+        )
+        if configuration.cert_file:
+            context.load_cert_chain(configuration.cert_file, keyfile=configuration.key_file)
+        if not configuration.verify_ssl:
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        elif configuration.assert_hostname is False:
+            context.check_hostname = False
+        return context
+
+    def _get_pool(self, scheme, host, port):
+        key = (scheme, host, port)
+        pool = self.pools.get(key)
+        # connections cannot outlive the event loop that opened them
+        if pool is not None and pool.loop is not asyncio.get_running_loop():
+            pool.close()
+            pool = None
+        if pool is None:
+            ssl_context = None
+            if scheme == "https":
+                if self.ssl_context is None:
+                    self.ssl_context = self._create_ssl_context()
+                ssl_context = self.ssl_context
+            pool = AsyncConnectionPool(
+                scheme, host, port, ssl_context, self.server_hostname, self.maxsize
+            )
+            self.pools[key] = pool
+        return pool
+
+    async def close(self) -> None:
+        for pool in self.pools.values():
+            pool.close()
+        self.pools.clear()
+
+    def _encode_body(self, method, headers, body, post_params):
+        if method not in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
+            return None
+
+        # no content type provided or payload is json
+        content_type = headers.get('Content-Type')
+        if not content_type or re.search('json', content_type, re.IGNORECASE):
+            if body is None:
+                return None
+            return json.dumps(body).encode("utf-8")
+        elif content_type == 'application/x-www-form-urlencoded':
+            return urlencode(post_params).encode("utf-8")
+        elif content_type == 'multipart/form-data':
+            # Ensures that dict objects are serialized
+            post_params = [(a, json.dumps(b)) if isinstance(b, dict) else (a, b) for a, b in post_params]
+            request_body, headers['Content-Type'] = encode_multipart_formdata(post_params)
+            return request_body
+        # Pass a `string` parameter directly in the body to support
+        # other content types than JSON when `body` argument is
+        # provided in serialized form.
+        elif isinstance(body, str):
+            return body.encode("utf-8")
+        elif isinstance(body, bytes):
+            return body
+        elif content_type.startswith('text/') and isinstance(body, bool):
+            return b"true" if body else b"false"
+        # Cannot generate the request from given parameters
+        msg = """Cannot prepare a request message for provided
+                 arguments. Please check that your arguments match
+                 declared content type."""
+        raise ApiException(status=0, reason=msg)
+
+    async def request(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ):
+        """Perform requests.
+
+        :param method: http request method
+        :param url: http request url
+        :param headers: http request headers
+        :param body: request json body, for `application/json`
+        :param post_params: request post parameters,
+                            `application/x-www-form-urlencoded`
+                            and `multipart/form-data`
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        """
+        method = method.upper()
+        assert method in [
+            'GET',
+            'HEAD',
+            'DELETE',
+            'POST',
+            'PUT',
+            'PATCH',
+            'OPTIONS'
+        ]
+
+        if post_params and body:
+            raise ApiValueError(
+                "body parameter cannot be used with post_params parameter."
+            )
+
+        post_params = post_params or {}
+        headers = dict(headers or {})
+
+        total_timeout = connect_timeout = read_timeout = None
+        if _request_timeout:
+            if isinstance(_request_timeout, (int, float)):
+                total_timeout = _request_timeout
+            elif (
+                    isinstance(_request_timeout, tuple)
+                    and len(_request_timeout) == 2
+                ):
+                connect_timeout, read_timeout = _request_timeout
+
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in DEFAULT_PORTS:
+            raise ApiValueError("Unsupported URL scheme: %s" % url)
+        host = parts.hostname
+        port = parts.port or DEFAULT_PORTS[scheme]
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+
+        request_body = self._encode_body(method, headers, body, post_params)
+        request_headers = {
+            "Host": parts.netloc.rpartition("@")[2],
+        }
+        request_headers.update(headers)
+        if request_body is not None:
+            request_headers["Content-Length"] = str(len(request_body))
+
+        timings = RequestTimings()
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async()
+
+        pool = self._get_pool(scheme, host, port)
+        try:
+            async with asyncio.timeout(total_timeout):
+                response = await self._send(
+                    pool, method, target, request_headers, request_body,
+                    connect_timeout, read_timeout or total_timeout, timings
+                )
+        except ssl.SSLError as e:
+            msg = "\n".join([type(e).__name__, str(e)])
+            raise ApiException(status=0, reason=msg)
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.observe(response.status, response.headers)
+
+        return AsyncRESTResponse(response, timings)
+
+    async def _send(self, pool, method, target, headers, body, connect_timeout, read_timeout, timings=None):
+        # like urllib3, failed connection attempts are retried `retries`
+        # times, and so are idempotent requests whose connection failed after
+        # they were sent. A reused keep-alive connection may have been closed
+        # by the server in the meantime: if it hit EOF or a reset before any
+        # response byte, an idempotent request is sent again once on a fresh
+        # connection without counting as a retry. Timeouts are never retried,
+        # the server may still be processing the request.
+        retries = self.retries
+        resent_stale = False
+        while True:
+            try:
+                connection = await pool.acquire(connect_timeout, timings)
+            except ssl.SSLError:
+                raise
+            except OSError:
+                if retries <= 0:
+                    raise
+                retries -= 1
+                continue
+            reused = connection.requests > 0
+            try:
+                await connection.send(method, target, headers, body)
+                status, reason, response_headers = await connection.read_head(read_timeout)
+                if timings is not None:
+                    timings.first_byte = clock()
+            except ConnectionError as e:
+                pool.release(connection, reusable=False)
+                if method not in IDEMPOTENT_METHODS:
+                    raise
+                if reused and not resent_stale and isinstance(e, _StaleConnectionError):
+                    resent_stale = True
+                    continue
+                if retries > 0:
+                    retries -= 1
+                    continue
+                raise
+            except BaseException:
+                pool.release(connection, reusable=False)
+                raise
+            return AsyncHTTPResponse(
+                status, reason, response_headers, connection, pool, method, read_timeout
+            )
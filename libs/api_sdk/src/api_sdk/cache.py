@@ -0,0 +1,324 @@
+# coding: utf-8
+
+"""
+    Unix Timestamp Converter API
+
+    An API to convert between Unix timestamps and human-readable date strings
+
+    The version of the OpenAPI document: 1.0.0
+
+    Client-side response caches, in memory and persisted in sqlite.
+"""  # noqa: E501
+
+
+import collections
+import json
+import sqlite3
+import threading
+import time
+
+import urllib3
+
+
+class CachedResponse:
+    """Snapshot of a read HTTP response.
+
+    Exposes the `status`, `reason`, `headers` and `data` attributes of
+    `urllib3.HTTPResponse`, so it can be wrapped in a `rest.RESTResponse`
+    like a response coming from the network.
+    """
+
+    __slots__ = ("status", "reason", "headers", "data")
+
+    def __init__(self, status, reason, headers, data) -> None:
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.data = data
+
+    @classmethod
+    def from_response(cls, response):
+        """Snapshots a RESTResponse whose body has already been read."""
+        return cls(
+            response.status,
+            response.reason,
+            response.getheaders(),
+            response.data,
+        )
+
+
+class ResponseCache:
+    """Thread-safe LRU cache of responses with optional time-to-live.
+
+    :param maxsize: maximum number of cached responses, the least recently
+        used entry is evicted when the cache is full.
+    :param ttl: seconds an entry stays valid, None to keep entries until
+        they are evicted.
+    :param clock: monotonic time source, in seconds.
+    """
+
+    def __init__(self, maxsize=1024, ttl=None, clock=time.monotonic) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key):
+        """Returns the cached response for `key`, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, response = entry
+            if expires_at is not None and expires_at <= self._clock():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return response
+
+    def set(self, key, response) -> None:
+        """Stores `response` under `key`, evicting the oldest entry if full."""
+        expires_at = None if self.ttl is None else self._clock() + self.ttl
+        with self._lock:
+            self._entries[key] = (expires_at, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def validators(self, key):
+        """Returns the headers making a request for `key` conditional.
+
+        Expired entries are dropped right away, so there is nothing to
+        revalidate.
+        """
+        return {}
+
+    def revalidate(self, key, response):
+        """Refreshes the entry of `key` after a 304 Not Modified `response`.
+
+        :return: the refreshed CachedResponse, None if there is no entry.
+        """
+        return None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def stats(self):
+        """Cache counters as a dict."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+class PersistentResponseCache:
+    """Response cache stored in a sqlite database, surviving the process.
+
+    Same interface as `ResponseCache`. Expired entries carrying an `ETag`
+    or `Last-Modified` header are kept, so the next request for them can
+    be sent conditionally and a 304 Not Modified answer refreshes them.
+    Processes using the same file share the cache.
+
+    :param path: database file, created if it does not exist.
+    :param maxsize: maximum number of cached responses.
+    :param ttl: seconds an entry stays fresh, None to never revalidate.
+    :param max_bytes: maximum total size of the cached bodies, None for no
+        limit. The least recently used entries are evicted first.
+    :param clock: wall clock time source, in seconds, as the entries
+        outlive the process.
+    """
+
+    def __init__(self, path, maxsize=1024, ttl=None, max_bytes=None, clock=time.time) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.path = path
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        # the cache can be rebuilt, durability is not worth an fsync per write
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " status INTEGER NOT NULL,"
+            " reason TEXT,"
+            " headers TEXT NOT NULL,"
+            " data BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " expires_at REAL,"
+            " revalidate INTEGER NOT NULL,"
+            " used_at REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_used_at ON responses (used_at)")
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.revalidations = 0
+
+    @staticmethod
+    def _key(key):
+        return key if isinstance(key, str) else " ".join(key)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def get(self, key):
+        """Returns the fresh cached response for `key`, or None."""
+        key = self._key(key)
+        now = self._clock()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT status, reason, headers, data, expires_at, revalidate"
+                " FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            status, reason, headers, data, expires_at, revalidate = row
+            if expires_at is not None and expires_at <= now:
+                self.misses += 1
+                if not revalidate:
+                    self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self.expirations += 1
+                return None
+            self._db.execute("UPDATE responses SET used_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+        return CachedResponse(status, reason, self._load_headers(headers), data)
+
+    def set(self, key, response) -> None:
+        """Stores `response` under `key`, evicting entries beyond the bounds."""
+        headers = response.headers
+        revalidate = "ETag" in headers or "Last-Modified" in headers
+        self._store(self._key(key), response.status, response.reason, headers, response.data, revalidate)
+
+    def validators(self, key):
+        """Returns the `If-None-Match` and `If-Modified-Since` headers for
+        the expired entry of `key`, an empty dict if there is none.
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT headers FROM responses WHERE key = ? AND revalidate",
+                (self._key(key),),
+            ).fetchone()
+        if row is None:
+            return {}
+        headers = self._load_headers(row[0])
+        conditional = {}
+        if "ETag" in headers:
+            conditional["If-None-Match"] = headers["ETag"]
+        if "Last-Modified" in headers:
+            conditional["If-Modified-Since"] = headers["Last-Modified"]
+        return conditional
+
+    def revalidate(self, key, response):
+        """Refreshes the entry of `key` after a 304 Not Modified `response`.
+
+        The headers of the 304 response replace the stored ones, as they
+        may carry a new `ETag`, `Date` or caching directives.
+
+        :return: the refreshed CachedResponse, None if there is no entry.
+        """
+        key = self._key(key)
+        with self._lock:
+            row = self._db.execute(
+                "SELECT status, reason, headers, data FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        status, reason, headers, data = row
+        headers = self._load_headers(headers)
+        for name, value in response.getheaders().items():
+            # these describe the empty body of the 304 response
+            if name.lower() not in ("content-length", "content-encoding", "transfer-encoding"):
+                headers[name] = value
+        self._store(key, status, reason, headers, data, True)
+        with self._lock:
+            self.revalidations += 1
+        return CachedResponse(status, reason, headers, data)
+
+    def _store(self, key, status, reason, headers, data, revalidate) -> None:
+        now = self._clock()
+        expires_at = None if self.ttl is None else now + self.ttl
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, status, reason, json.dumps(list(headers.items())), data, len(data),
+                 expires_at, revalidate, now),
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        """Deletes the least recently used entries beyond the size bounds."""
+        count, size = self._db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        victims = []
+        if count > self.maxsize or (self.max_bytes is not None and size > self.max_bytes):
+            for key, entry_size in self._db.execute(
+                "SELECT key, size FROM responses ORDER BY used_at"
+            ).fetchall():
+                if count <= self.maxsize and (self.max_bytes is None or size <= self.max_bytes):
+                    break
+                victims.append((key,))
+                count -= 1
+                size -= entry_size
+        self._db.executemany("DELETE FROM responses WHERE key = ?", victims)
+        self.evictions += len(victims)
+
+    @staticmethod
+    def _load_headers(headers):
+        return urllib3.HTTPHeaderDict(json.loads(headers))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    @property
+    def stats(self):
+        """Cache counters as a dict."""
+        with self._lock:
+            count, size = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            return {
+                "size": count,
+                "bytes": size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "revalidations": self.revalidations,
+            }
@@ -0,0 +1,132 @@
+# coding: utf-8
+
+"""
+    Unix Timestamp Converter API
+
+    An API to convert between Unix timestamps and human-readable date strings
+
+    The version of the OpenAPI document: 1.0.0
+
+    Circuit breaker failing fast while the upstream is unhealthy.
+"""  # noqa: E501
+
+
+import threading
+import time
+
+from api_sdk.exceptions import CircuitOpenException
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stops sending requests after consecutive failures.
+
+    The circuit opens after `failure_threshold` consecutive failures and
+    every request then fails fast with `CircuitOpenException`. After
+    `reset_timeout` seconds it is half-open: up to `half_open_max_calls`
+    probe requests are let through, and the first probe result closes the
+    circuit again on success or reopens it on failure.
+
+    :param failure_threshold: consecutive failures opening the circuit.
+    :param reset_timeout: seconds the circuit stays open before probing.
+    :param half_open_max_calls: probe requests allowed while half-open.
+    :param clock: monotonic clock, in seconds.
+    """
+
+    def __init__(
+        self,
+        failure_threshold=5,
+        reset_timeout=30.0,
+        half_open_max_calls=1,
+        clock=time.monotonic,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if half_open_max_calls < 1:
+            raise ValueError("half_open_max_calls must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self.rejected = 0
+        self.opened = 0
+
+    @classmethod
+    def from_configuration(cls, configuration):
+        """Creates the breaker described by a Configuration, None if disabled."""
+        if not configuration.circuit_breaker_failures:
+            return None
+        return cls(
+            failure_threshold=configuration.circuit_breaker_failures,
+            reset_timeout=configuration.circuit_breaker_reset_timeout,
+        )
+
+    @property
+    def state(self) -> str:
+        """One of "closed", "open" and "half_open"."""
+        with self._lock:
+            if self._state == OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                return HALF_OPEN
+            return self._state
+
+    def before_request(self) -> None:
+        """Admits a request.
+
+        :raises CircuitOpenException: if the circuit is open, or half-open
+            with all probes already in flight.
+        """
+        with self._lock:
+            if self._state == CLOSED:
+                return
+            remaining = self.reset_timeout - (self._clock() - self._opened_at)
+            if self._state == OPEN and remaining <= 0:
+                self._state = HALF_OPEN
+                self._probes = 0
+            if self._state == HALF_OPEN and self._probes < self.half_open_max_calls:
+                self._probes += 1
+                return
+            self.rejected += 1
+        raise CircuitOpenException(
+            status=0,
+            reason="Circuit breaker open, retry in %.1fs" % max(0.0, remaining),
+        )
+
+    def record(self, success) -> None:
+        """Feeds back the outcome of an admitted request.
+
+        :param success: False for a transport error or a 5xx response,
+            None if the request was abandoned without an outcome.
+        """
+        with self._lock:
+            if success is None:
+                if self._state == HALF_OPEN and self._probes:
+                    self._probes -= 1
+                return
+            if success:
+                self._failures = 0
+                if self._state == HALF_OPEN:
+                    self._state = CLOSED
+                return
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    self.opened += 1
+                self._state = OPEN
+                self._opened_at = self._clock()
+
+    @property
+    def stats(self):
+        """Breaker counters as a dict."""
+        return {
+            "state": self.state,
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
@@ -0,0 +1,144 @@
+# coding: utf-8
+
+"""
+    Unix Timestamp Converter API
+
+    An API to convert between Unix timestamps and human-readable date strings
+
+    The version of the OpenAPI document: 1.0.0
+
+    Adaptive limit on the number of requests in flight.
+"""  # noqa: E501
+
+
+import threading
+
+from api_sdk.ratelimit import THROTTLED_STATUSES
+
+
+def is_congestion_status(status) -> bool:
+    """Whether a response status signals an overloaded upstream."""
+    return status in THROTTLED_STATUSES or status >= 500
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD limit on the number of concurrent requests.
+
+    Requests beyond the current limit wait for a slot. The limit grows by
+    one per limit's worth of successful requests while it is fully used
+    (additive increase) and is multiplied by `backoff` on congestion
+    (multiplicative decrease). Congestion is a throttling or 5xx response,
+    a transport error, or a response time above `tolerance` times the
+    smoothed response time, the gradient signal that the upstream starts
+    queueing. The gradient only counts for responses slower than
+    `latency_floor` and once `min_samples` response times were observed
+    since the start or the last decrease, so that the jitter of fast
+    responses and a burst of slow ones do not read as queueing.
+
+    :param initial_limit: limit before any response was observed.
+    :param min_limit: lower bound of the limit.
+    :param max_limit: upper bound of the limit.
+    :param backoff: factor applied to the limit on congestion, in (0, 1).
+    :param tolerance: response time, relative to the smoothed response
+        time, above which a response counts as congestion.
+    :param smoothing: weight of a new sample in the smoothed response time.
+    :param latency_floor: response time in seconds below which a response
+        never counts as congestion.
+    :param min_samples: response times observed before a slow response may
+        decrease the limit.
+    """
+
+    def __init__(
+        self,
+        initial_limit=4,
+        min_limit=1,
+        max_limit=64,
+        backoff=0.75,
+        tolerance=2.0,
+        smoothing=0.05,
+        latency_floor=0.05,
+        min_samples=10,
+    ) -> None:
+        if min_limit < 1:
+            raise ValueError("min_limit must be at least 1")
+        if max_limit < min_limit:
+            raise ValueError("max_limit must not be below min_limit")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be between 0 and 1")
+        if tolerance <= 1:
+            raise ValueError("tolerance must be above 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self.latency_floor = latency_floor
+        self.min_samples = min_samples
+        self._limit = float(min(max_limit, max(min_limit, initial_limit)))
+        self._condition = threading.Condition()
+        self._latency = None
+        self._samples = 0
+        self.in_flight = 0
+        self.congested = 0
+
+    @classmethod
+    def from_configuration(cls, configuration):
+        """Creates the limiter described by a Configuration, None if disabled."""
+        if not configuration.adaptive_concurrency:
+            return None
+        max_limit = configuration.adaptive_concurrency_max
+        if max_limit is None:
+            max_limit = configuration.connection_pool_maxsize or 1
+        return cls(initial_limit=min(4, max_limit), max_limit=max_limit)
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    def acquire(self) -> None:
+        """Blocks until a request may be sent and counts it as in flight."""
+        with self._condition:
+            while self.in_flight >= int(self._limit):
+                self._condition.wait()
+            self.in_flight += 1
+
+    def release(self, latency=None, congested=False) -> None:
+        """Counts a request as done and adapts the limit to its outcome.
+
+        :param latency: response time in seconds, None if unknown.
+        :param congested: whether the response signals an overloaded
+            upstream, e.g. a 429 or 503 response or a timeout.
+        """
+        with self._condition:
+            utilized = self.in_flight >= int(self._limit)
+            self.in_flight -= 1
+            if latency is not None and not congested:
+                if self._latency is None:
+                    self._latency = latency
+                congested = (
+                    self._samples >= self.min_samples
+                    and latency > self.latency_floor
+                    and latency > self.tolerance * self._latency
+                )
+                self._samples += 1
+                # a lasting slowdown becomes the new normal after a while
+                self._latency += self.smoothing * (latency - self._latency)
+            if congested:
+                self.congested += 1
+                self._samples = 0
+                self._limit = max(self.min_limit, self._limit * self.backoff)
+            elif utilized:
+                self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+            self._condition.notify_all()
+
+    @property
+    def stats(self):
+        """Limiter counters as a dict."""
+        with self._condition:
+            return {
+                "limit": int(self._limit),
+                "in_flight": self.in_flight,
+                "congested": self.congested,
+                "latency": self._latency,
+            }
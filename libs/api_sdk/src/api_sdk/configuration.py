@@ -16,13 +16,16 @@ import copy
 import http.client as httplib
 import logging
 from logging import FileHandler
-import multiprocessing
+import os
 import sys
+from types import MappingProxyType
 from typing import Any, ClassVar, Dict, List, Literal, Optional, TypedDict, Union
 from typing_extensions import NotRequired, Self
 
 import urllib3
 
+from api_sdk.exceptions import ApiAttributeError
+
 
 JSON_SCHEMA_VALIDATION_KEYWORDS = {
     'multipleOf', 'maximum', 'exclusiveMaximum',
@@ -278,13 +281,40 @@ class Configuration:
            Set this to the SNI value expected by the server.
         """
 
-        self.connection_pool_maxsize = multiprocessing.cpu_count() * 5
+        self.connection_pool_maxsize = (os.cpu_count() or 1) * 5
         """urllib3 connection pool's maximum number of connections saved
            per pool. urllib3 uses 1 connection as default value, but this is
            not the best value when you are making a lot of possibly parallel
            requests to the same host, which is often the case here.
            cpu_count * 5 is used as default value to increase performance.
         """
+        self.tls_session_resumption = False
+        """Resume the TLS session of an earlier connection when opening a new
+           one, which only needs an abbreviated handshake.
+           Not supported by the asyncio transport of AsyncApiClient.
+        """
+        self.dns_cache = False
+        """Resolve host names once per `connections.DNSCache.ttl` for all
+           clients with this setting, instead of for every new connection.
+           Not supported by the asyncio transport of AsyncApiClient.
+        """
+        self.http2 = False
+        """Send requests over HTTP/2, multiplexing concurrent requests over
+           one connection per host instead of one connection each. Requires
+           the h2 package of the `http2` extra; proxies and `retries` are
+           not supported.
+           Not supported by the asyncio transport of AsyncApiClient.
+        """
+        self.response_compression = False
+        """Ask for compressed responses with an `Accept-Encoding` header and
+           decompress them while reading the body.
+           Not supported by the asyncio transport of AsyncApiClient.
+        """
+        self.response_encodings: Optional[List[str]] = None
+        """Content codings offered, in order of preference. None offers all
+           that urllib3 can decode: gzip and deflate, plus br and zstd when
+           the optional brotli and zstd packages are installed.
+        """
 
         self.proxy: Optional[str] = None
         """Proxy URL
@@ -297,9 +327,14 @@ class Configuration:
         """
         self.retries = retries
         """Adding retries to override urllib3 default value 3
+           The asyncio transport of AsyncApiClient retries the same way, but
+           only takes a number, not a urllib3 Retry.
         """
-        # Enable client side validation
         self.client_side_validation = True
+        """Validate the arguments of API operations with pydantic.
+           Set this to False to trust the caller and skip the per-call
+           validation on hot paths.
+        """
 
         self.socket_options = None
         """Options to pass down to the underlying urllib3 socket
@@ -313,6 +348,86 @@ class Configuration:
         """date format
         """
 
+        self.response_cache_maxsize: Optional[int] = None
+        """Maximum number of responses kept in the client-side response
+           cache. The cache is disabled when set to None.
+           Only successful GET requests of operations called with the
+           `cached` parameter are cached, keyed by method and request URL.
+        """
+        self.response_cache_ttl: Optional[float] = None
+        """Seconds a cached response stays valid, None for no expiry.
+        """
+        self.response_cache_file: Optional[str] = None
+        """Path of a sqlite database persisting the response cache across
+           processes and runs, None to keep it in memory. Expired responses
+           with an `ETag` or `Last-Modified` header are revalidated with a
+           conditional request instead of being fetched again.
+        """
+        self.response_cache_max_bytes: Optional[int] = None
+        """Maximum total size of the bodies in the persistent response
+           cache, None for no limit besides `response_cache_maxsize`.
+        """
+
+        self.coalesce_requests = False
+        """Share one network call between concurrent identical GET requests
+           (same method and URL) instead of sending each of them.
+        """
+
+        self.rate_limit: Optional[float] = None
+        """Maximum number of requests per second sent by the REST client,
+           enforced by a token bucket. Rate limiting is disabled when set
+           to None.
+        """
+        self.rate_limit_burst: int = 1
+        """Token bucket capacity, i.e. requests that may be sent back to
+           back before `rate_limit` applies.
+        """
+        self.rate_limit_file: Optional[str] = None
+        """Path of a file holding the token bucket state. All processes
+           using the same path share one budget, e.g. pytest-xdist workers.
+           When set to None the budget is kept in memory per REST client:
+           every ApiClient has its own, except that clients of equal frozen
+           configurations share one client and therefore one budget.
+        """
+        self.rate_limit_adaptive = False
+        """Slow down on 429 responses and honor their `Retry-After` header.
+        """
+
+        self.hedge_requests = False
+        """Send a duplicate of GET and HEAD requests that are slow to answer
+           and use whichever response arrives first.
+           Not supported by the asyncio transport of AsyncApiClient.
+        """
+        self.hedge_delay: Optional[float] = None
+        """Seconds to wait before hedging a request, None to wait for the
+           `hedge_percentile` of the observed response times.
+        """
+        self.hedge_percentile = 0.9
+        """Response time percentile used as hedging delay.
+        """
+        self.hedge_budget = 0.1
+        """Hedges allowed per request, on average, bounding the extra load.
+        """
+
+        self.adaptive_concurrency = False
+        """Adapt the number of requests in flight to the observed response
+           times and throttling responses (AIMD), queueing the others.
+           Not supported by the asyncio transport of AsyncApiClient.
+        """
+        self.adaptive_concurrency_max: Optional[int] = None
+        """Upper bound of the adaptive concurrency limit, defaults to
+           `connection_pool_maxsize`.
+        """
+        self.circuit_breaker_failures: Optional[int] = None
+        """Consecutive failed requests (transport errors and 5xx responses)
+           after which requests fail fast with `CircuitOpenException`. The
+           circuit breaker is disabled when set to None.
+           Not supported by the asyncio transport of AsyncApiClient.
+        """
+        self.circuit_breaker_reset_timeout = 30.0
+        """Seconds before an open circuit lets a probe request through.
+        """
+
     def __deepcopy__(self, memo:  Dict[int, Any]) -> Self:
         cls = self.__class__
         result = cls.__new__(cls)
@@ -330,6 +445,18 @@ class Configuration:
     def __setattr__(self, name: str, value: Any) -> None:
         object.__setattr__(self, name, value)
 
+    def freeze(self) -> "FrozenConfiguration":
+        """Returns an immutable snapshot of this configuration.
+
+        The snapshot is hashable, compares equal to snapshots of identical
+        configurations and pickles without its loggers, so it can be shared
+        between API clients, threads and processes. API clients created from
+        equal snapshots share one connection pool.
+
+        :return: FrozenConfiguration
+        """
+        return FrozenConfiguration._from_state(self.__dict__)
+
     @classmethod
     def set_default(cls, default: Optional[Self]) -> None:
         """Set default instance of configuration.
@@ -570,3 +697,107 @@ class Configuration:
         """Fix base path."""
         self._base_path = value
         self.server_index = None
+
+
+def _freeze_value(value: Any) -> Any:
+    if isinstance(value, (dict, MappingProxyType)):
+        return MappingProxyType({k: _freeze_value(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_value(v) for v in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+def _thaw_value(value: Any) -> Any:
+    if isinstance(value, MappingProxyType):
+        return {k: _thaw_value(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return tuple(_thaw_value(v) for v in value)
+    return value
+
+
+def _hash_key(value: Any) -> Any:
+    if isinstance(value, MappingProxyType):
+        return frozenset((k, _hash_key(v)) for k, v in value.items())
+    if isinstance(value, tuple):
+        return tuple(_hash_key(v) for v in value)
+    return value
+
+
+def _restore_frozen_configuration(cls: Any, state: Dict[str, Any]) -> "FrozenConfiguration":
+    return cls._from_state(state)
+
+
+class FrozenConfiguration(Configuration):
+    """Immutable snapshot of a Configuration, see `Configuration.freeze`.
+
+    Dicts and lists of the configuration are stored as read-only mappings
+    and tuples, and assigning any attribute raises ApiAttributeError. The
+    logging setup of the original configuration (loggers, formatter and
+    handlers) stays with it: snapshots only record the logging settings.
+    """
+
+    # excluded from equality, hashing and pickling
+    _PROCESS_LOCAL = frozenset((
+        "logger",
+        "logger_formatter",
+        "logger_stream_handler",
+        "logger_file_handler",
+    ))
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("Use Configuration.freeze() to create a FrozenConfiguration")
+
+    @classmethod
+    def _from_state(cls, state: Dict[str, Any]) -> "FrozenConfiguration":
+        self = cls.__new__(cls)
+        values = {
+            k: _freeze_value(v) for k, v in state.items() if k not in cls._PROCESS_LOCAL
+        }
+        object.__setattr__(self, "__dict__", values)
+        object.__setattr__(self, "_key", tuple(sorted(
+            (k, _hash_key(v)) for k, v in values.items()
+        )))
+        object.__setattr__(self, "_hash", hash(self._key))
+        return self
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise ApiAttributeError(
+            "FrozenConfiguration is immutable, cannot set {0}".format(name)
+        )
+
+    def __delattr__(self, name: str) -> None:
+        raise ApiAttributeError(
+            "FrozenConfiguration is immutable, cannot delete {0}".format(name)
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        # process-local logging attributes are not part of the snapshot
+        if name in FrozenConfiguration._PROCESS_LOCAL:
+            return None
+        raise AttributeError(name)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FrozenConfiguration):
+            return NotImplemented
+        return self._key == other._key
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self) -> Any:
+        state = {
+            k: _thaw_value(v) for k, v in self.__dict__.items()
+            if k not in ("_key", "_hash")
+        }
+        return _restore_frozen_configuration, (self.__class__, state)
+
+    def __copy__(self) -> Self:
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Self:
+        return self
+
+    def freeze(self) -> "FrozenConfiguration":
+        return self
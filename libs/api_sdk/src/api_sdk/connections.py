@@ -0,0 +1,152 @@
+# coding: utf-8
+
+"""
+    Unix Timestamp Converter API
+
+    An API to convert between Unix timestamps and human-readable date strings
+
+    The version of the OpenAPI document: 1.0.0
+
+    DNS and TLS session caches shared by the pooled connections.
+"""  # noqa: E501
+
+
+import ipaddress
+import socket
+import ssl
+import threading
+import time
+
+from urllib3.util.ssl_ import create_urllib3_context
+
+
+class DNSCache:
+    """Caches host name resolutions so that new connections skip the lookup.
+
+    :param ttl: seconds a resolution is reused.
+    :param clock: monotonic clock, in seconds.
+    """
+
+    def __init__(self, ttl=300.0, clock=time.monotonic) -> None:
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._addresses = {}
+
+    def resolve(self, host, port):
+        """Returns the addresses to connect to for `host`.
+
+        :return: tuple of IP addresses in the order to try them, None for IP
+            literals and names that cannot be resolved, which the connection
+            then resolves itself.
+        """
+        try:
+            ipaddress.ip_address(host.strip("[]"))
+            return None
+        except ValueError:
+            pass
+        now = self._clock()
+        with self._lock:
+            entry = self._addresses.get((host, port))
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        try:
+            infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        except OSError:
+            return None
+        addresses = tuple(dict.fromkeys(info[4][0] for info in infos))
+        with self._lock:
+            self._addresses[host, port] = (now + self.ttl, addresses)
+        return addresses
+
+    def forget(self, host, port) -> None:
+        """Drops the resolution of `host`, e.g. after failing to connect."""
+        with self._lock:
+            self._addresses.pop((host, port), None)
+
+
+# shared by the clients with `Configuration.dns_cache`
+dns_cache = DNSCache()
+
+
+class SessionCachingSSLContext(ssl.SSLContext):
+    """SSL context resuming the TLS session of an earlier connection.
+
+    New connections to a host offer the last session saved for it, so that
+    reconnects only need an abbreviated handshake. Configured by urllib3,
+    except that session tickets are enabled.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        self._init_sessions()
+
+    def _init_sessions(self) -> None:
+        self._sessions = {}
+        self._sessions_lock = threading.Lock()
+        self.handshakes = 0
+        self.resumed = 0
+
+    @classmethod
+    def create(cls, cert_reqs, load_default_certs=True):
+        """Creates a client context.
+
+        :param cert_reqs: ssl.CERT_REQUIRED or ssl.CERT_NONE.
+        :param load_default_certs: whether to trust the system CAs.
+        """
+        context = create_urllib3_context(cert_reqs=cert_reqs)
+        # the context urllib3 set up is adopted as is
+        context.__class__ = cls
+        context._init_sessions()
+        context.options &= ~ssl.OP_NO_TICKET
+        # urllib3 only loads them into the contexts it creates itself
+        if load_default_certs:
+            context.load_default_certs()
+        return context
+
+    def wrap_socket(
+        self,
+        sock,
+        server_side=False,
+        do_handshake_on_connect=True,
+        suppress_ragged_eofs=True,
+        server_hostname=None,
+        session=None,
+    ):
+        if session is None and server_hostname is not None:
+            with self._sessions_lock:
+                session = self._sessions.get(server_hostname)
+        ssl_sock = super().wrap_socket(
+            sock,
+            server_side=server_side,
+            do_handshake_on_connect=do_handshake_on_connect,
+            suppress_ragged_eofs=suppress_ragged_eofs,
+            server_hostname=server_hostname,
+            session=session,
+        )
+        if do_handshake_on_connect:
+            with self._sessions_lock:
+                self.handshakes += 1
+                self.resumed += ssl_sock.session_reused
+            self.save_session(ssl_sock)
+        return ssl_sock
+
+    def save_session(self, ssl_sock) -> None:
+        """Remembers the session of a connection for its host.
+
+        TLS 1.3 servers send the session ticket after the handshake, so it
+        is saved again once a response was read.
+        """
+        session = ssl_sock.session
+        host = ssl_sock.server_hostname
+        if session is None or host is None:
+            return
+        with self._sessions_lock:
+            current = self._sessions.get(host)
+            if current is None or session.has_ticket or not current.has_ticket:
+                self._sessions[host] = session
+
+    @property
+    def stats(self):
+        """TLS handshake counters as a dict."""
+        with self._sessions_lock:
+            return {"handshakes": self.handshakes, "resumed": self.resumed}
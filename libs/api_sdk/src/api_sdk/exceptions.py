@@ -124,12 +124,26 @@ class ApiException(OpenApiException):
             if self.reason is None:
                 self.reason = http_resp.reason
             if self.body is None:
-                try:
-                    self.body = http_resp.data.decode('utf-8')
-                except Exception:
-                    pass
+                # decoded on first access of `body`
+                self._raw_body = http_resp.data
             self.headers = http_resp.getheaders()
 
+    @property
+    def body(self):
+        """Response body as text, decoded from the raw response when needed."""
+        if self._body is None and self._raw_body is not None:
+            try:
+                self._body = self._raw_body.decode('utf-8')
+            except Exception:
+                pass
+            self._raw_body = None
+        return self._body
+
+    @body.setter
+    def body(self, value):
+        self._body = value
+        self._raw_body = None
+
     @classmethod
     def from_response(
         cls, 
@@ -205,6 +219,11 @@ class UnprocessableEntityException(ApiException):
     pass
 
 
+class CircuitOpenException(ApiException):
+    """Exception for requests refused by an open circuit breaker."""
+    pass
+
+
 def render_path(path_to_item):
     """Returns a string representation of a path"""
     result = ""
@@ -0,0 +1,134 @@
+# coding: utf-8
+
+"""
+    Unix Timestamp Converter API
+
+    An API to convert between Unix timestamps and human-readable date strings
+
+    The version of the OpenAPI document: 1.0.0
+
+    Request hedging policy for idempotent requests.
+"""  # noqa: E501
+
+
+import collections
+import threading
+
+
+class HedgingPolicy:
+    """Decides when a slow idempotent request gets a duplicate.
+
+    A duplicate ("hedge") of a request is sent when no response arrived
+    after `delay` seconds, or by default after the `percentile` of the
+    recently observed response times. Hedges are paid from a budget that
+    grows by `budget` for every request, so on average at most `budget`
+    extra requests are sent per request.
+
+    :param delay: fixed hedging delay in seconds, None to use the observed
+        `percentile` of response times.
+    :param percentile: response time percentile used as delay, in (0, 1).
+    :param budget: hedges allowed per request, on average.
+    :param max_tokens: largest burst of hedges the budget can save up.
+    :param window: number of recent response times kept.
+    :param min_samples: response times needed before hedging with an
+        observed delay.
+    """
+
+    def __init__(
+        self,
+        delay=None,
+        percentile=0.9,
+        budget=0.1,
+        max_tokens=10,
+        window=256,
+        min_samples=20,
+    ) -> None:
+        if delay is not None and delay < 0:
+            raise ValueError("delay must not be negative")
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        if budget < 0:
+            raise ValueError("budget must not be negative")
+        self.fixed_delay = delay
+        self.percentile = percentile
+        self.budget = budget
+        self.max_tokens = max_tokens
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+        self._latencies = collections.deque(maxlen=window)
+        self._observed_delay = None
+        self._stale = 0
+        self._tokens = 0.0
+        self.requests = 0
+        self.hedges_sent = 0
+        self.hedges_won = 0
+
+    @classmethod
+    def from_configuration(cls, configuration):
+        """Creates the policy described by a Configuration, None if disabled."""
+        if not configuration.hedge_requests:
+            return None
+        return cls(
+            delay=configuration.hedge_delay,
+            percentile=configuration.hedge_percentile,
+            budget=configuration.hedge_budget,
+        )
+
+    def delay(self):
+        """Counts a new request and returns its hedging delay.
+
+        :return: seconds to wait before hedging, None to not hedge.
+        """
+        with self._lock:
+            self.requests += 1
+            self._tokens = min(self.max_tokens, self._tokens + self.budget)
+            if self.fixed_delay is not None:
+                return self.fixed_delay
+            # re-sort the window every few samples rather than every request
+            if self._stale >= 16 or (self._observed_delay is None and self._stale):
+                self._stale = 0
+                if len(self._latencies) >= self.min_samples:
+                    latencies = sorted(self._latencies)
+                    self._observed_delay = latencies[int(self.percentile * (len(latencies) - 1))]
+            return self._observed_delay
+
+    def observe(self, latency) -> None:
+        """Records the response time of a request or hedge, in seconds."""
+        with self._lock:
+            self._latencies.append(latency)
+            self._stale += 1
+
+    def try_hedge(self, admit=None) -> bool:
+        """Takes a hedge from the budget.
+
+        :param admit: optional callable granting the hedge, e.g. a rate
+            limiter; the budget is refunded when it returns False.
+        :return: True if the hedge may be sent.
+        """
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+        if admit is not None and not admit():
+            with self._lock:
+                self._tokens = min(self.max_tokens, self._tokens + 1)
+            return False
+        with self._lock:
+            self.hedges_sent += 1
+        return True
+
+    def won(self) -> None:
+        """Records that a hedge answered before the original request."""
+        with self._lock:
+            self.hedges_won += 1
+
+    @property
+    def stats(self):
+        """Hedging counters as a dict."""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "hedges_sent": self.hedges_sent,
+                "hedges_won": self.hedges_won,
+                "delay": self.fixed_delay if self.fixed_delay is not None else self._observed_delay,
+            }
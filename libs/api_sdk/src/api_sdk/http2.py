@@ -0,0 +1,410 @@
+# coding: utf-8
+
+"""
+    Unix Timestamp Converter API
+
+    An API to convert between Unix timestamps and human-readable date strings
+
+    The version of the OpenAPI document: 1.0.0
+
+    HTTP/2 transport multiplexing concurrent requests over one connection.
+"""  # noqa: E501
+
+
+import http
+import io
+import socket
+import ssl
+import threading
+from urllib.parse import urlencode
+
+import urllib3
+from urllib3.exceptions import NewConnectionError, ProtocolError, ReadTimeoutError, SSLError
+from urllib3.filepost import encode_multipart_formdata
+
+from api_sdk.exceptions import ApiValueError
+from api_sdk.rest import Transport
+from api_sdk.timings import RequestTimings, clock
+
+# connection-specific headers are not allowed in HTTP/2 (RFC 9113, 8.2.2)
+CONNECTION_HEADERS = frozenset(("connection", "host", "keep-alive", "proxy-connection", "transfer-encoding", "upgrade"))
+URL_ENCODED_METHODS = frozenset(("GET", "HEAD", "DELETE", "OPTIONS"))
+
+
+def _import_h2():
+    try:
+        import h2.config
+        import h2.connection
+        import h2.errors
+        import h2.events
+        import h2.exceptions
+    except ImportError as e:
+        raise ApiValueError(
+            "Configuration.http2 requires the h2 package, install the "
+            "http2 extra of the SDK: `pip install 'api-sdk[http2]'`."
+        ) from e
+    return h2
+
+
+def _seconds(value):
+    """Returns a urllib3 timeout value in seconds, None for no timeout."""
+    return value if isinstance(value, (int, float)) else None
+
+
+class _Stream:
+    """One request in flight on a multiplexed connection.
+
+    It stands in for the connection of the urllib3 response built from it,
+    which is where `RESTClientObject` looks for the request timings.
+    """
+
+    __slots__ = ("timings", "status", "headers", "chunks", "done", "error")
+
+    def __init__(self, timings) -> None:
+        self.timings = timings
+        self.status = None
+        self.headers = urllib3.HTTPHeaderDict()
+        self.chunks = []
+        self.done = threading.Event()
+        self.error = None
+
+    def close(self) -> None:
+        pass
+
+
+class _Connection:
+    """HTTP/2 client connection shared by all threads.
+
+    Requests are sent from the calling threads, responses are read by a
+    background thread which completes the streams waiting for them.
+
+    :param sock: connected socket, TLS-wrapped for https.
+    """
+
+    def __init__(self, sock, h2) -> None:
+        self._h2 = h2
+        self._sock = sock
+        # guards the protocol state and socket writes; waited on for stream
+        # slots and flow control window
+        self._condition = threading.Condition()
+        self._conn = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=True, header_encoding=None)
+        )
+        self._streams = {}
+        self.closed = False
+        self._conn.initiate_connection()
+        self._flush()
+        self._reader = threading.Thread(target=self._read_loop, name="api_sdk_h2", daemon=True)
+        self._reader.start()
+
+    def _flush(self) -> None:
+        data = self._conn.data_to_send()
+        if data:
+            self._sock.sendall(data)
+
+    def request(self, method, scheme, authority, path, headers, body, timeout, timings):
+        """Sends a request and waits for the complete response.
+
+        :return: the completed _Stream.
+        """
+        h2_headers = [
+            (":method", method),
+            (":scheme", scheme),
+            (":authority", authority),
+            (":path", path),
+        ]
+        h2_headers.extend(
+            (name.lower(), str(value))
+            for name, value in headers.items()
+            if name.lower() not in CONNECTION_HEADERS
+        )
+        stream = _Stream(timings)
+        with self._condition:
+            while (
+                not self.closed
+                and self._conn.open_outbound_streams >= self._conn.remote_settings.max_concurrent_streams
+            ):
+                self._condition.wait()
+            if self.closed:
+                raise ProtocolError("HTTP/2 connection closed")
+            stream_id = self._conn.get_next_available_stream_id()
+            self._streams[stream_id] = stream
+            self._conn.send_headers(stream_id, h2_headers, end_stream=not body)
+            self._flush()
+        if body:
+            self._send_body(stream_id, body)
+
+        if not stream.done.wait(timeout):
+            with self._condition:
+                if self._streams.pop(stream_id, None) is not None and not self.closed:
+                    self._conn.reset_stream(stream_id, self._h2.errors.ErrorCodes.CANCEL)
+                    self._flush()
+            raise ReadTimeoutError(None, path, "Read timed out.")
+        if stream.error is not None:
+            raise stream.error
+        return stream
+
+    def _send_body(self, stream_id, body) -> None:
+        """Sends a request body within the flow control window."""
+        offset = 0
+        while offset < len(body):
+            with self._condition:
+                while True:
+                    if self.closed or stream_id not in self._streams:
+                        # the response, an error or a reset ended the stream
+                        return
+                    window = self._conn.local_flow_control_window(stream_id)
+                    if window > 0:
+                        break
+                    self._condition.wait()
+                size = min(window, self._conn.max_outbound_frame_size, len(body) - offset)
+                self._conn.send_data(
+                    stream_id, body[offset:offset + size], end_stream=offset + size == len(body)
+                )
+                self._flush()
+            offset += size
+
+    def _read_loop(self) -> None:
+        try:
+            while True:
+                data = self._sock.recv(65536)
+                if not data:
+                    raise ProtocolError("HTTP/2 connection closed by the server")
+                with self._condition:
+                    for event in self._conn.receive_data(data):
+                        self._handle(event)
+                    self._flush()
+                    self._condition.notify_all()
+        except Exception as e:
+            if not isinstance(e, urllib3.exceptions.HTTPError):
+                e = ProtocolError("HTTP/2 connection failed", e)
+            self._fail(e)
+
+    def _handle(self, event) -> None:
+        events = self._h2.events
+        if isinstance(event, events.ResponseReceived):
+            stream = self._streams.get(event.stream_id)
+            if stream is None:
+                return
+            stream.timings.first_byte = clock()
+            for name, value in event.headers:
+                if name == b":status":
+                    stream.status = int(value)
+                else:
+                    stream.headers.add(name.decode("latin-1"), value.decode("latin-1"))
+        elif isinstance(event, events.DataReceived):
+            stream = self._streams.get(event.stream_id)
+            if stream is not None:
+                stream.chunks.append(event.data)
+            self._conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+        elif isinstance(event, events.StreamEnded):
+            stream = self._streams.pop(event.stream_id, None)
+            if stream is not None:
+                stream.done.set()
+        elif isinstance(event, events.StreamReset):
+            stream = self._streams.pop(event.stream_id, None)
+            if stream is not None:
+                stream.error = ProtocolError("HTTP/2 stream reset by the server: %r" % event.error_code)
+                stream.done.set()
+        elif isinstance(event, events.ConnectionTerminated):
+            raise ProtocolError("HTTP/2 connection terminated by the server: %r" % event.error_code)
+
+    def _fail(self, error) -> None:
+        """Fails every request in flight and marks the connection closed."""
+        with self._condition:
+            self.closed = True
+            for stream in self._streams.values():
+                stream.error = error
+                stream.done.set()
+            self._streams.clear()
+            self._condition.notify_all()
+        self._sock.close()
+
+    def close(self) -> None:
+        with self._condition:
+            if self.closed:
+                return
+            self.closed = True
+            try:
+                self._conn.close_connection()
+                self._flush()
+            except OSError:
+                pass
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._reader.join()
+
+
+class HTTP2Transport(Transport):
+    """Sends requests over HTTP/2, one multiplexed connection per origin.
+
+    Concurrent requests share the connection as separate streams, up to
+    the concurrency the server allows, instead of opening one connection
+    each. Plain http origins are spoken to with prior knowledge (h2c),
+    https origins must negotiate h2 through ALPN. Proxies are not
+    supported.
+
+    :param configuration: .Configuration object, for the TLS settings.
+    """
+
+    def __init__(self, configuration) -> None:
+        self._h2 = _import_h2()
+        if configuration.proxy:
+            raise ApiValueError("The HTTP/2 transport does not support proxies.")
+        self._configuration = configuration
+        self._ssl_context = None
+        self._lock = threading.Lock()
+        self._connections = {}
+
+    def _create_ssl_context(self):
+        configuration = self._configuration
+        context = ssl.create_default_context(
+            cafile=configuration.ssl_ca_cert, cadata=configuration.ca_cert_data
+        )
+        if not configuration.verify_ssl:
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        elif configuration.assert_hostname is False:
+            context.check_hostname = False
+        if configuration.cert_file:
+            context.load_cert_chain(configuration.cert_file, configuration.key_file)
+        context.set_alpn_protocols(["h2"])
+        return context
+
+    def _connect(self, scheme, host, port, timeout, timings):
+        timings.connect_start = clock()
+        try:
+            sock = socket.create_connection((host, port), timeout=timeout)
+        except OSError as e:
+            raise NewConnectionError(None, "Failed to establish a new connection: %s" % e) from e
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if scheme == "https":
+            timings.tcp_connected = clock()
+            if self._ssl_context is None:
+                self._ssl_context = self._create_ssl_context()
+            try:
+                sock = self._ssl_context.wrap_socket(
+                    sock, server_hostname=self._configuration.tls_server_name or host
+                )
+            except ssl.SSLError as e:
+                sock.close()
+                raise SSLError(e) from e
+            if sock.selected_alpn_protocol() != "h2":
+                sock.close()
+                raise ProtocolError("%s:%s does not support HTTP/2" % (host, port))
+        # the reader thread blocks until data arrives
+        sock.settimeout(None)
+        connection = _Connection(sock, self._h2)
+        timings.connect_end = clock()
+        return connection
+
+    def _connection(self, scheme, host, port, timeout, timings):
+        with self._lock:
+            connection = self._connections.get((scheme, host, port))
+            if connection is None or connection.closed:
+                # connecting under the lock makes concurrent first requests
+                # share the new connection
+                connection = self._connections[scheme, host, port] = self._connect(
+                    scheme, host, port, timeout, timings
+                )
+            return connection
+
+    def request(
+        self,
+        method,
+        url,
+        body=None,
+        fields=None,
+        encode_multipart=True,
+        timeout=None,
+        headers=None,
+        preload_content=True,
+    ):
+        timings = RequestTimings()
+        # there is no connection to check out, the request may go right away
+        timings.checkout = timings.start
+        headers = dict(headers or {})
+        if fields:
+            if method in URL_ENCODED_METHODS:
+                url += ("&" if "?" in url else "?") + urlencode(fields)
+            elif encode_multipart:
+                body, headers["Content-Type"] = encode_multipart_formdata(fields)
+            else:
+                body = urlencode(fields)
+                headers["Content-Type"] = "application/x-www-form-urlencoded"
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+
+        parsed = urllib3.util.parse_url(url)
+        scheme = parsed.scheme or "http"
+        port = parsed.port or (443 if scheme == "https" else 80)
+        authority = parsed.netloc
+        path = parsed.request_uri
+
+        if not isinstance(timeout, urllib3.Timeout):
+            timeout = urllib3.Timeout(total=timeout)
+        # a total timeout is shared by connecting and reading
+        timeout = timeout.clone()
+        timeout.start_connect()
+        connection = self._connection(
+            scheme, parsed.host, port, _seconds(timeout.connect_timeout), timings
+        )
+        read_timeout = _seconds(timeout.read_timeout)
+        stream = connection.request(
+            method, scheme, authority, path, headers, body, read_timeout, timings
+        )
+        try:
+            reason = http.HTTPStatus(stream.status).phrase
+        except ValueError:
+            reason = None
+        return urllib3.HTTPResponse(
+            body=io.BytesIO(b"".join(stream.chunks)),
+            headers=stream.headers,
+            status=stream.status,
+            reason=reason,
+            preload_content=preload_content,
+            request_method=method,
+            request_url=url,
+            connection=stream,
+        )
+
+    def warm_up(self, url, connections):
+        """Opens the connection to the host of `url`.
+
+        All requests share it, so `connections` is ignored.
+        """
+        start = clock()
+        parsed = urllib3.util.parse_url(url)
+        scheme = parsed.scheme or "http"
+        port = parsed.port or (443 if scheme == "https" else 80)
+        with self._lock:
+            connection = self._connections.get((scheme, parsed.host, port))
+            warm = connection is not None and not connection.closed
+        failed = False
+        if not warm:
+            try:
+                self._connection(scheme, parsed.host, port, None, RequestTimings())
+            except Exception:
+                failed = True
+        return {
+            "host": parsed.host,
+            "opened": int(not warm and not failed),
+            "failed": int(failed),
+            "seconds": clock() - start,
+            "connections": self.connections,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+        for connection in connections:
+            connection.close()
+
+    @property
+    def connections(self) -> int:
+        """Number of open connections."""
+        with self._lock:
+            return sum(not c.closed for c in self._connections.values())
@@ -21,6 +21,10 @@ from pydantic import StrictStr, Field
 from typing import Union, List, Set, Optional, Dict
 from typing_extensions import Literal, Self
 
+from pydantic import model_validator
+from api_sdk.one_of import construct_one_of, one_of_from_json
+
+CONVERTTIMESTAMP200RESPONSE_ONE_OF_VALIDATORS = { int: "oneof_schema_1_validator", str: "oneof_schema_2_validator", bool: "oneof_schema_3_validator" }
 CONVERTTIMESTAMP200RESPONSE_ONE_OF_SCHEMAS = ["bool", "int", "str"]
 
 class ConvertTimestamp200Response(BaseModel):
@@ -52,8 +56,19 @@ class ConvertTimestamp200Response(BaseModel):
         else:
             super().__init__(**kwargs)
 
+    @model_validator(mode='before')
+    @classmethod
+    def wrap_bare_value(cls, data: Any) -> Any:
+        """Accepts a bare value of a oneOf type, e.g. as an item of a list argument"""
+        if type(data) in CONVERTTIMESTAMP200RESPONSE_ONE_OF_VALIDATORS:
+            return {"actual_instance": data}
+        return data
+
     @field_validator('actual_instance')
     def actual_instance_must_validate_oneof(cls, v):
+        if type(v) in CONVERTTIMESTAMP200RESPONSE_ONE_OF_VALIDATORS:
+            # exactly one strict branch accepts a value of this exact type
+            return v
         instance = ConvertTimestamp200Response.model_construct()
         error_messages = []
         match = 0
@@ -86,11 +101,22 @@ class ConvertTimestamp200Response(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: Union[str, Dict[str, Any]]) -> Self:
-        return cls.from_json(json.dumps(obj))
+        instance = construct_one_of(cls, obj, CONVERTTIMESTAMP200RESPONSE_ONE_OF_VALIDATORS)
+        if instance is not None:
+            return instance
+        return cls._from_json_each_schema(json.dumps(obj))
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Returns the object represented by the json string"""
+        instance = one_of_from_json(cls, json_str, CONVERTTIMESTAMP200RESPONSE_ONE_OF_VALIDATORS)
+        if instance is not None:
+            return instance
+        return cls._from_json_each_schema(json_str)
+
+    @classmethod
+    def _from_json_each_schema(cls, json_str: str) -> Self:
+        """Tries every oneOf schema in turn, reporting all mismatches"""
         instance = cls.model_construct()
         error_messages = []
         match = 0
@@ -21,6 +21,10 @@ from pydantic import StrictStr, Field
 from typing import Union, List, Set, Optional, Dict
 from typing_extensions import Literal, Self
 
+from pydantic import model_validator
+from api_sdk.one_of import construct_one_of, one_of_from_json
+
+CONVERTTIMESTAMPSPARAMETER_ONE_OF_VALIDATORS = { int: "oneof_schema_1_validator", str: "oneof_schema_2_validator" }
 CONVERTTIMESTAMPSPARAMETER_ONE_OF_SCHEMAS = ["int", "str"]
 
 class ConvertTimestampSParameter(BaseModel):
@@ -50,8 +54,19 @@ class ConvertTimestampSParameter(BaseModel):
         else:
             super().__init__(**kwargs)
 
+    @model_validator(mode='before')
+    @classmethod
+    def wrap_bare_value(cls, data: Any) -> Any:
+        """Accepts a bare value of a oneOf type, e.g. as an item of a list argument"""
+        if type(data) in CONVERTTIMESTAMPSPARAMETER_ONE_OF_VALIDATORS:
+            return {"actual_instance": data}
+        return data
+
     @field_validator('actual_instance')
     def actual_instance_must_validate_oneof(cls, v):
+        if type(v) in CONVERTTIMESTAMPSPARAMETER_ONE_OF_VALIDATORS:
+            # exactly one strict branch accepts a value of this exact type
+            return v
         instance = ConvertTimestampSParameter.model_construct()
         error_messages = []
         match = 0
@@ -78,11 +93,22 @@ class ConvertTimestampSParameter(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: Union[str, Dict[str, Any]]) -> Self:
-        return cls.from_json(json.dumps(obj))
+        instance = construct_one_of(cls, obj, CONVERTTIMESTAMPSPARAMETER_ONE_OF_VALIDATORS)
+        if instance is not None:
+            return instance
+        return cls._from_json_each_schema(json.dumps(obj))
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Returns the object represented by the json string"""
+        instance = one_of_from_json(cls, json_str, CONVERTTIMESTAMPSPARAMETER_ONE_OF_VALIDATORS)
+        if instance is not None:
+            return instance
+        return cls._from_json_each_schema(json_str)
+
+    @classmethod
+    def _from_json_each_schema(cls, json_str: str) -> Self:
+        """Tries every oneOf schema in turn, reporting all mismatches"""
         instance = cls.model_construct()
         error_messages = []
         match = 0
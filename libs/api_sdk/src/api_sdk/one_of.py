@@ -0,0 +1,81 @@
+# coding: utf-8
+
+"""
+    Unix Timestamp Converter API
+
+    An API to convert between Unix timestamps and human-readable date strings
+
+    The version of the OpenAPI document: 1.0.0
+
+    Single-parse deserialization of oneOf models over primitive types.
+"""  # noqa: E501
+
+
+import copy
+import functools
+from typing import Union
+
+from pydantic import StrictBool, StrictInt, StrictStr, TypeAdapter, ValidationError
+
+
+@functools.cache
+def primitive_one_of_adapter():
+    """Returns the adapter parsing strict JSON primitives.
+
+    The branches are disjoint so at most one matches. The schema is built on
+    first use rather than when the models are imported.
+    """
+    return TypeAdapter(Union[StrictBool, StrictInt, StrictStr])
+
+_field_defaults = {}
+
+
+def _defaults(cls):
+    """Returns a fresh dict of the field defaults of `cls`.
+
+    `model_construct` deep-copies mutable defaults such as `one_of_schemas`,
+    which costs more than the rest of the construction; a shallow copy of
+    these flat containers of strings is equivalent.
+    """
+    defaults = _field_defaults.get(cls)
+    if defaults is None:
+        defaults = _field_defaults[cls] = {
+            name: field.default for name, field in cls.model_fields.items()
+        }
+    return {
+        name: copy.copy(value) if isinstance(value, (set, list, dict)) else value
+        for name, value in defaults.items()
+    }
+
+
+def construct_one_of(cls, value, validators):
+    """Builds a oneOf model instance by picking the branch from the value type.
+
+    The instance is identical to the one built by assigning `value` to each
+    oneOf validator field in turn, but without the per-branch validation.
+
+    :param cls: oneOf model class.
+    :param value: parsed value.
+    :param validators: mapping of exact python type to validator field name.
+    :return: the model instance, None if no branch accepts the type.
+    """
+    field = validators.get(type(value))
+    if field is None:
+        return None
+    values = _defaults(cls)
+    values[field] = value
+    values["actual_instance"] = value
+    return cls.model_construct(_fields_set={field, "actual_instance"}, **values)
+
+
+def one_of_from_json(cls, json_str, validators):
+    """Parses `json_str` once and builds a oneOf model instance from it.
+
+    :return: the model instance, None if the payload is not one of the
+        primitive branches of the model.
+    """
+    try:
+        value = primitive_one_of_adapter().validate_json(json_str)
+    except ValidationError:
+        return None
+    return construct_one_of(cls, value, validators)
@@ -0,0 +1,266 @@
+# coding: utf-8
+
+"""
+    Unix Timestamp Converter API
+
+    An API to convert between Unix timestamps and human-readable date strings
+
+    The version of the OpenAPI document: 1.0.0
+
+    Token-bucket rate limiting for the REST transports.
+"""  # noqa: E501
+
+
+import contextlib
+import os
+import struct
+import threading
+import time
+
+THROTTLED_STATUSES = {429, 503}
+
+
+def parse_retry_after(value, now=None):
+    """Returns the delay in seconds requested by a `Retry-After` header.
+
+    :param value: header value, either delay-seconds or an HTTP-date.
+    :param now: current UNIX time, defaults to `time.time()`.
+    :return: delay in seconds, None if the value cannot be parsed.
+    """
+    if value is None:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    import email.utils
+
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    now = time.time() if now is None else now
+    return max(0.0, retry_at.timestamp() - now)
+
+
+class _BucketState:
+    """Mutable token bucket state shared by all users of a backend."""
+
+    __slots__ = ("tokens", "updated_at", "blocked_until", "rate")
+
+    FORMAT = struct.Struct("<dddd")
+
+    def __init__(self, tokens, updated_at, blocked_until, rate) -> None:
+        self.tokens = tokens
+        self.updated_at = updated_at
+        self.blocked_until = blocked_until
+        self.rate = rate
+
+    def pack(self) -> bytes:
+        return self.FORMAT.pack(self.tokens, self.updated_at, self.blocked_until, self.rate)
+
+    @classmethod
+    def unpack(cls, data):
+        return cls(*cls.FORMAT.unpack(data))
+
+
+class LocalBucketBackend:
+    """Keeps the bucket state in memory, shared by the threads using one limiter."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._state = None
+
+    @contextlib.contextmanager
+    def transaction(self, initial):
+        """Yields the bucket state under an exclusive lock.
+
+        :param initial: callable creating the state on first use.
+        """
+        with self._lock:
+            if self._state is None:
+                self._state = initial()
+            yield self._state
+
+
+class FileBucketBackend:
+    """Keeps the bucket state in a file guarded by `flock`.
+
+    Every process pointing at the same path shares one budget, e.g. all
+    pytest-xdist workers of a test run.
+
+    :param path: path of the state file, created on first use.
+    """
+
+    def __init__(self, path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._fd = None
+        self._pid = None
+
+    def _open(self):
+        # a descriptor inherited through fork shares its flock with the
+        # parent, so every process opens the file on its own
+        if self._fd is None or self._pid != os.getpid():
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            self._pid = os.getpid()
+        return self._fd
+
+    @contextlib.contextmanager
+    def transaction(self, initial):
+        """Yields the bucket state under an exclusive inter-process lock.
+
+        :param initial: callable creating the state if the file is empty.
+        """
+        import fcntl
+
+        with self._lock:
+            fd = self._open()
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                data = os.pread(fd, _BucketState.FORMAT.size, 0)
+                if len(data) == _BucketState.FORMAT.size:
+                    state = _BucketState.unpack(data)
+                else:
+                    state = initial()
+                yield state
+                os.pwrite(fd, state.pack(), 0)
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+
+    def close(self) -> None:
+        if self._fd is not None and self._pid == os.getpid():
+            os.close(self._fd)
+        self._fd = None
+
+
+class RateLimiter:
+    """Token-bucket rate limiter.
+
+    The bucket holds up to `burst` tokens and refills at `rate` tokens per
+    second; every request takes one token. In adaptive mode throttling
+    responses (429, or 503 with `Retry-After`) pause the bucket for the
+    requested delay and halve the rate, and every other response raises it
+    again additively up to the configured rate.
+
+    :param rate: requests per second.
+    :param burst: bucket capacity.
+    :param adaptive: adapt the rate to throttling responses.
+    :param backend: state backend, `LocalBucketBackend` by default.
+    :param min_rate: lower bound of the adaptive rate.
+    :param clock: wall clock, in seconds. It must be comparable across
+        processes for `FileBucketBackend`.
+    """
+
+    def __init__(
+        self,
+        rate,
+        burst=1,
+        adaptive=False,
+        backend=None,
+        min_rate=None,
+        clock=time.time,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.max_rate = float(rate)
+        self.min_rate = float(min_rate) if min_rate is not None else self.max_rate / 64
+        self.burst = float(burst)
+        self.adaptive = adaptive
+        self.backend = backend if backend is not None else LocalBucketBackend()
+        self._clock = clock
+        self.throttled = 0
+
+    @classmethod
+    def from_configuration(cls, configuration):
+        """Creates the limiter described by a Configuration, None if disabled."""
+        if not configuration.rate_limit:
+            return None
+        backend = None
+        if configuration.rate_limit_file:
+            backend = FileBucketBackend(configuration.rate_limit_file)
+        return cls(
+            configuration.rate_limit,
+            burst=configuration.rate_limit_burst or 1,
+            adaptive=configuration.rate_limit_adaptive,
+            backend=backend,
+        )
+
+    def _initial_state(self):
+        return _BucketState(self.burst, self._clock(), 0.0, self.max_rate)
+
+    def _refill(self, state, now) -> None:
+        elapsed = now - state.updated_at
+        if elapsed > 0:
+            state.tokens = min(self.burst, state.tokens + elapsed * state.rate)
+        state.updated_at = now
+
+    def try_acquire(self) -> float:
+        """Takes a token if one is available.
+
+        :return: 0 if a token was taken, otherwise the number of seconds to
+            wait before trying again.
+        """
+        with self.backend.transaction(self._initial_state) as state:
+            now = self._clock()
+            if state.blocked_until > now:
+                return state.blocked_until - now
+            self._refill(state, now)
+            if state.tokens >= 1:
+                state.tokens -= 1
+                return 0.0
+            return (1 - state.tokens) / state.rate
+
+    def acquire(self) -> None:
+        """Blocks until a token is available and takes it."""
+        while True:
+            delay = self.try_acquire()
+            if not delay:
+                return
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Waits without blocking the event loop until a token is taken."""
+        import asyncio
+
+        while True:
+            delay = self.try_acquire()
+            if not delay:
+                return
+            await asyncio.sleep(delay)
+
+    def observe(self, status, headers=None) -> None:
+        """Feeds a response back to the adaptive mode.
+
+        :param status: HTTP status code of the response.
+        :param headers: response headers, used to read `Retry-After`.
+        """
+        if not self.adaptive:
+            return
+        retry_after = None
+        if headers is not None:
+            retry_after = parse_retry_after(headers.get("Retry-After"))
+        throttled = status == 429 or (status in THROTTLED_STATUSES and retry_after is not None)
+
+        with self.backend.transaction(self._initial_state) as state:
+            now = self._clock()
+            if throttled:
+                self.throttled += 1
+                self._refill(state, now)
+                state.rate = max(self.min_rate, state.rate / 2)
+                state.tokens = 0.0
+                if retry_after is None:
+                    retry_after = 1 / state.rate
+                state.blocked_until = max(state.blocked_until, now + retry_after)
+            elif state.rate < self.max_rate:
+                self._refill(state, now)
+                state.rate = min(self.max_rate, state.rate + self.max_rate / 16)
+
+    @property
+    def rate(self) -> float:
+        """Current refill rate in requests per second."""
+        with self.backend.transaction(self._initial_state) as state:
+            return state.rate
@@ -12,17 +12,33 @@
 """  # noqa: E501
 
 
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import io
 import json
+import os
 import re
 import ssl
+import threading
+import time
+import weakref
 
 import urllib3
 
+from api_sdk.circuit_breaker import CircuitBreaker
+from api_sdk.concurrency import AdaptiveConcurrencyLimiter, is_congestion_status
+from api_sdk.connections import SessionCachingSSLContext, dns_cache
 from api_sdk.exceptions import ApiException, ApiValueError
+from api_sdk.hedging import HedgingPolicy
+from api_sdk.ratelimit import RateLimiter
+from api_sdk.timings import RequestTimings, clock
 
 SUPPORTED_SOCKS_PROXIES = {"socks5", "socks5h", "socks4", "socks4a"}
 RESTResponseType = urllib3.HTTPResponse
+# content codings urllib3 can decode, "br" and "zstd" only when the
+# optional brotli and zstd packages are installed
+SUPPORTED_ENCODINGS = tuple(urllib3.util.request.ACCEPT_ENCODING.split(","))
+# bytes decompressed at a time while reading a response body
+READ_CHUNK_SIZE = 64 * 1024
 
 
 def is_socks_proxy_url(url):
@@ -35,20 +51,181 @@ def is_socks_proxy_url(url):
         return split_section[0].lower() in SUPPORTED_SOCKS_PROXIES
 
 
+class _TimedConnectionMixin:
+    """Records the connect and first byte times of the current request.
+
+    Also connects to the address cached by `dns_cache`, if set, rather
+    than resolving the host name for every new connection, and saves the
+    TLS session for later connections once a response arrived.
+    """
+
+    timings = None
+    dns_cache = None
+
+    def _new_conn(self):
+        if self.dns_cache is None:
+            return self._new_timed_conn()
+        host = self._dns_host
+        addresses = self.dns_cache.resolve(host, self.port)
+        if addresses is None:
+            return self._new_timed_conn()
+        try:
+            for i, address in enumerate(addresses):
+                self._dns_host = address
+                try:
+                    return self._new_timed_conn()
+                except urllib3.exceptions.NewConnectionError:
+                    if i == len(addresses) - 1:
+                        self.dns_cache.forget(host, self.port)
+                        raise
+        finally:
+            self._dns_host = host
+
+    def _new_timed_conn(self):
+        sock = super()._new_conn()
+        if self.timings is not None and isinstance(self, urllib3.connection.HTTPSConnection):
+            self.timings.tcp_connected = clock()
+        return sock
+
+    def connect(self):
+        if self.timings is not None:
+            self.timings.connect_start = clock()
+        super().connect()
+        if self.timings is not None:
+            self.timings.connect_end = clock()
+
+    def getresponse(self):
+        response = super().getresponse()
+        if self.timings is not None:
+            self.timings.first_byte = clock()
+        context = getattr(self.sock, "context", None)
+        if isinstance(context, SessionCachingSSLContext):
+            context.save_session(self.sock)
+        return response
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, urllib3.connection.HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, urllib3.connection.HTTPSConnection):
+    pass
+
+
+class _TimedPoolMixin:
+    """Starts new timings whenever a connection is checked out."""
+
+    # DNSCache the new connections resolve the host name with, if any
+    dns_cache = None
+
+    def _new_conn(self):
+        conn = super()._new_conn()
+        conn.dns_cache = self.dns_cache
+        return conn
+
+    def _get_conn(self, timeout=None):
+        conn = super()._get_conn(timeout)
+        conn.timings = RequestTimings()
+        conn.timings.checkout = conn.timings.start
+        return conn
+
+
+class _TimedHTTPConnectionPool(_TimedPoolMixin, urllib3.HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(_TimedPoolMixin, urllib3.HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _CachedDNSHTTPConnectionPool(_TimedHTTPConnectionPool):
+    dns_cache = dns_cache
+
+
+class _CachedDNSHTTPSConnectionPool(_TimedHTTPSConnectionPool):
+    dns_cache = dns_cache
+
+
+TIMED_POOL_CLASSES = {
+    "http": _TimedHTTPConnectionPool,
+    "https": _TimedHTTPSConnectionPool,
+}
+CACHED_DNS_POOL_CLASSES = {
+    "http": _CachedDNSHTTPConnectionPool,
+    "https": _CachedDNSHTTPSConnectionPool,
+}
+
+
+class Transport:
+    """Interface of the HTTP transports of `RESTClientObject`.
+
+    It is the part of `urllib3.PoolManager` the client relies on, so the
+    default transport is a plain pool manager.
+    """
+
+    def request(
+        self,
+        method,
+        url,
+        body=None,
+        fields=None,
+        encode_multipart=True,
+        timeout=None,
+        headers=None,
+        preload_content=True,
+    ):
+        """Sends a request.
+
+        :param fields: form fields, encoded into the URL for GET, HEAD,
+            DELETE and OPTIONS requests and into the body otherwise.
+        :param timeout: urllib3.Timeout, or seconds.
+        :return: urllib3.BaseHTTPResponse. Its `connection.timings`, if
+            present, holds the RequestTimings of the request.
+        """
+        raise NotImplementedError
+
+    def clear(self):
+        """Closes all connections."""
+        raise NotImplementedError
+
+    def warm_up(self, url, connections):
+        """Opens connections to the host of `url` ahead of the first request.
+
+        :return: dict of warm-up stats, empty if the transport does not
+            support warming up.
+        """
+        return {}
+
+
 class RESTResponse(io.IOBase):
 
-    def __init__(self, resp) -> None:
+    def __init__(self, resp, timings=None) -> None:
         self.response = resp
         self.status = resp.status
         self.reason = resp.reason
         self.data = None
+        self.cache_key = None
+        self.deserialize_lock = None
+        self.deserialized = None
+        self.timings = timings
 
-    def read(self):
+    def read(self) -> bytes:
         if self.data is None:
-            self.data = self.response.data
+            if self.timings is None:
+                # cached responses come without a network stream
+                self.data = self.response.data
+            else:
+                # decompress while reading instead of buffering the raw body
+                self.data = b"".join(
+                    self.response.stream(READ_CHUNK_SIZE, decode_content=True)
+                )
+                self.timings.end = clock()
+                self.timings.content_encoding = self.response.headers.get("Content-Encoding")
+                self.timings.received_bytes = self.response.tell()
+                self.timings.body_bytes = len(self.data)
         return self.data
 
-    def getheaders(self):
+    def getheaders(self) -> urllib3.HTTPHeaderDict:
         """Returns a dictionary of the response headers."""
         return self.response.headers
 
@@ -59,7 +236,72 @@ class RESTResponse(io.IOBase):
 
 class RESTClientObject:
 
-    def __init__(self, configuration) -> None:
+    _shared = weakref.WeakValueDictionary()
+    _shared_lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, configuration):
+        """Returns the client shared by all users of a configuration snapshot.
+
+        Equal `FrozenConfiguration` snapshots get the same client, hence the
+        same connection pools and rate limiter, within a process. The client
+        lives as long as somebody holds a reference to it.
+
+        :param configuration: hashable FrozenConfiguration.
+        """
+        key = (cls, configuration, os.getpid())
+        with cls._shared_lock:
+            client = cls._shared.get(key)
+            if client is None:
+                client = cls._shared[key] = cls(configuration)
+            return client
+
+    def __init__(self, configuration, transport=None) -> None:
+        """
+        :param configuration: .Configuration object for this client
+        :param transport: Transport sending the requests, by default an
+            `HTTP2Transport` if `configuration.http2` is set and a urllib3
+            pool manager otherwise.
+        """
+        self.transport: Transport
+        if transport is not None:
+            self.transport = transport
+        elif configuration.http2:
+            from api_sdk.http2 import HTTP2Transport
+            self.transport = HTTP2Transport(configuration)
+        else:
+            self.transport = self._create_pool_manager(configuration)
+
+        self.rate_limiter = RateLimiter.from_configuration(configuration)
+        self.concurrency_limiter = AdaptiveConcurrencyLimiter.from_configuration(configuration)
+        self.circuit_breaker = CircuitBreaker.from_configuration(configuration)
+        self.hedging = HedgingPolicy.from_configuration(configuration)
+        self.accept_encoding = self._accept_encoding(configuration)
+        self._hedge_pool = None
+        self._hedge_pool_size = 2 * (configuration.connection_pool_maxsize or 1)
+        self._hedge_pool_lock = threading.Lock()
+
+    @staticmethod
+    def _accept_encoding(configuration):
+        """Returns the `Accept-Encoding` header value to send, None if
+        response compression is disabled.
+        """
+        if not configuration.response_compression:
+            return None
+        encodings = configuration.response_encodings
+        if encodings is None:
+            return ",".join(SUPPORTED_ENCODINGS)
+        unsupported = [e for e in encodings if e not in SUPPORTED_ENCODINGS]
+        if unsupported:
+            raise ApiValueError(
+                "Cannot decode response encodings %s, supported are %s"
+                % (", ".join(unsupported), ", ".join(SUPPORTED_ENCODINGS))
+            )
+        return ",".join(encodings) or None
+
+    @staticmethod
+    def _create_pool_manager(configuration):
+        """Creates the default transport, a urllib3 HTTP/1.1 pool manager."""
         # urllib3.PoolManager will pass all kw parameters to connectionpool
         # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/poolmanager.py#L75  # noqa: E501
         # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/connectionpool.py#L680  # noqa: E501
@@ -96,21 +338,107 @@ class RESTClientObject:
         if configuration.connection_pool_maxsize is not None:
             pool_args['maxsize'] = configuration.connection_pool_maxsize
 
+        if configuration.tls_session_resumption:
+            # one context for all connections, sessions are bound to it
+            pool_args['ssl_context'] = SessionCachingSSLContext.create(
+                cert_reqs,
+                load_default_certs=not (configuration.ssl_ca_cert or configuration.ca_cert_data),
+            )
+
         # https pool manager
-        self.pool_manager: urllib3.PoolManager
+        pool_manager: urllib3.PoolManager
 
         if configuration.proxy:
             if is_socks_proxy_url(configuration.proxy):
                 from urllib3.contrib.socks import SOCKSProxyManager
                 pool_args["proxy_url"] = configuration.proxy
                 pool_args["headers"] = configuration.proxy_headers
-                self.pool_manager = SOCKSProxyManager(**pool_args)
+                pool_manager = SOCKSProxyManager(**pool_args)
             else:
                 pool_args["proxy_url"] = configuration.proxy
                 pool_args["proxy_headers"] = configuration.proxy_headers
-                self.pool_manager = urllib3.ProxyManager(**pool_args)
+                pool_manager = urllib3.ProxyManager(**pool_args)
         else:
-            self.pool_manager = urllib3.PoolManager(**pool_args)
+            pool_manager = urllib3.PoolManager(**pool_args)
+
+        if not is_socks_proxy_url(configuration.proxy):
+            # time the phases of every request, see `RESTResponse.timings`
+            if configuration.dns_cache:
+                pool_manager.pool_classes_by_scheme = CACHED_DNS_POOL_CLASSES
+            else:
+                pool_manager.pool_classes_by_scheme = TIMED_POOL_CLASSES
+        return pool_manager
+
+    def warm_up(self, url, connections):
+        """Opens pooled connections to the host of `url`.
+
+        The first connection is opened alone, so that the others can resume
+        its TLS session, then the others in parallel. Connections that fail
+        to open are left for the requests to retry.
+
+        :param url: URL of the host.
+        :param connections: number of connections to open, at most the
+            pool size.
+        :return: dict of warm-up stats.
+        """
+        if not isinstance(self.transport, urllib3.PoolManager):
+            return self.transport.warm_up(url, connections)
+
+        start = clock()
+        pool = self.transport.connection_from_url(url)
+        conns = [pool._get_conn() for _ in range(min(connections, pool.pool.maxsize))]
+        results = []
+
+        def connect(conn):
+            if conn.is_connected:
+                return None
+            try:
+                conn.connect()
+                return True
+            except Exception:
+                conn.close()
+                return False
+
+        try:
+            if conns:
+                results.append(connect(conns[0]))
+            if len(conns) > 1:
+                with ThreadPoolExecutor(max_workers=len(conns) - 1) as executor:
+                    results.extend(executor.map(connect, conns[1:]))
+        finally:
+            for conn in conns:
+                pool._put_conn(conn)
+        stats = {
+            "host": pool.host,
+            "opened": results.count(True),
+            "failed": results.count(False),
+            "seconds": clock() - start,
+        }
+        stats.update(self.pool_stats())
+        return stats
+
+    def pool_stats(self):
+        """Returns how warm the connection pools are.
+
+        :return: dict with the number of connections created so far, the
+            number of open idle ones ready for a request, and the TLS
+            handshake counters.
+        """
+        if not isinstance(self.transport, urllib3.PoolManager):
+            return {}
+        stats = {"created": 0, "idle": 0}
+        for key in self.transport.pools.keys():
+            pool = self.transport.pools.get(key)
+            if pool is None or pool.pool is None:
+                continue
+            stats["created"] += pool.num_connections
+            stats["idle"] += sum(
+                conn is not None and conn.is_connected for conn in list(pool.pool.queue)
+            )
+        context = self.transport.connection_pool_kw.get("ssl_context")
+        if isinstance(context, SessionCachingSSLContext):
+            stats["tls"] = context.stats
+        return stats
 
     def request(
         self,
@@ -153,6 +481,10 @@ class RESTClientObject:
 
         post_params = post_params or {}
         headers = headers or {}
+        if self.accept_encoding is not None and not any(
+            name.lower() == 'accept-encoding' for name in headers
+        ):
+            headers = {**headers, 'Accept-Encoding': self.accept_encoding}
 
         timeout = None
         if _request_timeout:
@@ -167,6 +499,22 @@ class RESTClientObject:
                     read=_request_timeout[1]
                 )
 
+        start = clock()
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before_request()
+        try:
+            # wait for the rate limit before taking a concurrency slot, so
+            # the wait neither blocks other requests nor counts as latency
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            if self.concurrency_limiter is not None:
+                self.concurrency_limiter.acquire()
+        except BaseException:
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record(None)
+            raise
+        sent = clock()
+
         try:
             # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
             if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
@@ -180,7 +528,7 @@ class RESTClientObject:
                     request_body = None
                     if body is not None:
                         request_body = json.dumps(body)
-                    r = self.pool_manager.request(
+                    r = self.transport.request(
                         method,
                         url,
                         body=request_body,
@@ -189,7 +537,7 @@ class RESTClientObject:
                         preload_content=False
                     )
                 elif content_type == 'application/x-www-form-urlencoded':
-                    r = self.pool_manager.request(
+                    r = self.transport.request(
                         method,
                         url,
                         fields=post_params,
@@ -205,7 +553,7 @@ class RESTClientObject:
                     del headers['Content-Type']
                     # Ensures that dict objects are serialized
                     post_params = [(a, json.dumps(b)) if isinstance(b, dict) else (a,b) for a, b in post_params]
-                    r = self.pool_manager.request(
+                    r = self.transport.request(
                         method,
                         url,
                         fields=post_params,
@@ -218,7 +566,7 @@ class RESTClientObject:
                 # other content types than JSON when `body` argument is
                 # provided in serialized form.
                 elif isinstance(body, str) or isinstance(body, bytes):
-                    r = self.pool_manager.request(
+                    r = self.transport.request(
                         method,
                         url,
                         body=body,
@@ -228,7 +576,7 @@ class RESTClientObject:
                     )
                 elif headers['Content-Type'].startswith('text/') and isinstance(body, bool):
                     request_body = "true" if body else "false"
-                    r = self.pool_manager.request(
+                    r = self.transport.request(
                         method,
                         url,
                         body=request_body,
@@ -242,8 +590,10 @@ class RESTClientObject:
                              declared content type."""
                     raise ApiException(status=0, reason=msg)
             # For `GET`, `HEAD`
+            elif self.hedging is not None:
+                r = self._request_hedged(method, url, headers, timeout)
             else:
-                r = self.pool_manager.request(
+                r = self.transport.request(
                     method,
                     url,
                     fields={},
@@ -252,7 +602,112 @@ class RESTClientObject:
                     preload_content=False
                 )
         except urllib3.exceptions.SSLError as e:
+            self._settle(sent, error=True)
             msg = "\n".join([type(e).__name__, str(e)])
             raise ApiException(status=0, reason=msg)
+        except urllib3.exceptions.HTTPError:
+            self._settle(sent, error=True)
+            raise
+        except BaseException:
+            self._settle(sent)
+            raise
+        self._settle(sent, r.status)
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.observe(r.status, r.headers)
+
+        timings = getattr(r.connection, "timings", None)
+        if timings is None:
+            timings = RequestTimings(start)
+        timings.start = start
+        return RESTResponse(r, timings)
+
+    def _settle(self, sent, status=None, error=False):
+        """Feeds the outcome of a request to the concurrency limiter and
+        the circuit breaker.
+
+        :param sent: clock value when the request was sent.
+        :param status: response status, None if no response arrived.
+        :param error: whether the request failed in the transport.
+        """
+        if self.concurrency_limiter is not None:
+            self.concurrency_limiter.release(
+                clock() - sent if status is not None else None,
+                congested=error or (status is not None and is_congestion_status(status)),
+            )
+        if self.circuit_breaker is not None:
+            success = None
+            if error or status is not None:
+                success = not error and status < 500
+            self.circuit_breaker.record(success)
+
+    @property
+    def hedge_pool(self):
+        """Threads sending hedged requests, created on first use."""
+        with self._hedge_pool_lock:
+            if self._hedge_pool is None:
+                self._hedge_pool = ThreadPoolExecutor(
+                    max_workers=self._hedge_pool_size,
+                    thread_name_prefix="api_sdk_hedge",
+                )
+            return self._hedge_pool
+
+    def _request_hedged(self, method, url, headers, timeout):
+        """Sends an idempotent request, duplicated if it is slow to answer.
 
-        return RESTResponse(r)
+        The first successful response wins; the other one is drained and
+        its connection handed back to the pool once it arrives.
+        """
+        def send():
+            start = time.monotonic()
+            r = self.transport.request(
+                method,
+                url,
+                fields={},
+                timeout=timeout,
+                headers=dict(headers),
+                preload_content=False
+            )
+            self.hedging.observe(time.monotonic() - start)
+            return r
+
+        delay = self.hedging.delay()
+        if delay is None:
+            return send()
+
+        primary = self.hedge_pool.submit(send)
+        done, _ = wait([primary], timeout=delay)
+        admit = None
+        if self.rate_limiter is not None:
+            # hedges never wait for the rate limiter
+            admit = lambda: not self.rate_limiter.try_acquire()  # noqa: E731
+        if done or not self.hedging.try_hedge(admit):
+            return primary.result()
+
+        hedge = self.hedge_pool.submit(send)
+        winner = None
+        pending = {primary, hedge}
+        while winner is None and pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in (primary, hedge):
+                if future in done and future.exception() is None:
+                    winner = future
+                    break
+
+        for future in (primary, hedge):
+            if future is not winner:
+                future.cancel()
+                future.add_done_callback(_discard_response)
+        if winner is None:
+            return primary.result()
+        if winner is hedge:
+            self.hedging.won()
+        return winner.result()
+
+
+def _discard_response(future) -> None:
+    if future.cancelled() or future.exception() is not None:
+        return
+    r = future.result()
+    r.drain_conn()
+    r.release_conn()
@@ -0,0 +1,105 @@
+# coding: utf-8
+
+"""
+    Unix Timestamp Converter API
+
+    An API to convert between Unix timestamps and human-readable date strings
+
+    The version of the OpenAPI document: 1.0.0
+
+    Coalescing of identical in-flight requests.
+"""  # noqa: E501
+
+
+import threading
+from concurrent.futures import Future
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time across threads.
+
+    Callers asking for a key that is already in flight wait for the running
+    call and receive its result (or exception) instead of starting their own.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.calls = 0
+        self.shared = 0
+
+    def do(self, key, func):
+        """Returns `func()`, sharing the call with concurrent callers of `key`.
+
+        :param key: hashable identity of the call.
+        :param func: callable performing the call.
+        :return: the result of the (possibly shared) call.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                self.calls += 1
+                future = self._calls[key] = Future()
+            else:
+                self.shared += 1
+        if not leader:
+            return future.result()
+
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight:
+    """Runs at most one call per key at a time within an event loop.
+
+    The call runs in its own task, so a caller that is cancelled stops
+    waiting without cancelling the call for the other callers. The call is
+    only cancelled once none of its callers wait for it anymore.
+    """
+
+    def __init__(self) -> None:
+        self._calls = {}
+        self.calls = 0
+        self.shared = 0
+
+    async def do(self, key, func):
+        """Returns `await func()`, sharing the call with concurrent callers of `key`.
+
+        :param key: hashable identity of the call.
+        :param func: coroutine function performing the call.
+        :return: the result of the (possibly shared) call.
+        """
+        import asyncio
+
+        call = self._calls.get(key)
+        if call is None:
+            self.calls += 1
+            # [task, number of callers waiting for it]
+            call = self._calls[key] = [asyncio.ensure_future(func()), 0]
+            call[0].add_done_callback(lambda _: self._forget(key, call))
+        else:
+            self.shared += 1
+
+        task = call[0]
+        call[1] += 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            call[1] -= 1
+            if call[1] == 0 and not task.done():
+                self._forget(key, call)
+                task.cancel()
+
+    def _forget(self, key, call) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
@@ -0,0 +1,275 @@
+# coding: utf-8
+
+"""
+    Local stand-in for the Unix Timestamp Converter API used by the unit tests.
+"""  # noqa: E501
+
+
+import gzip
+import json
+import socket
+import ssl
+import struct
+import subprocess
+import threading
+import zlib
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+CONVERTER_PATH = "/api/unix-timestamp-converter/"
+BULK_PATH = "/api/unix-timestamp-converter/bulk/"
+
+
+def _convert_one(s):
+    if str(s).lstrip("-").isdigit():
+        return datetime.fromtimestamp(int(s), timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+    return False
+
+
+def convert(path, query, headers, body=None):
+    """Default responder mimicking the converter and bulk endpoints.
+
+    :return: tuple of (status, headers, body)
+    """
+    if path == BULK_PATH and body is not None:
+        if headers.get("Content-Type") == "application/octet-stream":
+            values = [value for (value,) in struct.iter_unpack("<q", body)]
+        else:
+            values = json.loads(body)
+        results = [_convert_one(value) for value in values]
+        return 200, {"Content-Type": "application/json"}, json.dumps(results).encode("utf-8")
+    if path != CONVERTER_PATH:
+        return 404, {"Content-Type": "application/json"}, b'"false"'
+
+    result = _convert_one(query.get("s", [""])[0])
+    return 200, {"Content-Type": "application/json"}, json.dumps(result).encode("utf-8")
+
+
+def compressing(responder):
+    """Wraps a responder to compress its bodies as the client accepts.
+
+    Supports gzip and deflate, preferring the first one listed in the
+    `Accept-Encoding` request header.
+    """
+    compressors = {"gzip": gzip.compress, "deflate": zlib.compress}
+
+    def respond(path, query, headers):
+        status, response_headers, body = responder(path, query, headers)
+        accepted = [e.split(";")[0].strip() for e in headers.get("Accept-Encoding", "").split(",")]
+        for encoding in accepted:
+            if encoding in compressors:
+                response_headers = {**response_headers, "Content-Encoding": encoding}
+                return status, response_headers, compressors[encoding](body)
+        return status, response_headers, body
+
+    return respond
+
+
+def create_self_signed_cert(path):
+    """Writes a self-signed certificate and key for "localhost" to `path`.
+
+    Requires the openssl command line tool.
+    """
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+            "-subj", "/CN=localhost", "-addext", "subjectAltName=DNS:localhost",
+            "-keyout", path, "-out", path,
+        ],
+        check=True,
+        capture_output=True,
+    )
+
+
+class LocalServer:
+    """Threaded HTTP/1.1 server listening on a free loopback port.
+
+    :param responder: callable taking (path, query, headers) and returning
+        a (status, headers, body) tuple. For POST requests the request body
+        is passed as a fourth argument.
+    :param certfile: PEM file with the certificate and private key to serve
+        HTTPS with, for the host name "localhost".
+    """
+
+    def __init__(self, responder=convert, certfile=None) -> None:
+        self.responder = responder
+        self.requests = []
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._scheme = "http"
+        self._hostname = "127.0.0.1"
+        if certfile is not None:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(certfile)
+            self._server.socket = context.wrap_socket(self._server.socket, server_side=True)
+            self._scheme = "https"
+            self._hostname = "localhost"
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+
+    @property
+    def host(self) -> str:
+        return "%s://%s:%d" % (self._scheme, self._hostname, self._server.server_address[1])
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # the head and the body are written separately
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+
+            def do_GET(self):
+                self._respond()
+
+            def do_POST(self):
+                self._respond(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+
+            def _respond(self, *request_body):
+                parts = urlsplit(self.path)
+                with server._lock:
+                    server.requests.append(self.path)
+                status, headers, body = server.responder(
+                    parts.path, parse_qs(parts.query, keep_blank_values=True), self.headers, *request_body
+                )
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+
+class LocalHTTP2Server:
+    """HTTP/2 (h2c, prior knowledge) server listening on a free loopback port.
+
+    Every stream is answered from its own thread, so that slow responses do
+    not hold up the other streams of the connection. Same interface as
+    `LocalServer`; requires the h2 package.
+
+    :param responder: callable taking (path, query, headers) and returning
+        a (status, headers, body) tuple.
+    """
+
+    def __init__(self, responder=convert) -> None:
+        import h2.config
+        import h2.connection
+        import h2.events
+        import h2.exceptions
+
+        self._h2 = h2
+        self.responder = responder
+        self.requests = []
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._socket = socket.create_server(("127.0.0.1", 0))
+        self._sockets = []
+        self._thread = threading.Thread(target=self._accept_loop, daemon=True)
+
+    @property
+    def host(self) -> str:
+        return "http://127.0.0.1:%d" % self._socket.getsockname()[1]
+
+    def _accept_loop(self):
+        while True:
+            try:
+                sock, _ = self._socket.accept()
+            except OSError:
+                return
+            with self._lock:
+                self.connections += 1
+                self._sockets.append(sock)
+            threading.Thread(target=self._serve, args=(sock,), daemon=True).start()
+
+    def _serve(self, sock):
+        h2 = self._h2
+        conn = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False, header_encoding="utf-8"))
+        write_lock = threading.Lock()
+        conn.initiate_connection()
+        sock.sendall(conn.data_to_send())
+        requests = {}
+        while True:
+            try:
+                data = sock.recv(65536)
+            except OSError:
+                return
+            if not data:
+                sock.close()
+                return
+            with write_lock:
+                try:
+                    events = conn.receive_data(data)
+                    sock.sendall(conn.data_to_send())
+                except (OSError, h2.exceptions.ProtocolError):
+                    sock.close()
+                    return
+            for event in events:
+                if isinstance(event, h2.events.RequestReceived):
+                    requests[event.stream_id] = dict(event.headers)
+                elif isinstance(event, h2.events.StreamEnded):
+                    headers = requests.pop(event.stream_id)
+                    threading.Thread(
+                        target=self._respond,
+                        args=(sock, conn, write_lock, event.stream_id, headers),
+                        daemon=True,
+                    ).start()
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    sock.close()
+                    return
+
+    def _respond(self, sock, conn, write_lock, stream_id, headers):
+        parts = urlsplit(headers[":path"])
+        with self._lock:
+            self.requests.append(headers[":path"])
+        status, response_headers, body = self.responder(
+            parts.path, parse_qs(parts.query, keep_blank_values=True), headers
+        )
+        h2_headers = [(":status", str(status)), ("content-length", str(len(body)))]
+        h2_headers.extend((name.lower(), value) for name, value in response_headers.items())
+        with write_lock:
+            try:
+                conn.send_headers(stream_id, h2_headers)
+                conn.send_data(stream_id, body, end_stream=True)
+                sock.sendall(conn.data_to_send())
+            except (OSError, self._h2.exceptions.ProtocolError):
+                pass
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # closing alone does not wake up the blocked accept()
+        self._socket.shutdown(socket.SHUT_RDWR)
+        self._socket.close()
+        self._thread.join()
+        with self._lock:
+            for sock in self._sockets:
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+                sock.close()
@@ -0,0 +1,108 @@
+# coding: utf-8
+
+"""
+    Unix Timestamp Converter API
+
+    An API to convert between Unix timestamps and human-readable date strings
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import datetime
+import unittest
+
+from api_sdk.api.timestamp_api import TimestampApi
+from api_sdk.api_client import ApiClient, parse_content_type
+from api_sdk.cache import CachedResponse
+from api_sdk.configuration import Configuration
+from api_sdk.exceptions import ApiException
+from api_sdk.models.convert_timestamp_s_parameter import ConvertTimestampSParameter
+from api_sdk.rest import RESTResponse
+
+
+class TestApiClientDeserialize(unittest.TestCase):
+    """ApiClient compiled deserializer tests"""
+
+    def setUp(self) -> None:
+        self.api_client = ApiClient()
+
+    def test_deserializers_are_compiled_once(self) -> None:
+        deserializer = self.api_client.deserializer("Dict[str, List[ConvertTimestampSParameter]]")
+        self.assertIs(deserializer, self.api_client.deserializer("Dict[str, List[ConvertTimestampSParameter]]"))
+
+        result = deserializer({"a": [1, "x", None], "b": None})
+        self.assertIsInstance(result["a"][0], ConvertTimestampSParameter)
+        self.assertEqual(result["a"][0].actual_instance, 1)
+        self.assertEqual(result["a"][1].actual_instance, "x")
+        self.assertIsNone(result["a"][2])
+        self.assertIsNone(result["b"])
+
+    def test_native_types(self) -> None:
+        self.assertEqual(self.api_client.deserializer("List[int]")(["1", 2]), [1, 2])
+        self.assertEqual(self.api_client.deserializer("date")("2023-01-02"), datetime.date(2023, 1, 2))
+        self.assertEqual(self.api_client.deserializer("object")({"a": 1}), {"a": 1})
+        self.assertIsNone(self.api_client.deserializer("str")(None))
+
+    def test_response_deserializer_falls_back_on_status_class(self) -> None:
+        types_map = {"200": "str", "4XX": "int"}
+        self.assertEqual(self.api_client.response_deserializer(types_map, 200)[0], "str")
+        self.assertEqual(self.api_client.response_deserializer(types_map, 404)[0], "int")
+        self.assertEqual(self.api_client.response_deserializer(types_map, 500), (None, None))
+        self.assertEqual(self.api_client.response_deserializer({"200": "bytearray"}, 200), ("bytearray", None))
+
+    def test_response_deserialize(self) -> None:
+        response = RESTResponse(CachedResponse(200, "OK", {"content-type": "text/plain; charset=latin-1"}, "d\xe9j\xe0".encode("latin-1")))
+        response.read()
+        self.assertEqual(self.api_client.response_deserialize(response, {"200": "str"}).data, "d\xe9j\xe0")
+
+        response = RESTResponse(CachedResponse(200, "OK", {"content-type": "image/png"}, b"\x89PNG"))
+        response.read()
+        with self.assertRaises(ApiException):
+            self.api_client.response_deserialize(response, {"200": "str"})
+
+    def test_parse_content_type(self) -> None:
+        self.assertEqual(parse_content_type("application/json"), ("json", "utf-8"))
+        self.assertEqual(parse_content_type("application/problem+json; charset=utf-16"), ("json", "utf-16"))
+        self.assertEqual(parse_content_type("text/html;charset=latin-1"), ("text", "latin-1"))
+        self.assertEqual(parse_content_type("image/png")[0], None)
+
+
+class TestApiClientSerialize(unittest.TestCase):
+    """ApiClient compiled request template tests"""
+
+    def setUp(self) -> None:
+        self.api_client = ApiClient(Configuration(host="http://example.test"))
+        self.api = TimestampApi(self.api_client)
+
+    def serialize(self, cached, s, _headers=None):
+        return self.api._convert_timestamp_serialize(cached, s, None, None, _headers, 0)
+
+    def generic_serialize(self, cached, s):
+        # the generic path, taken when per-request headers are given
+        return self.serialize(cached, s, _headers={"Accept": "application/json"})
+
+    def test_compiled_request_matches_generic_path(self) -> None:
+        for cached, s in [("", "1672531200"), (None, "2023-01-01 12:00:00"), ("a&b", "x/y?z"), ("1", None), (True, 5)]:
+            with self.subTest(cached=cached, s=s):
+                self.assertEqual(self.serialize(cached, s), self.generic_serialize(cached, s))
+
+    def test_compiled_request_follows_client_changes(self) -> None:
+        first = self.serialize("", "0")
+        self.api_client.set_default_header("X-Test", "1")
+        self.api_client.cookie = "a=b"
+        self.api_client.configuration.host = "http://other.test"
+        second = self.serialize("", "0")
+        self.assertEqual(second, self.generic_serialize("", "0"))
+        self.assertEqual(second[1], "http://other.test/api/unix-timestamp-converter/?cached=&s=0")
+        self.assertEqual(second[2]["X-Test"], "1")
+        self.assertEqual(second[2]["Cookie"], "a=b")
+        self.assertNotIn("X-Test", first[2])
+
+    def test_compiled_request_headers_are_not_shared(self) -> None:
+        self.serialize("", "0")[2]["X-Test"] = "1"
+        self.assertNotIn("X-Test", self.serialize("", "0")[2])
+
+
+if __name__ == '__main__':
+    unittest.main()
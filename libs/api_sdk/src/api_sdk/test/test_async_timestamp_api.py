@@ -0,0 +1,230 @@
+# coding: utf-8
+
+"""
+    Unix Timestamp Converter API
+
+    An API to convert between Unix timestamps and human-readable date strings
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import asyncio
+import gc
+import unittest
+from unittest import mock
+
+import urllib3
+
+from api_sdk.api.async_timestamp_api import AsyncTimestampApi
+from api_sdk.async_api_client import AsyncApiClient
+from api_sdk.async_rest import AsyncConnectionPool, AsyncRESTClientObject
+from api_sdk.configuration import Configuration
+from api_sdk.exceptions import ApiValueError, NotFoundException
+from api_sdk.singleflight import AsyncSingleFlight
+from api_sdk.test.local_server import LocalServer
+
+
+class TestAsyncTimestampApi(unittest.IsolatedAsyncioTestCase):
+    """AsyncTimestampApi unit tests against a local server"""
+
+    def setUp(self) -> None:
+        self.server = LocalServer().__enter__()
+        configuration = Configuration(host=self.server.host)
+        configuration.connection_pool_maxsize = 4
+        self.api_client = AsyncApiClient(configuration)
+        self.api = AsyncTimestampApi(self.api_client)
+
+    async def asyncTearDown(self) -> None:
+        await self.api_client.close()
+
+    def tearDown(self) -> None:
+        self.server.__exit__(None, None, None)
+
+    async def test_convert_timestamp(self) -> None:
+        res = await self.api.convert_timestamp(s=1672531200)
+        self.assertEqual(res.to_dict(), "2023-01-01 00:00:00")
+
+    async def test_convert_timestamp_with_http_info(self) -> None:
+        res = await self.api.convert_timestamp_with_http_info(cached="", s="foo")
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.data.to_dict(), False)
+        self.assertEqual(res.raw_data, b"false")
+
+    async def test_records_request_timings(self) -> None:
+        first = (await self.api.convert_timestamp_with_http_info(s=0)).timings
+        second = (await self.api.convert_timestamp_with_http_info(s=1)).timings
+        self.assertFalse(first.reused)
+        self.assertTrue(second.reused)
+        self.assertGreater(first.connecting, 0)
+        self.assertEqual(second.connecting, 0)
+        for timings in (first, second):
+            self.assertLessEqual(timings.start, timings.checkout)
+            self.assertLess(timings.checkout, timings.first_byte)
+            self.assertLessEqual(timings.first_byte, timings.end)
+            self.assertAlmostEqual(
+                timings.duration,
+                timings.blocked + timings.connecting + timings.waiting + timings.receiving,
+            )
+
+    async def test_convert_timestamp_without_preload_content(self) -> None:
+        res = await self.api.convert_timestamp_without_preload_content(s=0)
+        self.assertEqual(res.status, 200)
+        self.assertEqual(await res.read(), b'"1970-01-01 00:00:00"')
+
+    async def test_unread_responses_release_their_connection(self) -> None:
+        self.api_client.rest_client.maxsize = 1
+
+        async with await self.api.convert_timestamp_without_preload_content(s=0) as res:
+            self.assertEqual(res.status, 200)
+        res = await asyncio.wait_for(self.api.convert_timestamp_without_preload_content(s=1), 5)
+        res.release_conn()
+
+        # dropped without reading or releasing, the finalizer frees the slot
+        res = await asyncio.wait_for(self.api.convert_timestamp_without_preload_content(s=2), 5)
+        del res
+        gc.collect()
+        res = await asyncio.wait_for(self.api.convert_timestamp_without_preload_content(s=3), 5)
+        self.assertEqual(await res.read(), b'"1970-01-01 00:00:03"')
+        # unread bodies leave their connection unusable
+        self.assertEqual(self.server.connections, 4)
+
+    async def test_concurrent_requests_share_pool(self) -> None:
+        results = await asyncio.gather(
+            *(self.api.convert_timestamp(s=ts) for ts in range(0, 3600 * 50, 3600))
+        )
+        self.assertEqual(results[1].to_dict(), "1970-01-01 01:00:00")
+        self.assertEqual(len(self.server.requests), 50)
+        self.assertLessEqual(self.server.connections, 4)
+
+    async def test_convert_timestamps_keeps_input_order(self) -> None:
+        async def timestamps():
+            for ts in range(0, 3600 * 20, 3600):
+                yield ts
+
+        results = [
+            res.to_dict() async for res in self.api.convert_timestamps(timestamps(), max_in_flight=3)
+        ]
+        self.assertEqual(len(results), 20)
+        self.assertEqual(results[:2], ["1970-01-01 00:00:00", "1970-01-01 01:00:00"])
+
+    async def test_coalesces_identical_requests(self) -> None:
+        self.api_client.single_flight = AsyncSingleFlight()
+        results = await asyncio.gather(
+            *(self.api.convert_timestamp_with_http_info(s=0) for _ in range(5)),
+            self.api.convert_timestamp_with_http_info(s=1),
+        )
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertTrue(all(res is results[0] for res in results[:5]))
+        self.assertEqual(results[5].data.to_dict(), "1970-01-01 00:00:01")
+
+    async def test_convert_timestamps_bulk(self) -> None:
+        results = await self.api.convert_timestamps_bulk([0, "foo"])
+        self.assertEqual([res.to_dict() for res in results], ["1970-01-01 00:00:00", False])
+
+    async def test_error_status_raises(self) -> None:
+        self.api_client.configuration.host = self.server.host + "/missing"
+        with self.assertRaises(NotFoundException):
+            await self.api.convert_timestamp(s=0)
+
+    async def test_retries_failed_connections(self) -> None:
+        self.api_client.configuration.retries = 2
+        api_client = AsyncApiClient(self.api_client.configuration)
+        connect = AsyncConnectionPool._connect
+        attempts = []
+
+        async def flaky_connect(pool, connect_timeout):
+            attempts.append(connect_timeout)
+            if len(attempts) < 3:
+                raise ConnectionRefusedError()
+            return await connect(pool, connect_timeout)
+
+        with mock.patch.object(AsyncConnectionPool, "_connect", flaky_connect):
+            res = await AsyncTimestampApi(api_client).convert_timestamp(s=0)
+            self.assertEqual(res.to_dict(), "1970-01-01 00:00:00")
+            self.assertEqual(len(attempts), 3)
+
+            # no idle connection to reuse
+            await api_client.close()
+            attempts.clear()
+            api_client.rest_client.retries = 1
+            with self.assertRaises(ConnectionRefusedError):
+                await AsyncTimestampApi(api_client).convert_timestamp(s=1)
+            self.assertEqual(len(attempts), 2)
+        await api_client.close()
+
+    def test_rejects_retry_objects(self) -> None:
+        self.api_client.configuration.retries = urllib3.util.Retry(total=2)
+        with self.assertRaises(ApiValueError):
+            AsyncApiClient(self.api_client.configuration)
+
+    def test_sync_context_manager_raises(self) -> None:
+        with self.assertRaisesRegex(TypeError, "async with"):
+            with self.api_client:
+                pass
+
+
+class TestAsyncStaleConnections(unittest.IsolatedAsyncioTestCase):
+    """Resending requests whose keep-alive connection was closed by the server"""
+
+    async def asyncSetUp(self) -> None:
+        # what the server does with each request: "ok", "close" or "hang"
+        self.actions = []
+        self.requests = []
+        self.server = await asyncio.start_server(self.serve, "127.0.0.1", 0)
+        host, port = self.server.sockets[0].getsockname()
+        self.url = "http://%s:%d/" % (host, port)
+        self.rest_client = AsyncRESTClientObject(Configuration())
+
+    async def asyncTearDown(self) -> None:
+        await self.rest_client.close()
+        self.server.close()
+
+    async def serve(self, reader, writer) -> None:
+        while True:
+            try:
+                head = await reader.readuntil(b"\r\n\r\n")
+            except asyncio.IncompleteReadError:
+                break
+            length = 0
+            for line in head.split(b"\r\n"):
+                name, _, value = line.partition(b":")
+                if name.lower() == b"content-length":
+                    length = int(value)
+            await reader.readexactly(length)
+            self.requests.append(head.split(b" ", 1)[0].decode())
+            action = self.actions.pop(0) if self.actions else "ok"
+            if action == "close":
+                break
+            if action == "hang":
+                # until the client gives up on the connection
+                await reader.read()
+                break
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+            await writer.drain()
+        writer.close()
+
+    async def test_resends_idempotent_request_on_stale_connection(self) -> None:
+        await (await self.rest_client.request("GET", self.url)).read()
+        self.actions = ["close"]
+        res = await self.rest_client.request("GET", self.url)
+        self.assertEqual(await res.read(), b"ok")
+        self.assertEqual(self.requests, ["GET", "GET", "GET"])
+
+    async def test_does_not_resend_non_idempotent_request(self) -> None:
+        await (await self.rest_client.request("GET", self.url)).read()
+        self.actions = ["close"]
+        with self.assertRaises(ConnectionError):
+            await self.rest_client.request("POST", self.url, body={"s": 0})
+        self.assertEqual(self.requests, ["GET", "POST"])
+
+    async def test_does_not_resend_after_timeout(self) -> None:
+        await (await self.rest_client.request("GET", self.url)).read()
+        self.actions = ["hang"]
+        with self.assertRaises(TimeoutError):
+            await self.rest_client.request("GET", self.url, _request_timeout=(None, 0.2))
+        self.assertEqual(self.requests, ["GET", "GET"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+# coding: utf-8
+
+"""
+    Unix Timestamp Converter API
+
+    An API to convert between Unix timestamps and human-readable date strings
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import struct
+import unittest
+
+from api_sdk.api.timestamp_api import TimestampApi
+from api_sdk.api_client import ApiClient
+from api_sdk.configuration import Configuration
+from api_sdk.exceptions import ApiValueError
+from api_sdk.test.local_server import LocalServer, convert
+
+
+class TestConvertTimestampsBulk(unittest.TestCase):
+    """TimestampApi.convert_timestamps_bulk tests against a local server"""
+
+    def setUp(self) -> None:
+        self.server = LocalServer().__enter__()
+        self.api_client = ApiClient(Configuration(host=self.server.host))
+        self.api = TimestampApi(self.api_client)
+
+    def tearDown(self) -> None:
+        self.api_client.close()
+        self.server.__exit__(None, None, None)
+
+    def test_keeps_input_order(self) -> None:
+        results = self.api.convert_timestamps_bulk([0, "foo", 3600])
+        self.assertEqual([res.to_dict() for res in results], ["1970-01-01 00:00:00", False, "1970-01-01 01:00:00"])
+        self.assertEqual(self.server.requests, ["/api/unix-timestamp-converter/bulk/"])
+
+    def test_sends_binary_timestamps(self) -> None:
+        bodies = []
+
+        def responder(path, query, headers, body):
+            bodies.append((headers["Content-Type"], body))
+            return convert(path, query, headers, body)
+
+        self.server.responder = responder
+        res = self.api.convert_timestamps_bulk_with_http_info([0, -1], _content_type="application/octet-stream")
+        self.assertEqual([item.to_dict() for item in res.data], ["1970-01-01 00:00:00", "1969-12-31 23:59:59"])
+        self.assertEqual(bodies, [("application/octet-stream", struct.pack("<2q", 0, -1))])
+
+        with self.assertRaises(ApiValueError):
+            self.api.convert_timestamps_bulk(["2023-01-01"], _content_type="application/octet-stream")
+        with self.assertRaises(ApiValueError):
+            self.api.convert_timestamps_bulk([2**63], _content_type="application/octet-stream")
+        self.assertEqual(len(bodies), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
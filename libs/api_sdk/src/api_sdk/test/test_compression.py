@@ -0,0 +1,99 @@
+# coding: utf-8
+
+"""
+    Unix Timestamp Converter API
+
+    An API to convert between Unix timestamps and human-readable date strings
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import json
+import unittest
+
+from api_sdk.api.timestamp_api import TimestampApi
+from api_sdk.api_client import ApiClient
+from api_sdk.configuration import Configuration
+from api_sdk.exceptions import ApiValueError
+from api_sdk.rest import SUPPORTED_ENCODINGS, RESTClientObject
+from api_sdk.test.local_server import CONVERTER_PATH, LocalServer, compressing
+
+# large enough for compression to pay off
+BODY = json.dumps("1970-01-01 00:00:00" * 200).encode("utf-8")
+
+
+def large(path, query, headers):
+    return 200, {"Content-Type": "application/json"}, BODY
+
+
+class TestResponseCompression(unittest.TestCase):
+    """Accept-Encoding negotiation against a compressing local server"""
+
+    def setUp(self) -> None:
+        self.accepted = []
+        self.server = LocalServer(compressing(self.record(large))).__enter__()
+        self.configuration = Configuration(host=self.server.host)
+        self.configuration.response_compression = True
+
+    def tearDown(self) -> None:
+        self.server.__exit__(None, None, None)
+
+    def record(self, responder):
+        def respond(path, query, headers):
+            self.accepted.append(headers.get("Accept-Encoding"))
+            return responder(path, query, headers)
+        return respond
+
+    def get(self, headers=None):
+        rest_client = RESTClientObject(self.configuration)
+        response = rest_client.request("GET", self.server.host + CONVERTER_PATH, headers=headers)
+        response.read()
+        return response
+
+    def test_gzip_response_is_decompressed(self) -> None:
+        response = self.get()
+        self.assertEqual(response.data, BODY)
+        self.assertEqual(self.accepted, [",".join(SUPPORTED_ENCODINGS)])
+        timings = response.timings
+        self.assertEqual(timings.content_encoding, "gzip")
+        self.assertEqual(timings.body_bytes, len(BODY))
+        self.assertLess(timings.received_bytes, timings.body_bytes)
+        self.assertGreater(timings.compression_ratio, 10)
+
+    def test_preferred_encoding(self) -> None:
+        self.configuration.response_encodings = ["deflate", "gzip"]
+        response = self.get()
+        self.assertEqual(response.data, BODY)
+        self.assertEqual(self.accepted, ["deflate,gzip"])
+        self.assertEqual(response.timings.content_encoding, "deflate")
+
+    def test_caller_header_wins(self) -> None:
+        response = self.get({"accept-encoding": "identity"})
+        self.assertEqual(self.accepted, ["identity"])
+        self.assertIsNone(response.timings.content_encoding)
+        self.assertEqual(response.timings.received_bytes, len(BODY))
+
+    def test_disabled_by_default(self) -> None:
+        self.configuration = Configuration(host=self.server.host)
+        response = self.get()
+        self.assertEqual(response.data, BODY)
+        # added by http.client when the request has no Accept-Encoding
+        self.assertEqual(self.accepted, ["identity"])
+        self.assertEqual(response.timings.compression_ratio, 1)
+
+    def test_unsupported_encoding(self) -> None:
+        self.configuration.response_encodings = ["gzip", "compress"]
+        with self.assertRaises(ApiValueError):
+            RESTClientObject(self.configuration)
+
+    def test_api_client(self) -> None:
+        with ApiClient(self.configuration.freeze()) as api_client:
+            response = TimestampApi(api_client).convert_timestamp_with_http_info(s=0)
+        self.assertEqual(response.raw_data, BODY)
+        self.assertEqual(response.data.to_dict(), json.loads(BODY))
+        self.assertEqual(response.timings.content_encoding, "gzip")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,247 @@
+# coding: utf-8
+
+"""
+    Unix Timestamp Converter API
+
+    An API to convert between Unix timestamps and human-readable date strings
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import random
+import threading
+import time
+import unittest
+from unittest import mock
+
+from api_sdk.api.timestamp_api import TimestampApi
+from api_sdk.api_client import ApiClient
+from api_sdk.circuit_breaker import CircuitBreaker
+from api_sdk.concurrency import AdaptiveConcurrencyLimiter
+from api_sdk.configuration import Configuration
+from api_sdk.exceptions import ApiException, CircuitOpenException, ServiceException
+from api_sdk.test.local_server import LocalServer, convert
+
+
+class TestAdaptiveConcurrencyLimiter(unittest.TestCase):
+    """AdaptiveConcurrencyLimiter unit tests"""
+
+    def fill(self, limiter):
+        for _ in range(limiter.limit):
+            limiter.acquire()
+
+    def test_limit_grows_while_fully_used(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=8)
+        for _ in range(50):
+            self.fill(limiter)
+            for _ in range(limiter.in_flight):
+                limiter.release(0.01)
+        self.assertEqual(limiter.limit, 8)
+
+    def test_limit_does_not_grow_when_underused(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=8)
+        for _ in range(50):
+            limiter.acquire()
+            limiter.release(0.01)
+        self.assertEqual(limiter.limit, 4)
+
+    def test_congestion_backs_off(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=8, backoff=0.5)
+        limiter.acquire()
+        limiter.release(0.01, congested=True)
+        self.assertEqual(limiter.limit, 4)
+        for _ in range(5):
+            limiter.acquire()
+            limiter.release(congested=True)
+        self.assertEqual(limiter.limit, 1)
+        self.assertEqual(limiter.stats["congested"], 6)
+
+    def test_slow_response_counts_as_congestion(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=8, backoff=0.5)
+        for _ in range(10):
+            limiter.acquire()
+            limiter.release(0.1)
+        limiter.acquire()
+        limiter.release(0.5)
+        self.assertEqual(limiter.limit, 4)
+        # a burst of slow responses decreases the limit once
+        for _ in range(4):
+            limiter.acquire()
+            limiter.release(0.5)
+        self.assertEqual(limiter.limit, 4)
+
+    def test_slow_response_needs_enough_samples(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=8, min_samples=5)
+        limiter.acquire()
+        limiter.release(0.1)
+        limiter.acquire()
+        limiter.release(0.5)
+        self.assertEqual(limiter.limit, 8)
+
+    def test_limit_grows_under_low_latency_with_jitter(self) -> None:
+        rng = random.Random(0)
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=16)
+        for _ in range(200):
+            self.fill(limiter)
+            for _ in range(limiter.in_flight):
+                # 0.5 to 10 ms, many times the smoothed response time
+                limiter.release(rng.uniform(0.0005, 0.01))
+        self.assertEqual(limiter.limit, 16)
+        self.assertEqual(limiter.stats["congested"], 0)
+
+    def test_acquire_waits_for_a_slot(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+        limiter.acquire()
+        acquired = threading.Event()
+
+        def acquire():
+            limiter.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=acquire)
+        thread.start()
+        self.assertFalse(acquired.wait(0.05))
+        limiter.release(0.01)
+        self.assertTrue(acquired.wait(1))
+        thread.join()
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """CircuitBreaker unit tests"""
+
+    def setUp(self) -> None:
+        self.now = 0.0
+        self.breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10, clock=lambda: self.now)
+
+    def fail(self, times) -> None:
+        for _ in range(times):
+            self.breaker.before_request()
+            self.breaker.record(False)
+
+    def test_opens_after_consecutive_failures(self) -> None:
+        self.fail(2)
+        self.breaker.record(True)
+        self.fail(2)
+        self.assertEqual(self.breaker.state, "closed")
+        self.fail(1)
+        self.assertEqual(self.breaker.state, "open")
+        with self.assertRaises(CircuitOpenException):
+            self.breaker.before_request()
+        self.assertEqual(self.breaker.stats["rejected"], 1)
+
+    def test_half_open_probe_closes_on_success(self) -> None:
+        self.fail(3)
+        self.now += 10
+        self.assertEqual(self.breaker.state, "half_open")
+        self.breaker.before_request()
+        # only one probe at a time
+        with self.assertRaises(CircuitOpenException):
+            self.breaker.before_request()
+        self.breaker.record(True)
+        self.assertEqual(self.breaker.state, "closed")
+        self.breaker.before_request()
+
+    def test_half_open_probe_reopens_on_failure(self) -> None:
+        self.fail(3)
+        self.now += 10
+        self.fail(1)
+        self.assertEqual(self.breaker.state, "open")
+        self.assertEqual(self.breaker.stats["opened"], 2)
+
+    def test_abandoned_probe_frees_its_slot(self) -> None:
+        self.fail(3)
+        self.now += 10
+        self.breaker.before_request()
+        self.breaker.record(None)
+        self.breaker.before_request()
+
+
+class TestGuardedRequests(unittest.TestCase):
+    """Concurrency limiter and circuit breaker against a local server"""
+
+    def setUp(self) -> None:
+        self.server = LocalServer().__enter__()
+        configuration = Configuration(host=self.server.host)
+        configuration.connection_pool_maxsize = 8
+        configuration.adaptive_concurrency = True
+        configuration.circuit_breaker_failures = 2
+        configuration.circuit_breaker_reset_timeout = 0.1
+        self.api_client = ApiClient(configuration)
+        self.api = TimestampApi(self.api_client)
+        self.rest_client = self.api_client.rest_client
+
+    def tearDown(self) -> None:
+        self.api_client.close()
+        self.server.__exit__(None, None, None)
+
+    def test_in_flight_requests_stay_below_limit(self) -> None:
+        lock = threading.Lock()
+        in_flight = [0, 0]
+
+        def responder(path, query, headers):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+            return convert(path, query, headers)
+
+        self.server.responder = responder
+        limiter = self.rest_client.concurrency_limiter
+        results = list(self.api_client.imap(lambda s: self.api.convert_timestamp(s=s), range(40)))
+        self.assertEqual(len(results), 40)
+        self.assertLessEqual(in_flight[1], limiter.max_limit)
+        self.assertEqual(limiter.in_flight, 0)
+        self.assertEqual(limiter.max_limit, 8)
+
+    def test_throttling_lowers_limit(self) -> None:
+        self.server.responder = lambda path, query, headers: (429, {"Content-Type": "application/json"}, b'"false"')
+        limiter = self.rest_client.concurrency_limiter
+        before = limiter.limit
+        with self.assertRaises(ApiException):
+            self.api.convert_timestamp(s=0)
+        self.assertLess(limiter.limit, before)
+        # throttling is not a failure of the upstream
+        self.assertEqual(self.rest_client.circuit_breaker.state, "closed")
+
+    def test_rate_limit_wait_holds_no_concurrency_slot(self) -> None:
+        limiter = self.rest_client.concurrency_limiter
+        in_flight = []
+        self.rest_client.rate_limiter = mock.Mock()
+        self.rest_client.rate_limiter.acquire.side_effect = lambda: in_flight.append(limiter.in_flight)
+        self.assertEqual(self.api.convert_timestamp(s=0).to_dict(), "1970-01-01 00:00:00")
+        self.assertEqual(in_flight, [0])
+
+        # e.g. the flock file backend failing, or an interrupt while waiting
+        self.rest_client.rate_limiter.acquire.side_effect = OSError("rate limit file unavailable")
+        with self.assertRaises(OSError):
+            self.api.convert_timestamp(s=1)
+        self.assertEqual(limiter.in_flight, 0)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_breaker_fails_fast_then_recovers(self) -> None:
+        healthy = threading.Event()
+
+        def responder(path, query, headers):
+            if healthy.is_set():
+                return convert(path, query, headers)
+            return 500, {"Content-Type": "application/json"}, b'"false"'
+
+        self.server.responder = responder
+        for _ in range(2):
+            with self.assertRaises(ServiceException):
+                self.api.convert_timestamp(s=0)
+        with self.assertRaises(CircuitOpenException):
+            self.api.convert_timestamp(s=0)
+        self.assertEqual(len(self.server.requests), 2)
+
+        healthy.set()
+        time.sleep(0.1)
+        self.assertEqual(self.api.convert_timestamp(s=0).to_dict(), "1970-01-01 00:00:00")
+        self.assertEqual(self.rest_client.circuit_breaker.state, "closed")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+# coding: utf-8
+
+"""
+    Unix Timestamp Converter API
+
+    An API to convert between Unix timestamps and human-readable date strings
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import copy
+import pickle
+import unittest
+
+from api_sdk.api.timestamp_api import TimestampApi
+from api_sdk.api_client import ApiClient
+from api_sdk.configuration import Configuration, FrozenConfiguration
+from api_sdk.exceptions import ApiAttributeError
+from api_sdk.test.local_server import LocalServer
+
+
+def make_configuration(host="http://127.0.0.1:1") -> Configuration:
+    configuration = Configuration(host=host, api_key={"key": "secret"})
+    configuration.connection_pool_maxsize = 2
+    configuration.socket_options = [(6, 1, 1)]
+    return configuration
+
+
+class TestFrozenConfiguration(unittest.TestCase):
+    """FrozenConfiguration unit tests"""
+
+    def test_equal_configurations_give_equal_snapshots(self) -> None:
+        first, second = make_configuration().freeze(), make_configuration().freeze()
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+        self.assertNotEqual(first, make_configuration("http://other.test").freeze())
+
+    def test_snapshot_is_immutable(self) -> None:
+        configuration = make_configuration()
+        snapshot = configuration.freeze()
+        with self.assertRaises(ApiAttributeError):
+            snapshot.host = "http://other.test"
+        with self.assertRaises(TypeError):
+            snapshot.api_key["key"] = "changed"
+
+        configuration.api_key["key"] = "changed"
+        self.assertEqual(snapshot.api_key["key"], "secret")
+        self.assertEqual(snapshot.host, "http://127.0.0.1:1")
+        self.assertEqual(snapshot.socket_options, ((6, 1, 1),))
+        self.assertIs(snapshot.freeze(), snapshot)
+        self.assertIs(copy.deepcopy(snapshot), snapshot)
+
+    def test_snapshot_pickles_without_loggers(self) -> None:
+        configuration = make_configuration()
+        configuration.logger_file = None
+        snapshot = configuration.freeze()
+        restored = pickle.loads(pickle.dumps(snapshot))
+        self.assertIsInstance(restored, FrozenConfiguration)
+        self.assertEqual(restored, snapshot)
+        self.assertEqual(restored.api_key, {"key": "secret"})
+        self.assertIsNone(restored.logger)
+
+    def test_cannot_be_constructed_directly(self) -> None:
+        with self.assertRaises(TypeError):
+            FrozenConfiguration(host="http://127.0.0.1:1")
+
+    def test_clients_of_equal_snapshots_share_connection_pools(self) -> None:
+        first = ApiClient(make_configuration().freeze())
+        second = ApiClient(make_configuration().freeze())
+        other = ApiClient(make_configuration("http://other.test").freeze())
+        mutable = ApiClient(make_configuration())
+        self.assertIs(first.rest_client, second.rest_client)
+        self.assertIsNot(first.rest_client, other.rest_client)
+        self.assertIsNot(first.rest_client, mutable.rest_client)
+
+    def test_client_of_snapshot_sends_requests(self) -> None:
+        with LocalServer() as server:
+            snapshot = make_configuration(server.host).freeze()
+            for _ in range(3):
+                with ApiClient(snapshot) as api_client:
+                    self.assertEqual(TimestampApi(api_client).convert_timestamp(s=0).to_dict(), "1970-01-01 00:00:00")
+            self.assertEqual(server.connections, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
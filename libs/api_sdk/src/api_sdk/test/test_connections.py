@@ -0,0 +1,139 @@
+# coding: utf-8
+
+"""
+    Unix Timestamp Converter API
+
+    An API to convert between Unix timestamps and human-readable date strings
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import os
+import shutil
+import socket
+import tempfile
+import unittest
+from unittest import mock
+
+from api_sdk.api.timestamp_api import TimestampApi
+from api_sdk.api_client import ApiClient
+from api_sdk.configuration import Configuration
+from api_sdk import connections
+from api_sdk.connections import DNSCache
+from api_sdk.test.local_server import LocalServer, create_self_signed_cert
+
+
+class TestDNSCache(unittest.TestCase):
+    """DNSCache unit tests"""
+
+    def setUp(self) -> None:
+        self.now = 0.0
+        self.cache = DNSCache(ttl=10, clock=lambda: self.now)
+
+    def test_resolves_once_within_ttl(self) -> None:
+        with mock.patch("socket.getaddrinfo", wraps=socket.getaddrinfo) as getaddrinfo:
+            addresses = self.cache.resolve("localhost", 80)
+            self.assertEqual(self.cache.resolve("localhost", 80), addresses)
+            self.assertEqual(getaddrinfo.call_count, 1)
+            self.now += 10
+            self.cache.resolve("localhost", 80)
+            self.assertEqual(getaddrinfo.call_count, 2)
+            self.cache.forget("localhost", 80)
+            self.cache.resolve("localhost", 80)
+            self.assertEqual(getaddrinfo.call_count, 3)
+        self.assertTrue(addresses)
+
+    def test_ip_literals_are_not_resolved(self) -> None:
+        self.assertIsNone(self.cache.resolve("127.0.0.1", 80))
+        self.assertIsNone(self.cache.resolve("[::1]", 80))
+
+    def test_unresolvable_name(self) -> None:
+        self.assertIsNone(self.cache.resolve("does-not-exist.invalid", 80))
+
+
+class TestWarmUp(unittest.TestCase):
+    """ApiClient.warm_up against a local server"""
+
+    def setUp(self) -> None:
+        self.server = LocalServer().__enter__()
+        configuration = Configuration(host=self.server.host)
+        configuration.connection_pool_maxsize = 4
+        self.api_client = ApiClient(configuration)
+        self.api = TimestampApi(self.api_client)
+
+    def tearDown(self) -> None:
+        self.api_client.close()
+        self.server.__exit__(None, None, None)
+
+    def test_warm_up_opens_pooled_connections(self) -> None:
+        stats = self.api_client.warm_up(3)
+        self.assertEqual(stats["opened"], 3)
+        self.assertEqual(stats["failed"], 0)
+        self.assertEqual(stats["idle"], 3)
+        self.assertEqual(self.server.connections, 3)
+
+        response = self.api.convert_timestamp_with_http_info(s=0)
+        self.assertTrue(response.timings.reused)
+        self.assertEqual(self.server.connections, 3)
+        # already open connections are not opened again
+        self.assertEqual(self.api_client.warm_up()["opened"], 1)
+
+    def test_warm_up_is_bounded_by_pool_size(self) -> None:
+        self.assertEqual(self.api_client.warm_up(10)["opened"], 4)
+
+    def test_dns_cache_is_opt_in(self) -> None:
+        with mock.patch.object(connections.dns_cache, "resolve", return_value=None) as resolve:
+            self.api.convert_timestamp(s=0)
+            resolve.assert_not_called()
+
+            configuration = Configuration(host=self.server.host)
+            configuration.dns_cache = True
+            with ApiClient(configuration) as api_client:
+                TimestampApi(api_client).convert_timestamp(s=0)
+            resolve.assert_called_once()
+
+    def test_warm_up_failure_is_not_raised(self) -> None:
+        self.server.__exit__(None, None, None)
+        stats = self.api_client.warm_up(2)
+        self.assertEqual(stats["opened"], 0)
+        self.assertEqual(stats["failed"], 2)
+        self.server = LocalServer().__enter__()
+
+
+@unittest.skipUnless(shutil.which("openssl"), "requires the openssl command line tool")
+class TestTLSSessionResumption(unittest.TestCase):
+    """TLS session resumption against a local HTTPS server"""
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.mkdtemp()
+        certfile = os.path.join(self.tmp_dir, "localhost.pem")
+        create_self_signed_cert(certfile)
+        self.server = LocalServer(certfile=certfile).__enter__()
+        configuration = Configuration(host=self.server.host, ssl_ca_cert=certfile)
+        configuration.tls_session_resumption = True
+        self.api_client = ApiClient(configuration)
+        self.api = TimestampApi(self.api_client)
+
+    def tearDown(self) -> None:
+        self.api_client.close()
+        self.server.__exit__(None, None, None)
+        shutil.rmtree(self.tmp_dir)
+
+    def test_reconnect_resumes_session(self) -> None:
+        rest_client = self.api_client.rest_client
+        self.assertEqual(self.api.convert_timestamp(s=0).to_dict(), "1970-01-01 00:00:00")
+        rest_client.transport.clear()
+        response = self.api.convert_timestamp_with_http_info(s=0)
+        self.assertFalse(response.timings.reused)
+        self.assertEqual(rest_client.pool_stats()["tls"], {"handshakes": 2, "resumed": 1})
+
+    def test_resumption_is_opt_in(self) -> None:
+        configuration = Configuration(host=self.server.host, ssl_ca_cert=self.api_client.configuration.ssl_ca_cert)
+        api_client = ApiClient(configuration)
+        TimestampApi(api_client).convert_timestamp(s=0)
+        self.assertNotIn("tls", api_client.rest_client.pool_stats())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+# coding: utf-8
+
+"""
+    Unix Timestamp Converter API
+
+    An API to convert between Unix timestamps and human-readable date strings
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import threading
+import unittest
+
+from api_sdk.api.timestamp_api import TimestampApi
+from api_sdk.api_client import ApiClient
+from api_sdk.configuration import Configuration
+from api_sdk.exceptions import ApiValueError, NotFoundException
+from api_sdk.test.local_server import LocalServer, convert
+
+
+class TestConvertTimestamps(unittest.TestCase):
+    """TimestampApi.convert_timestamps tests against a local server"""
+
+    def setUp(self) -> None:
+        self.server = LocalServer().__enter__()
+        configuration = Configuration(host=self.server.host)
+        configuration.connection_pool_maxsize = 4
+        self.api_client = ApiClient(configuration)
+        self.api = TimestampApi(self.api_client)
+
+    def tearDown(self) -> None:
+        self.api_client.close()
+        self.server.__exit__(None, None, None)
+
+    def test_keeps_input_order(self) -> None:
+        timestamps = list(range(0, 3600 * 40, 3600))
+        results = list(self.api.convert_timestamps(timestamps, max_in_flight=8))
+        self.assertEqual(len(results), 40)
+        self.assertEqual(results[0].to_dict(), "1970-01-01 00:00:00")
+        self.assertEqual(results[39].to_dict(), "1970-01-02 15:00:00")
+        self.assertLessEqual(self.server.connections, 4)
+
+    def test_bounds_in_flight(self) -> None:
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def responder(path, query, headers):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            try:
+                threading.Event().wait(0.01)
+                return convert(path, query, headers)
+            finally:
+                with lock:
+                    state["active"] -= 1
+
+        self.server.responder = responder
+        consumed = []
+
+        def timestamps():
+            for ts in range(30):
+                consumed.append(ts)
+                yield ts
+
+        results = self.api.convert_timestamps(timestamps(), max_in_flight=3)
+        next(results)
+        # only a bounded window of the input has been pulled
+        self.assertLessEqual(len(consumed), 4)
+        self.assertEqual(len(list(results)), 29)
+        self.assertLessEqual(state["peak"], 3)
+
+    def test_raises_in_order(self) -> None:
+        self.api_client.configuration.host = self.server.host + "/missing"
+        results = self.api.convert_timestamps_with_http_info([0, 1])
+        with self.assertRaises(NotFoundException):
+            next(results)
+
+    def test_rejects_empty_window(self) -> None:
+        with self.assertRaises(ApiValueError):
+            self.api.convert_timestamps([0], max_in_flight=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+# coding: utf-8
+
+"""
+    Unix Timestamp Converter API
+
+    An API to convert between Unix timestamps and human-readable date strings
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import threading
+import time
+import unittest
+
+from api_sdk.api.timestamp_api import TimestampApi
+from api_sdk.api_client import ApiClient
+from api_sdk.configuration import Configuration
+from api_sdk.hedging import HedgingPolicy
+from api_sdk.test.local_server import LocalServer, convert
+
+
+class TestHedgingPolicy(unittest.TestCase):
+    """HedgingPolicy unit tests"""
+
+    def test_delay_follows_observed_percentile(self) -> None:
+        policy = HedgingPolicy(percentile=0.9, min_samples=10)
+        self.assertIsNone(policy.delay())
+        for latency in range(1, 101):
+            policy.observe(latency / 1000)
+        self.assertAlmostEqual(policy.delay(), 0.09, places=3)
+
+    def test_fixed_delay(self) -> None:
+        self.assertEqual(HedgingPolicy(delay=0.2).delay(), 0.2)
+
+    def test_budget_bounds_hedges(self) -> None:
+        policy = HedgingPolicy(delay=0, budget=0.25)
+        hedges = 0
+        for _ in range(100):
+            policy.delay()
+            hedges += policy.try_hedge()
+        self.assertEqual(hedges, 25)
+        self.assertEqual(policy.stats["hedges_sent"], 25)
+        self.assertEqual(policy.stats["requests"], 100)
+
+    def test_refused_hedge_is_refunded(self) -> None:
+        policy = HedgingPolicy(delay=0, budget=1)
+        policy.delay()
+        self.assertFalse(policy.try_hedge(lambda: False))
+        self.assertTrue(policy.try_hedge())
+        self.assertEqual(policy.hedges_sent, 1)
+
+
+class TestHedgedRequests(unittest.TestCase):
+    """Hedged requests against a local server"""
+
+    def setUp(self) -> None:
+        self.server = LocalServer().__enter__()
+        configuration = Configuration(host=self.server.host)
+        configuration.connection_pool_maxsize = 4
+        configuration.hedge_requests = True
+        configuration.hedge_delay = 0.05
+        configuration.hedge_budget = 1
+        self.api_client = ApiClient(configuration)
+        self.api = TimestampApi(self.api_client)
+        self.hedging = self.api_client.rest_client.hedging
+
+    def tearDown(self) -> None:
+        self.api_client.close()
+        self.server.__exit__(None, None, None)
+
+    def test_hedge_answers_slow_request(self) -> None:
+        lock = threading.Lock()
+        calls = []
+
+        def responder(path, query, headers):
+            with lock:
+                calls.append(path)
+                first = len(calls) == 1
+            if first:
+                time.sleep(1)
+            return convert(path, query, headers)
+
+        self.server.responder = responder
+        start = time.monotonic()
+        self.assertEqual(self.api.convert_timestamp(s=0).to_dict(), "1970-01-01 00:00:00")
+        self.assertLess(time.monotonic() - start, 0.9)
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(self.hedging.hedges_sent, 1)
+        self.assertEqual(self.hedging.hedges_won, 1)
+
+    def test_fast_request_is_not_hedged(self) -> None:
+        for ts in range(5):
+            self.api.convert_timestamp(s=ts)
+        self.assertEqual(len(self.server.requests), 5)
+        self.assertEqual(self.hedging.stats["hedges_sent"], 0)
+        self.assertEqual(self.hedging.stats["requests"], 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
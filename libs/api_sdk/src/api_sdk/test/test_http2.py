@@ -0,0 +1,139 @@
+# coding: utf-8
+
+"""
+    Unix Timestamp Converter API
+
+    An API to convert between Unix timestamps and human-readable date strings
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import importlib.util
+import io
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+
+import urllib3
+
+from api_sdk.api.timestamp_api import TimestampApi
+from api_sdk.api_client import ApiClient
+from api_sdk.configuration import Configuration
+from api_sdk.exceptions import ApiException, ApiValueError
+from api_sdk.rest import RESTClientObject, Transport
+from api_sdk.test.local_server import LocalHTTP2Server, convert
+
+HAS_H2 = importlib.util.find_spec("h2") is not None
+
+
+class RecordingTransport(Transport):
+    """Transport answering every request from memory"""
+
+    def __init__(self) -> None:
+        self.requests = []
+
+    def request(self, method, url, body=None, fields=None, encode_multipart=True,
+                timeout=None, headers=None, preload_content=True):
+        self.requests.append((method, url))
+        return urllib3.HTTPResponse(
+            body=io.BytesIO(b'"1970-01-01 00:00:00"'),
+            headers={"Content-Type": "application/json"},
+            status=200,
+            preload_content=preload_content,
+        )
+
+    def clear(self) -> None:
+        pass
+
+
+class TestTransport(unittest.TestCase):
+    """Pluggable transport tests"""
+
+    def test_custom_transport(self) -> None:
+        transport = RecordingTransport()
+        api_client = ApiClient(Configuration(host="http://example.invalid"))
+        api_client.rest_client = RESTClientObject(api_client.configuration, transport=transport)
+        result = TimestampApi(api_client).convert_timestamp(s=0)
+        self.assertEqual(result.to_dict(), "1970-01-01 00:00:00")
+        self.assertEqual(transport.requests, [
+            ("GET", "http://example.invalid/api/unix-timestamp-converter/?s=0"),
+        ])
+
+    def test_http2_requires_h2(self) -> None:
+        configuration = Configuration(host="http://example.invalid")
+        configuration.http2 = True
+        # a None entry makes the import fail as if h2 was not installed
+        with mock.patch.dict(sys.modules, {"h2": None}):
+            with self.assertRaisesRegex(ApiValueError, r"api-sdk\[http2\]"):
+                ApiClient(configuration)
+
+
+@unittest.skipUnless(HAS_H2, "requires h2")
+class TestHTTP2Transport(unittest.TestCase):
+    """HTTP/2 transport against a local h2c server"""
+
+    def setUp(self) -> None:
+        self.server = LocalHTTP2Server().__enter__()
+        configuration = Configuration(host=self.server.host)
+        configuration.http2 = True
+        self.api_client = ApiClient(configuration)
+        self.api = TimestampApi(self.api_client)
+        self.transport = self.api_client.rest_client.transport
+
+    def tearDown(self) -> None:
+        self.transport.clear()
+        self.api_client.close()
+        self.server.__exit__(None, None, None)
+
+    def test_convert_timestamp(self) -> None:
+        response = self.api.convert_timestamp_with_http_info(s=1672531200)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data.to_dict(), "2023-01-01 00:00:00")
+        self.assertEqual(response.headers["content-type"], "application/json")
+        self.assertFalse(response.timings.reused)
+        response = self.api.convert_timestamp_with_http_info(s=0)
+        self.assertTrue(response.timings.reused)
+
+    def test_concurrent_requests_share_one_connection(self) -> None:
+        def responder(path, query, headers):
+            time.sleep(0.2)
+            return convert(path, query, headers)
+
+        self.server.responder = responder
+        start = time.monotonic()
+        results = list(self.api_client.imap(
+            lambda s: self.api.convert_timestamp(s=s).to_dict(), range(16), max_in_flight=16
+        ))
+        self.assertLess(time.monotonic() - start, 1.5)
+        self.assertEqual(results[1], "1970-01-01 00:00:01")
+        self.assertEqual(self.server.connections, 1)
+        self.assertEqual(self.transport.connections, 1)
+
+    def test_error_status(self) -> None:
+        self.server.responder = lambda path, query, headers: (500, {"Content-Type": "application/json"}, b'"false"')
+        with self.assertRaises(ApiException) as context:
+            self.api.convert_timestamp(s=0)
+        self.assertEqual(context.exception.status, 500)
+
+    def test_read_timeout(self) -> None:
+        release = threading.Event()
+
+        def responder(path, query, headers):
+            release.wait(1)
+            return convert(path, query, headers)
+
+        self.server.responder = responder
+        with self.assertRaises(urllib3.exceptions.ReadTimeoutError):
+            self.api.convert_timestamp(s=0, _request_timeout=0.1)
+        release.set()
+        # the connection survives the cancelled stream
+        self.server.responder = convert
+        self.assertEqual(self.api.convert_timestamp(s=0).to_dict(), "1970-01-01 00:00:00")
+        self.assertEqual(self.server.connections, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
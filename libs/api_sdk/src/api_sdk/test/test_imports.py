@@ -0,0 +1,45 @@
+# coding: utf-8
+
+"""
+    Unix Timestamp Converter API
+
+    An API to convert between Unix timestamps and human-readable date strings
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import datetime
+import subprocess
+import sys
+import unittest
+
+from api_sdk.api_client import ApiClient
+
+
+class TestImports(unittest.TestCase):
+    """Startup import tests"""
+
+    def test_rarely_used_dependencies_are_deferred(self) -> None:
+        code = (
+            "import sys\n"
+            "from api_sdk import ApiClient, Configuration, TimestampApi\n"
+            "TimestampApi(ApiClient(Configuration()))\n"
+            "print(' '.join(m for m in ('dateutil', 'multiprocessing', 'asyncio') if m in sys.modules))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), "")
+
+    def test_dates_are_parsed_on_demand(self) -> None:
+        self.assertEqual(
+            ApiClient().deserialize('"2023-01-01T12:00:00"', "datetime", "application/json"),
+            datetime.datetime(2023, 1, 1, 12, 0, 0),
+        )
+        self.assertEqual(
+            ApiClient().deserialize('"2023-01-01"', "date", "application/json"),
+            datetime.date(2023, 1, 1),
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
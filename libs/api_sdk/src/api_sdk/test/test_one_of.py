@@ -0,0 +1,65 @@
+# coding: utf-8
+
+"""
+    Unix Timestamp Converter API
+
+    An API to convert between Unix timestamps and human-readable date strings
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import json
+import unittest
+
+from api_sdk.models.convert_timestamp200_response import ConvertTimestamp200Response
+from api_sdk.models.convert_timestamp_s_parameter import ConvertTimestampSParameter
+
+CORPUS = [
+    0, 1, -2208988800, 2**70, True, False, "", "2023-01-01 00:00:00", "false", "你好世界",
+    1.0, 1.5, None, [], [1], {}, {"a": 1},
+]
+
+
+class TestOneOfFastPath(unittest.TestCase):
+    """The single-parse path must build the same instances as the per-schema path"""
+
+    def assertSameOutcome(self, cls, make_fast, make_reference) -> None:
+        try:
+            expected = make_reference()
+        except ValueError as e:
+            with self.assertRaises(ValueError) as cm:
+                make_fast()
+            self.assertEqual(str(cm.exception), str(e))
+            return
+        actual = make_fast()
+        self.assertEqual(actual, expected)
+        self.assertEqual(actual.model_fields_set, expected.model_fields_set)
+        self.assertIs(type(actual.actual_instance), type(expected.actual_instance))
+        self.assertEqual(actual.to_json(), expected.to_json())
+
+    def test_from_dict_and_from_json(self) -> None:
+        for cls in (ConvertTimestamp200Response, ConvertTimestampSParameter):
+            for value in CORPUS:
+                json_str = json.dumps(value)
+                with self.subTest(cls=cls.__name__, value=value):
+                    self.assertSameOutcome(
+                        cls,
+                        lambda: cls.from_json(json_str),
+                        lambda: cls._from_json_each_schema(json_str),
+                    )
+                    self.assertSameOutcome(
+                        cls,
+                        lambda: cls.from_dict(value),
+                        lambda: cls._from_json_each_schema(json_str),
+                    )
+
+    def test_constructor(self) -> None:
+        self.assertEqual(ConvertTimestamp200Response(5).actual_instance, 5)
+        self.assertIs(ConvertTimestamp200Response(actual_instance=False).actual_instance, False)
+        with self.assertRaises(ValueError):
+            ConvertTimestampSParameter([1])
+
+
+if __name__ == '__main__':
+    unittest.main()
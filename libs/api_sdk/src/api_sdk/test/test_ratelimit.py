@@ -0,0 +1,71 @@
+# coding: utf-8
+
+"""
+    Unix Timestamp Converter API
+
+    An API to convert between Unix timestamps and human-readable date strings
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import multiprocessing
+import os
+import tempfile
+import unittest
+
+from api_sdk.ratelimit import FileBucketBackend, RateLimiter, parse_retry_after
+
+
+def _take_tokens(path, count, queue):
+    # negligible refill, only the initial burst can be taken
+    limiter = RateLimiter(0.001, burst=100, backend=FileBucketBackend(path))
+    queue.put(sum(1 for _ in range(count) if limiter.try_acquire() == 0))
+
+
+class TestRateLimiter(unittest.TestCase):
+    """RateLimiter unit tests"""
+
+    def setUp(self) -> None:
+        self.now = 1000.0
+        self.limiter = RateLimiter(10, burst=2, adaptive=True, clock=lambda: self.now)
+
+    def test_burst_then_rate(self) -> None:
+        self.assertEqual(self.limiter.try_acquire(), 0)
+        self.assertEqual(self.limiter.try_acquire(), 0)
+        self.assertAlmostEqual(self.limiter.try_acquire(), 0.1)
+        self.now += 0.1
+        self.assertEqual(self.limiter.try_acquire(), 0)
+
+    def test_retry_after_blocks_and_slows_down(self) -> None:
+        self.limiter.observe(429, {"Retry-After": "3"})
+        self.assertEqual(self.limiter.rate, 5)
+        self.assertAlmostEqual(self.limiter.try_acquire(), 3)
+        self.now += 3.2
+        self.assertEqual(self.limiter.try_acquire(), 0)
+
+        for _ in range(20):
+            self.limiter.observe(200, {})
+        self.assertEqual(self.limiter.rate, 10)
+
+    def test_parse_retry_after(self) -> None:
+        self.assertEqual(parse_retry_after("2"), 2)
+        self.assertEqual(parse_retry_after("Thu, 01 Jan 1970 00:00:10 GMT", now=4), 6)
+        self.assertIsNone(parse_retry_after("soon"))
+
+    def test_file_backend_shares_budget_across_processes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "bucket")
+            ctx = multiprocessing.get_context("spawn")
+            queue = ctx.Queue()
+            workers = [ctx.Process(target=_take_tokens, args=(path, 100, queue)) for _ in range(3)]
+            for worker in workers:
+                worker.start()
+            taken = sum(queue.get(timeout=30) for _ in workers)
+            for worker in workers:
+                worker.join()
+            self.assertEqual(taken, 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
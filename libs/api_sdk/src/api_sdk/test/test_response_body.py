@@ -0,0 +1,53 @@
+# coding: utf-8
+
+"""
+    Unix Timestamp Converter API
+
+    An API to convert between Unix timestamps and human-readable date strings
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import unittest
+
+from api_sdk.api.timestamp_api import TimestampApi
+from api_sdk.api_client import ApiClient
+from api_sdk.configuration import Configuration
+from api_sdk.exceptions import NotFoundException
+from api_sdk.test.local_server import LocalServer
+
+
+class TestResponseBody(unittest.TestCase):
+    """Parsing of the raw response body against a local server"""
+
+    def setUp(self) -> None:
+        self.server = LocalServer().__enter__()
+        self.api_client = ApiClient(Configuration(host=self.server.host))
+        self.api = TimestampApi(self.api_client)
+
+    def tearDown(self) -> None:
+        self.api_client.close()
+        self.server.__exit__(None, None, None)
+
+    def test_raw_response_body_is_parsed_by_charset(self) -> None:
+        response = self.api.convert_timestamp_with_http_info(s=0)
+        self.assertEqual(response.data.to_dict(), "1970-01-01 00:00:00")
+        self.assertIsInstance(response.raw_data, bytes)
+
+        self.server.responder = lambda path, query, headers: (
+            200, {"Content-Type": "application/json; charset=latin-1"}, '"d\xe9j\xe0"'.encode("latin-1")
+        )
+        self.assertEqual(self.api.convert_timestamp(s=0).to_dict(), "d\xe9j\xe0")
+
+    def test_error_body_is_decoded_on_access(self) -> None:
+        self.api_client.configuration.host = self.server.host + "/missing"
+        with self.assertRaises(NotFoundException) as raised:
+            self.api.convert_timestamp(s=0)
+        self.assertIsNone(raised.exception._body)
+        self.assertEqual(raised.exception.body, '"false"')
+        self.assertIn('HTTP response body: false', str(raised.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,231 @@
+# coding: utf-8
+
+"""
+    Unix Timestamp Converter API
+
+    An API to convert between Unix timestamps and human-readable date strings
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from api_sdk.api.timestamp_api import TimestampApi
+from api_sdk.api_client import ApiClient
+from api_sdk.cache import CachedResponse, PersistentResponseCache, ResponseCache
+from api_sdk.configuration import Configuration
+from api_sdk.exceptions import NotFoundException
+from api_sdk.rest import RESTResponse
+from api_sdk.test.local_server import LocalServer, convert
+
+
+class TestResponseCache(unittest.TestCase):
+    """ResponseCache unit tests"""
+
+    def setUp(self) -> None:
+        self.now = 0.0
+        self.cache = ResponseCache(maxsize=2, ttl=10, clock=lambda: self.now)
+
+    def test_hit_and_miss(self) -> None:
+        self.assertIsNone(self.cache.get("a"))
+        self.cache.set("a", 1)
+        self.assertEqual(self.cache.get("a"), 1)
+        self.assertEqual(self.cache.stats["hits"], 1)
+        self.assertEqual(self.cache.stats["misses"], 1)
+
+    def test_lru_eviction(self) -> None:
+        self.cache.set("a", 1)
+        self.cache.set("b", 2)
+        self.cache.get("a")
+        self.cache.set("c", 3)
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual(self.cache.get("a"), 1)
+        self.assertEqual(self.cache.stats["evictions"], 1)
+        self.assertEqual(len(self.cache), 2)
+
+    def test_ttl_expiry(self) -> None:
+        self.cache.set("a", 1)
+        self.now = 9.9
+        self.assertEqual(self.cache.get("a"), 1)
+        self.now = 10.0
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(self.cache.stats["expirations"], 1)
+        self.assertEqual(len(self.cache), 0)
+
+
+def response(body=b"1", headers=None):
+    return CachedResponse(200, "OK", {"Content-Type": "application/json", **(headers or {})}, body)
+
+
+class TestPersistentResponseCache(unittest.TestCase):
+    """PersistentResponseCache unit tests"""
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "responses.sqlite3")
+        self.now = 0.0
+        self.cache = self.open()
+
+    def tearDown(self) -> None:
+        self.cache.close()
+        shutil.rmtree(self.tmp_dir)
+
+    def open(self, **kwargs):
+        kwargs.setdefault("maxsize", 2)
+        kwargs.setdefault("ttl", 10)
+        return PersistentResponseCache(self.path, clock=lambda: self.now, **kwargs)
+
+    def test_survives_reopening(self) -> None:
+        self.assertIsNone(self.cache.get(("GET", "/a")))
+        self.cache.set(("GET", "/a"), response(b"a", {"ETag": '"1"'}))
+        self.cache.close()
+        self.cache = self.open()
+        cached = self.cache.get(("GET", "/a"))
+        self.assertEqual((cached.status, cached.reason, cached.data), (200, "OK", b"a"))
+        # header names stay case-insensitive
+        self.assertEqual(cached.headers["etag"], '"1"')
+        self.assertEqual(self.cache.stats["hits"], 1)
+
+    def test_lru_eviction(self) -> None:
+        self.cache.set("a", response())
+        self.now = 1
+        self.cache.set("b", response())
+        self.now = 2
+        self.cache.get("a")
+        self.cache.set("c", response())
+        self.assertIsNone(self.cache.get("b"))
+        self.assertIsNotNone(self.cache.get("a"))
+        self.assertEqual(self.cache.stats["evictions"], 1)
+        self.assertEqual(len(self.cache), 2)
+
+    def test_size_bounded_eviction(self) -> None:
+        self.cache.close()
+        self.cache = self.open(maxsize=10, max_bytes=5)
+        for i, key in enumerate("abc"):
+            self.now = i
+            self.cache.set(key, response(b"12"))
+        self.assertEqual(self.cache.stats["bytes"], 4)
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(self.cache.stats["evictions"], 1)
+
+    def test_expired_entry_without_validators_is_dropped(self) -> None:
+        self.cache.set("a", response())
+        self.now = 10
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(self.cache.validators("a"), {})
+        self.assertEqual(self.cache.stats["expirations"], 1)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_revalidation(self) -> None:
+        self.cache.set("a", response(b"a", {"ETag": '"1"', "Last-Modified": "Sun, 01 Jan 2023 00:00:00 GMT"}))
+        self.now = 10
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(self.cache.validators("a"), {
+            "If-None-Match": '"1"',
+            "If-Modified-Since": "Sun, 01 Jan 2023 00:00:00 GMT",
+        })
+        not_modified = RESTResponse(CachedResponse(304, "Not Modified", {"ETag": '"2"', "Content-Length": "0"}, b""))
+        refreshed = self.cache.revalidate("a", not_modified)
+        self.assertEqual(refreshed.data, b"a")
+        self.assertEqual(refreshed.headers["ETag"], '"2"')
+        self.assertEqual(refreshed.headers["Content-Type"], "application/json")
+        self.assertNotIn("Content-Length", refreshed.headers)
+        self.assertEqual(self.cache.get("a").data, b"a")
+        self.assertEqual(self.cache.stats["revalidations"], 1)
+        self.assertIsNone(self.cache.revalidate("b", not_modified))
+
+
+class TestResponseCacheClient(unittest.TestCase):
+    """ApiClient with an in-memory response cache against a local server"""
+
+    def setUp(self) -> None:
+        self.server = LocalServer().__enter__()
+        self.api_client = ApiClient(Configuration(host=self.server.host))
+        self.api_client.response_cache = ResponseCache(maxsize=8)
+        self.api = TimestampApi(self.api_client)
+
+    def tearDown(self) -> None:
+        self.api_client.close()
+        self.server.__exit__(None, None, None)
+
+    def test_honors_cached_parameter(self) -> None:
+        first = self.api.convert_timestamp_with_http_info(cached="", s=0)
+        second = self.api.convert_timestamp_with_http_info(cached="", s=0)
+        self.assertEqual(first.data.to_dict(), second.data.to_dict())
+        self.assertEqual(second.raw_data, b'"1970-01-01 00:00:00"')
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual(self.api_client.response_cache.stats["hits"], 1)
+
+        # without `cached` the cache is bypassed
+        self.api.convert_timestamp(s=0)
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_skips_errors(self) -> None:
+        self.api_client.configuration.host = self.server.host + "/missing"
+        for _ in range(2):
+            with self.assertRaises(NotFoundException):
+                self.api.convert_timestamp(cached="", s=0)
+        self.assertEqual(len(self.server.requests), 2)
+
+
+class TestPersistentResponseCacheClient(unittest.TestCase):
+    """ApiClient with a persistent response cache against a local server"""
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.mkdtemp()
+        self.statuses = []
+        self.server = LocalServer(self.respond).__enter__()
+        self.configuration = Configuration(host=self.server.host)
+        self.configuration.response_cache_maxsize = 16
+        self.configuration.response_cache_ttl = 60
+        self.configuration.response_cache_file = os.path.join(self.tmp_dir, "responses.sqlite3")
+
+    def tearDown(self) -> None:
+        self.server.__exit__(None, None, None)
+        shutil.rmtree(self.tmp_dir)
+
+    def respond(self, path, query, headers):
+        status, response_headers, body = convert(path, query, headers)
+        etag = '"%s"' % query["s"][0]
+        if headers.get("If-None-Match") == etag:
+            status, body = 304, b""
+        self.statuses.append(status)
+        return status, {**response_headers, "ETag": etag}, body
+
+    def convert(self, s):
+        with ApiClient(self.configuration) as api_client:
+            return TimestampApi(api_client).convert_timestamp_with_http_info(cached="", s=s)
+
+    def test_repeat_run_is_served_from_disk(self) -> None:
+        self.assertEqual(self.convert(0).data.to_dict(), "1970-01-01 00:00:00")
+        # a new client, as in the next test run
+        response = self.convert(0)
+        self.assertEqual(response.data.to_dict(), "1970-01-01 00:00:00")
+        self.assertIsNone(response.timings)
+        self.assertEqual(self.statuses, [200])
+
+    def test_responses_are_cached_per_credentials(self) -> None:
+        with ApiClient(self.configuration) as api_client:
+            api = TimestampApi(api_client)
+            for token in ("Bearer a", "Bearer b", "Bearer a"):
+                api.convert_timestamp(cached="", s=0, _headers={"Authorization": token})
+        self.assertEqual(self.statuses, [200, 200])
+        with open(self.configuration.response_cache_file, "rb") as f:
+            self.assertNotIn(b"Bearer", f.read())
+
+    def test_expired_response_is_revalidated(self) -> None:
+        # stale as soon as it is stored
+        self.configuration.response_cache_ttl = 0
+        self.convert(0)
+        response = self.convert(0)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data.to_dict(), "1970-01-01 00:00:00")
+        self.assertEqual(self.statuses, [200, 304])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+# coding: utf-8
+
+"""
+    Unix Timestamp Converter API
+
+    An API to convert between Unix timestamps and human-readable date strings
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import asyncio
+import threading
+import time
+import unittest
+
+from api_sdk.api.timestamp_api import TimestampApi
+from api_sdk.api_client import ApiClient
+from api_sdk.configuration import Configuration
+from api_sdk.singleflight import AsyncSingleFlight, SingleFlight
+from api_sdk.test.local_server import LocalServer, convert
+
+
+class TestSingleFlightClient(unittest.TestCase):
+    """ApiClient coalescing identical requests against a local server"""
+
+    def setUp(self) -> None:
+        self.release = threading.Event()
+        self.server = LocalServer(self.respond).__enter__()
+        configuration = Configuration(host=self.server.host)
+        configuration.connection_pool_maxsize = 4
+        self.api_client = ApiClient(configuration)
+        self.api_client.single_flight = SingleFlight()
+        self.api = TimestampApi(self.api_client)
+
+    def tearDown(self) -> None:
+        self.release.set()
+        self.api_client.close()
+        self.server.__exit__(None, None, None)
+
+    def respond(self, path, query, headers):
+        self.release.wait(5)
+        return convert(path, query, headers)
+
+    def run_concurrently(self, targets, ready) -> None:
+        threads = [threading.Thread(target=target) for target in targets]
+        for thread in threads:
+            thread.start()
+        deadline = time.monotonic() + 5
+        while not ready() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.release.set()
+        for thread in threads:
+            thread.join()
+
+    def test_coalesces_identical_requests(self) -> None:
+        results = []
+        self.run_concurrently(
+            [lambda: results.append(self.api.convert_timestamp_with_http_info(s=0))] * 5,
+            lambda: self.api_client.single_flight.shared >= 4,
+        )
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual(len(results), 5)
+        self.assertTrue(all(res is results[0] for res in results))
+        self.assertEqual(results[0].data.to_dict(), "1970-01-01 00:00:00")
+
+    def test_does_not_coalesce_requests_with_different_headers(self) -> None:
+        self.run_concurrently(
+            [
+                lambda token=token: self.api.convert_timestamp(s=0, _headers={"Authorization": token})
+                for token in ("Bearer a", "Bearer b")
+            ],
+            lambda: len(self.server.requests) >= 2,
+        )
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(self.api_client.single_flight.shared, 0)
+
+
+class TestAsyncSingleFlight(unittest.IsolatedAsyncioTestCase):
+    """AsyncSingleFlight unit tests"""
+
+    def setUp(self) -> None:
+        self.single_flight = AsyncSingleFlight()
+        self.release = asyncio.Event()
+        self.started = []
+        self.cancelled = []
+
+    async def call(self):
+        self.started.append(True)
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled.append(True)
+            raise
+        return len(self.started)
+
+    async def test_shares_one_call(self) -> None:
+        tasks = [asyncio.create_task(self.single_flight.do("a", self.call)) for _ in range(3)]
+        await asyncio.sleep(0)
+        self.release.set()
+        self.assertEqual(await asyncio.gather(*tasks), [1, 1, 1])
+        self.assertEqual((self.single_flight.calls, self.single_flight.shared), (1, 2))
+
+    async def test_cancelled_leader_does_not_fail_waiters(self) -> None:
+        leader = asyncio.create_task(self.single_flight.do("a", self.call))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(self.single_flight.do("a", self.call))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await leader
+        self.release.set()
+        self.assertEqual(await waiter, 1)
+        self.assertEqual(self.cancelled, [])
+
+    async def test_call_is_cancelled_without_waiters(self) -> None:
+        leader = asyncio.create_task(self.single_flight.do("a", self.call))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await leader
+        await asyncio.sleep(0)
+        self.assertEqual(self.cancelled, [True])
+
+        # the next caller starts a new call
+        self.release.set()
+        self.assertEqual(await self.single_flight.do("a", self.call), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+# coding: utf-8
+
+"""
+    Unix Timestamp Converter API
+
+    An API to convert between Unix timestamps and human-readable date strings
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import unittest
+
+from api_sdk.api.timestamp_api import TimestampApi
+from api_sdk.api_client import ApiClient
+from api_sdk.cache import ResponseCache
+from api_sdk.configuration import Configuration
+from api_sdk.test.local_server import LocalServer
+
+
+class TestRequestTimings(unittest.TestCase):
+    """Per-request timing breakdown against a local server"""
+
+    def setUp(self) -> None:
+        self.server = LocalServer().__enter__()
+        self.api_client = ApiClient(Configuration(host=self.server.host))
+        self.api = TimestampApi(self.api_client)
+
+    def tearDown(self) -> None:
+        self.api_client.close()
+        self.server.__exit__(None, None, None)
+
+    def test_records_request_timings(self) -> None:
+        first = self.api.convert_timestamp_with_http_info(s=0).timings
+        second = self.api.convert_timestamp_with_http_info(s=1).timings
+        self.assertFalse(first.reused)
+        self.assertTrue(second.reused)
+        self.assertGreater(first.connecting, 0)
+        self.assertEqual(first.tls_handshaking, 0)
+        self.assertEqual(second.connecting, 0)
+        for timings in (first, second):
+            self.assertLessEqual(timings.start, timings.checkout)
+            self.assertLess(timings.checkout, timings.first_byte)
+            self.assertLessEqual(timings.first_byte, timings.end)
+            self.assertAlmostEqual(
+                timings.duration,
+                timings.blocked + timings.connecting + timings.waiting + timings.receiving,
+            )
+
+    def test_cached_response_has_no_timings(self) -> None:
+        self.api_client.response_cache = ResponseCache(maxsize=8)
+        self.assertIsNotNone(self.api.convert_timestamp_with_http_info(cached="", s=0).timings)
+        self.assertIsNone(self.api.convert_timestamp_with_http_info(cached="", s=0).timings)
+
+
+if __name__ == '__main__':
+    unittest.main()
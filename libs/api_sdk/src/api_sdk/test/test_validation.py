@@ -0,0 +1,46 @@
+# coding: utf-8
+
+"""
+    Unix Timestamp Converter API
+
+    An API to convert between Unix timestamps and human-readable date strings
+
+    The version of the OpenAPI document: 1.0.0
+"""  # noqa: E501
+
+
+import inspect
+import unittest
+
+from pydantic import ValidationError
+
+from api_sdk.api.timestamp_api import TimestampApi
+from api_sdk.api_client import ApiClient
+from api_sdk.configuration import Configuration
+from api_sdk.test.local_server import LocalServer
+
+
+class TestValidateCall(unittest.TestCase):
+    """Opt-out argument validation against a local server"""
+
+    def setUp(self) -> None:
+        self.server = LocalServer().__enter__()
+        self.api_client = ApiClient(Configuration(host=self.server.host))
+        self.api = TimestampApi(self.api_client)
+
+    def tearDown(self) -> None:
+        self.api_client.close()
+        self.server.__exit__(None, None, None)
+
+    def test_client_side_validation_can_be_disabled(self) -> None:
+        with self.assertRaises(ValidationError):
+            self.api.convert_timestamp(cached=1, s="0")
+
+        self.api_client.client_side_validation = False
+        self.assertEqual(self.api.convert_timestamp(cached=1, s="0").to_dict(), "1970-01-01 00:00:00")
+        self.assertEqual(self.server.requests[-1], "/api/unix-timestamp-converter/?cached=1&s=0")
+        self.assertIn("cached", inspect.signature(TimestampApi.convert_timestamp).parameters)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+# coding: utf-8
+
+"""
+    Unix Timestamp Converter API
+
+    An API to convert between Unix timestamps and human-readable date strings
+
+    The version of the OpenAPI document: 1.0.0
+
+    Per-request latency breakdown recorded by the REST transports.
+"""  # noqa: E501
+
+
+import time
+from typing import Dict, Optional
+
+clock = time.perf_counter
+
+
+class RequestTimings:
+    """High-resolution timestamps of the phases of one HTTP request.
+
+    Timestamps are `time.perf_counter()` values, None for phases that did
+    not happen (e.g. connecting on a reused keep-alive connection). The
+    durations mirror the `http_req_*` metrics reported by k6.
+
+    Once the body was read, the response size is recorded too: the bytes
+    received for the body, as sent by the server, and the bytes after
+    decoding its `content_encoding`.
+
+    :param start: when the transport received the request.
+    """
+
+    __slots__ = (
+        "start",
+        "checkout",
+        "connect_start",
+        "tcp_connected",
+        "connect_end",
+        "first_byte",
+        "end",
+        "content_encoding",
+        "received_bytes",
+        "body_bytes",
+    )
+
+    def __init__(self, start=None) -> None:
+        self.start = clock() if start is None else start
+        self.checkout = None
+        self.connect_start = None
+        self.tcp_connected = None
+        self.connect_end = None
+        self.first_byte = None
+        self.end = None
+        self.content_encoding = None
+        self.received_bytes = None
+        self.body_bytes = None
+
+    def __repr__(self) -> str:
+        return "RequestTimings(%s)" % ", ".join(
+            "%s=%.3fms" % (name, value * 1000)
+            for name, value in self.as_dict().items()
+            if value is not None
+        )
+
+    @staticmethod
+    def _delta(begin, end):
+        if begin is None or end is None:
+            return None
+        return end - begin
+
+    @property
+    def reused(self) -> bool:
+        """Whether the request was sent on an already open connection."""
+        return self.connect_start is None
+
+    @property
+    def blocked(self):
+        """Seconds spent waiting for the rate limiter and a free connection."""
+        return self._delta(self.start, self.checkout)
+
+    @property
+    def connecting(self):
+        """Seconds spent opening the TCP connection, 0 when reused.
+
+        Includes the TLS handshake when the transport cannot tell them apart.
+        The phases add up to `duration`.
+        """
+        if self.reused:
+            return 0.0
+        return self._delta(self.checkout, self.tcp_connected or self.connect_end)
+
+    @property
+    def tls_handshaking(self):
+        """Seconds spent in the TLS handshake, 0 when reused or plain HTTP."""
+        if self.reused or self.tcp_connected is None:
+            return 0.0
+        return self._delta(self.tcp_connected, self.connect_end)
+
+    @property
+    def waiting(self):
+        """Seconds from sending the request to receiving the response head."""
+        sent = self.checkout if self.reused else self.connect_end
+        return self._delta(sent, self.first_byte)
+
+    @property
+    def receiving(self):
+        """Seconds spent reading the response body."""
+        return self._delta(self.first_byte, self.end)
+
+    @property
+    def duration(self):
+        """Seconds from the start of the request to the end of the body."""
+        return self._delta(self.start, self.end)
+
+    @property
+    def compression_ratio(self):
+        """Decoded body size per received byte, None before the body was read."""
+        if not self.received_bytes or self.body_bytes is None:
+            return None
+        return self.body_bytes / self.received_bytes
+
+    def as_dict(self) -> Dict[str, Optional[float]]:
+        """Returns the durations in seconds, keyed by k6 metric suffix."""
+        return {
+            "blocked": self.blocked,
+            "connecting": self.connecting,
+            "tls_handshaking": self.tls_handshaking,
+            "waiting": self.waiting,
+            "receiving": self.receiving,
+            "duration": self.duration,
+        }
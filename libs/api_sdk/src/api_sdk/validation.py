@@ -0,0 +1,47 @@
+# coding: utf-8
+
+"""
+    Unix Timestamp Converter API
+
+    An API to convert between Unix timestamps and human-readable date strings
+
+    The version of the OpenAPI document: 1.0.0
+
+    Opt-out argument validation for the API operations.
+"""  # noqa: E501
+
+
+import functools
+import inspect
+
+import pydantic
+
+
+def validate_call(func):
+    """`pydantic.validate_call` that can be switched off per API client.
+
+    Arguments are validated unless `client_side_validation` is disabled on
+    the `api_client` of the API instance, in which case the undecorated
+    operation is called directly. The signature of the operation is kept
+    unchanged, and the original function stays reachable as `raw_function`.
+
+    :param func: API operation, a method of an API class.
+    :return: the wrapped operation.
+    """
+    validated = None
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        nonlocal validated
+        if not self.api_client.client_side_validation:
+            return func(self, *args, **kwargs)
+        if validated is None:
+            # building the validator is costly, do it on the first
+            # validated call rather than at import time
+            validated = pydantic.validate_call(func)
+        return validated(self, *args, **kwargs)
+
+    if inspect.iscoroutinefunction(func):
+        inspect.markcoroutinefunction(wrapper)
+    wrapper.raw_function = func
+    return wrapper
@@ -0,0 +1,52 @@
+"""
+Benchmark the integer date formatting of the reference server and of the
+test suite's `time_tools` against `datetime.fromtimestamp(...).strftime`.
+Their agreement with `datetime` is tested in packages/api/tests/test_converter.py.
+
+Run with: uv run --package api -- python packages/api/benchmarks/bench_format_timestamp.py
+"""
+
+import sys
+from datetime import UTC, datetime
+from pathlib import Path
+
+from api.converter import format_timestamp
+from timing import per_call, report
+
+# the test utilities are imported from the repository root like in the tests
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+from packages.api.tests.utils.time_tools import unix_to_datetime_string
+
+SWEEPS = {"pre-epoch": -1_234_567_890, "2038": 2**31 - 1, "year 3000": 32_503_680_000}
+
+
+def strftime(timestamp: int, fmt: str = "%Y-%m-%d %I:%M:%S") -> str | bool:
+    """Format with `datetime`, False outside its range like `format_timestamp`."""
+    try:
+        return datetime.fromtimestamp(timestamp, UTC).strftime(fmt)
+    except (ValueError, OverflowError):
+        return False
+
+
+def reference_24h(timestamp: int) -> str | bool:
+    """The previous `time_tools.unix_to_datetime_string`, which renders hour 0 as 12."""
+    dt = datetime.fromtimestamp(timestamp, UTC)
+    return dt.strftime("%Y-%m-%d 12:%M:%S" if dt.hour == 0 else "%Y-%m-%d %H:%M:%S")
+
+
+def main() -> None:
+    for sweep, timestamp in SWEEPS.items():
+        report(
+            f"{sweep}: {timestamp} -> {format_timestamp(timestamp)!r}",
+            ("format_timestamp", per_call(lambda timestamp=timestamp: format_timestamp(timestamp))),
+            ("fromtimestamp().strftime()", per_call(lambda timestamp=timestamp: strftime(timestamp))),
+        )
+        report(
+            f"{sweep}: time_tools, 24h",
+            ("unix_to_datetime_string", per_call(lambda timestamp=timestamp: unix_to_datetime_string(timestamp))),
+            ("fromtimestamp().strftime()", per_call(lambda timestamp=timestamp: reference_24h(timestamp))),
+        )
+
+
+if __name__ == "__main__":
+    main()
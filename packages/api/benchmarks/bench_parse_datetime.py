@@ -0,0 +1,133 @@
+"""
+Benchmark the single-pass date string parser of the reference server against
+`datetime.strptime` and `dateutil.parser.parse`, after checking that all three
+agree on a fuzz corpus of the forms the API tests exercise.
+
+Run with: uv run --package api -- python packages/api/benchmarks/bench_parse_datetime.py
+"""
+
+import random
+import sys
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+
+from api.parsing import parse_datetime
+from dateutil import parser as dateutil_parser
+from timing import per_call, report
+
+CORPUS_SIZE = 20_000
+# invalid for the API and for both references
+INVALID = [
+    "foo",
+    "",
+    "   ",
+    "2023-01-01 25:00:00",
+    "2023-01-01 10:60:00",
+    "ünïcødé",
+    "2023-01-01 13:00:00 PM",
+    "0000-01-01 00:00:00",
+]
+
+
+def render(dt: datetime, form: str, rng: random.Random) -> tuple[str, str, datetime]:
+    """Render `dt` in one of the accepted forms, with its strptime format and expected value."""
+    if form == "canonical":
+        return dt.strftime("%Y-%m-%d %H:%M:%S"), "%Y-%m-%d %H:%M:%S", dt
+    if form == "date":
+        return dt.strftime("%Y-%m-%d"), "%Y-%m-%d", dt.replace(hour=0, minute=0, second=0)
+    if form == "single digit":
+        return f"{dt.year}-{dt.month}-{dt.day}", "%Y-%m-%d", dt.replace(hour=0, minute=0, second=0)
+    if form == "slash":
+        return dt.strftime("%Y/%m/%d"), "%Y/%m/%d", dt.replace(hour=0, minute=0, second=0)
+    if form == "missing seconds":
+        return dt.strftime("%Y-%m-%d %H:%M"), "%Y-%m-%d %H:%M", dt.replace(second=0)
+    if form == "offset":
+        minutes = rng.randrange(-12 * 60, 14 * 60 + 1, 15)
+        sign, hours = "-" if minutes < 0 else "+", divmod(abs(minutes), 60)
+        value = dt.strftime("%Y-%m-%d %H:%M:%S") + f"{sign}{hours[0]:02d}:{hours[1]:02d}"
+        return value, "%Y-%m-%d %H:%M:%S%z", dt - timedelta(minutes=minutes)
+    if form == "12h":
+        hour = (dt.hour + 11) % 12 + 1
+        return dt.strftime(f"%Y-%m-%d {hour}:%M:%S %p"), "%Y-%m-%d %I:%M:%S %p", dt
+    raise ValueError(form)
+
+
+FORMS = ["canonical", "date", "single digit", "slash", "missing seconds", "offset", "12h"]
+STRPTIME_FORMATS = {form: render(datetime(2023, 1, 1, tzinfo=UTC), form, random.Random())[1] for form in FORMS}
+
+
+def to_unix(dt: datetime) -> int:
+    """Unix timestamp of `dt`, in UTC unless it is aware, like `time_tools.datetime_string_to_unix`."""
+    return int(dt.replace(tzinfo=dt.tzinfo or UTC).timestamp())
+
+
+def strptime_parse(value: str) -> int | None:
+    """Try the strptime format of every form in turn."""
+    for fmt in STRPTIME_FORMATS.values():
+        try:
+            return to_unix(datetime.strptime(value, fmt))
+        except ValueError:
+            continue
+    return None
+
+
+def dateutil_parse(value: str) -> int | None:
+    """Parse with dateutil's format detection."""
+    try:
+        return to_unix(dateutil_parser.parse(value))
+    except (ValueError, OverflowError):
+        return None
+
+
+def corpus(size: int, seed: int = 0) -> list[tuple[str, int | None]]:
+    """Random dates in the years 1000 to 9999 in every form, and invalid values."""
+    rng = random.Random(seed)
+    start = datetime(1000, 1, 1, tzinfo=UTC)
+    seconds = int((datetime(9999, 12, 31, tzinfo=UTC) - start).total_seconds())
+    cases: list[tuple[str, int | None]] = [(value, None) for value in INVALID]
+    for _ in range(size):
+        dt = start + timedelta(seconds=rng.randrange(seconds))
+        value, _, expected = render(dt, rng.choice(FORMS), rng)
+        cases.append((value, to_unix(expected)))
+    return cases
+
+
+def check(parsers: dict[str, Callable[[str], int | None]]) -> bool:
+    """Check that every parser returns the expected result on the fuzz corpus."""
+    ok = True
+    for value, expected in corpus(CORPUS_SIZE):
+        for name, parse in parsers.items():
+            result = parse(value)
+            if result != expected:
+                print(f"MISMATCH {name}({value!r}) = {result}, expected {expected}")
+                ok = False
+    # the API rolls non-existent days over into the next month, the references reject them
+    if parse_datetime("2023-02-29") != parse_datetime("2023-03-01") or parse_datetime("2023-04-31 12:00") is None:
+        print("MISMATCH day overflow")
+        ok = False
+    return ok
+
+
+def main() -> None:
+    parsers = {"parse_datetime": parse_datetime, "strptime": strptime_parse, "dateutil": dateutil_parse}
+    if not check(parsers):
+        sys.exit(1)
+    print(f"{CORPUS_SIZE + len(INVALID)} fuzzed values parsed identically\n")
+
+    rng = random.Random(1)
+    dt = datetime(2023, 7, 14, 15, 4, 5, tzinfo=UTC)
+    for form in FORMS:
+        value, fmt, _ = render(dt, form, rng)
+        report(
+            f"{form}: {value!r}",
+            ("parse_datetime", per_call(lambda value=value: parse_datetime(value))),
+            (f"strptime({fmt!r})", per_call(lambda value=value, fmt=fmt: to_unix(datetime.strptime(value, fmt)))),
+            (
+                "dateutil.parser.parse",
+                per_call(lambda value=value: to_unix(dateutil_parser.parse(value)), number=2_000),
+            ),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""Shared helpers for the reference server micro-benchmarks."""
+
+import timeit
+from collections.abc import Callable
+
+
+def per_call(func: Callable[[], object], number: int = 20_000, repeat: int = 5) -> float:
+    """
+    Measure the best per-call time of `func` in microseconds.
+
+    Args:
+        func: The callable to measure.
+        number: Calls per timing run.
+        repeat: Number of timing runs, the fastest one is reported.
+
+    Returns:
+        Microseconds per call of the fastest run.
+    """
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e6
+
+
+def report(title: str, candidate: tuple[str, float], *baselines: tuple[str, float]) -> None:
+    """
+    Print a candidate's time per call and its speedup over each baseline.
+
+    Args:
+        title: Name of the benchmark.
+        candidate: Label and per-call microseconds of the optimized path.
+        baselines: Labels and per-call microseconds of the reference paths.
+    """
+    cand_label, cand_us = candidate
+    print(f"{title}")
+    for base_label, base_us in baselines:
+        print(f"  {base_label:<40} {base_us:10.2f} us/call  ({base_us / cand_us:.1f}x)")
+    print(f"  {cand_label:<40} {cand_us:10.2f} us/call")
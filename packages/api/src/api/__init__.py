@@ -0,0 +1,3 @@
+from api.server import main
+
+__all__ = ["main"]
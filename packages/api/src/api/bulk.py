@@ -0,0 +1,148 @@
+import json
+import sys
+from array import array
+from collections.abc import Sequence
+
+from api.converter import ConversionResult, convert, format_timestamp
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, see the `numpy` extra
+    np = None  # type: ignore[assignment]
+
+INT64_MIN = -(2**63)
+INT64_MAX = 2**63 - 1
+# 1000-01-01 00:00:00 to 9999-12-31 23:59:59, numpy renders years with four
+# digits like strftime only within this range
+VECTOR_MIN = -30610224000
+VECTOR_MAX = 253402300799
+
+
+class BulkRequestError(ValueError):
+    """The body of a bulk request is malformed."""
+
+
+def parse_json(body: bytes) -> list[int | str]:
+    """
+    Parse a JSON bulk request body.
+
+    Args:
+        body: JSON array of Unix timestamps (integers) and date strings.
+
+    Returns:
+        The array items.
+
+    Raises:
+        BulkRequestError: If the body is not a JSON array of integers and strings.
+    """
+    try:
+        values = json.loads(body)
+    except ValueError as e:
+        raise BulkRequestError(f"invalid JSON: {e}") from None
+    if not isinstance(values, list):
+        raise BulkRequestError("expected a JSON array")
+    for value in values:
+        if type(value) is not int and type(value) is not str:
+            raise BulkRequestError(f"expected integers and strings, got {value!r}")
+    return values
+
+
+def parse_binary(body: bytes) -> array[int]:
+    """
+    Parse a binary bulk request body.
+
+    Args:
+        body: Unix timestamps as little-endian signed 64-bit integers.
+
+    Returns:
+        The timestamps.
+
+    Raises:
+        BulkRequestError: If the body size is not a multiple of 8 bytes.
+    """
+    if len(body) % 8:
+        raise BulkRequestError("expected a multiple of 8 bytes")
+    timestamps = array("q")
+    timestamps.frombytes(body)
+    if sys.byteorder == "big":
+        timestamps.byteswap()
+    return timestamps
+
+
+def format_timestamps(timestamps: Sequence[int]) -> list[str | bool]:
+    """
+    Format many Unix timestamps like `format_timestamp`.
+
+    With numpy installed the timestamps are rendered in a single vectorized
+    `datetime64` pass, including the 12-hour clock of the API. Timestamps
+    before the year 1000 or out of range are formatted one by one.
+
+    Args:
+        timestamps: Signed 64-bit Unix timestamps.
+
+    Returns:
+        The date strings, False for timestamps outside the years 1 to 9999.
+    """
+    if np is None:
+        return [format_timestamp(timestamp) for timestamp in timestamps]
+    seconds = np.asarray(timestamps, dtype=np.int64)
+    inside = (seconds >= VECTOR_MIN) & (seconds <= VECTOR_MAX)
+    vectorized = seconds[inside]
+
+    # 'YYYY-MM-DDTHH:MM:SS', patched in place through a view of its UCS-4 code points
+    text = np.datetime_as_string(vectorized.astype("datetime64[s]"), unit="s")
+    chars = text.view(np.uint32).reshape(len(text), text.itemsize // 4)
+    hours = (vectorized // 3600 % 24 + 11) % 12 + 1
+    chars[:, 10] = ord(" ")
+    chars[:, 11] = hours // 10 + ord("0")
+    chars[:, 12] = hours % 10 + ord("0")
+    formatted: list[str | bool] = text.tolist()
+
+    if len(vectorized) == len(seconds):
+        return formatted
+    results: list[str | bool] = [False] * len(seconds)
+    for position, value in zip(np.flatnonzero(inside).tolist(), formatted, strict=True):
+        results[position] = value
+    for position in np.flatnonzero(~inside).tolist():
+        results[position] = format_timestamp(int(seconds[position]))
+    return results
+
+
+def convert_many(values: Sequence[int | str]) -> list[ConversionResult]:
+    """
+    Convert the items of a bulk request.
+
+    Integers are formatted together by `format_timestamps`, strings are
+    converted one by one like the `s` parameter of the converter endpoint.
+
+    Args:
+        values: Unix timestamps and date strings.
+
+    Returns:
+        The conversion results, in input order.
+    """
+    results: list[ConversionResult] = [False] * len(values)
+    positions: list[int] = []
+    timestamps: list[int] = []
+    for position, value in enumerate(values):
+        if isinstance(value, str):
+            results[position] = convert(value)
+        elif INT64_MIN <= value <= INT64_MAX:
+            positions.append(position)
+            timestamps.append(value)
+    for position, result in zip(positions, format_timestamps(timestamps), strict=True):
+        results[position] = result
+    return results
+
+
+def encode_many(results: Sequence[ConversionResult]) -> bytes:
+    """
+    Encode bulk conversion results as the JSON response body.
+
+    Args:
+        results: Result of `convert_many` or `format_timestamps`.
+
+    Returns:
+        UTF-8 encoded JSON array.
+    """
+    return json.dumps(results, separators=(",", ":")).encode()
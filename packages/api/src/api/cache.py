@@ -0,0 +1,70 @@
+from collections import OrderedDict
+
+
+class ConversionCache:
+    """
+    LRU cache of encoded converter responses, keyed by the `s` parameter.
+
+    Stores the JSON response bodies rather than the conversion results, so
+    a hit skips both the conversion and its encoding. Not thread-safe, the
+    server runs on a single event loop.
+
+    Args:
+        maxsize: Maximum number of cached responses, the least recently
+            used one is evicted when the cache is full.
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> bytes | None:
+        """
+        Look up a response body.
+
+        Args:
+            key: Value of the `s` parameter.
+
+        Returns:
+            The cached body, None on a miss.
+        """
+        body = self._entries.get(key)
+        if body is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return body
+
+    def set(self, key: str, body: bytes) -> None:
+        """
+        Store a response body, evicting the least recently used one if full.
+
+        Args:
+            key: Value of the `s` parameter.
+            body: Encoded response body.
+        """
+        self._entries[key] = body
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Cache size and counters."""
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,93 @@
+import json
+import re
+
+from api.parsing import parse_datetime
+
+# 0001-01-01 00:00:00 to 9999-12-31 23:59:59
+MIN_TIMESTAMP = -62135596800
+MAX_TIMESTAMP = 253402300799
+# days from 0000-03-01 to 1970-01-01, days in a 400-year era
+EPOCH_SHIFT = 719468
+ERA_DAYS = 146097
+# 'MM-DD' indexed by month * 32 + day, 'MM:SS' by seconds into the hour,
+# 'hh' on the 12-hour clock by hour of the day
+MONTH_DAY = [f"{month:02d}-{day:02d}" for month in range(13) for day in range(32)]
+MINUTE_SECOND = [f"{minute:02d}:{second:02d}" for minute in range(60) for second in range(60)]
+HOUR_12 = [f"{(hour + 11) % 12 + 1:02d}" for hour in range(24)]
+
+# PHP's is_numeric(): optional sign, decimals and exponent, surrounding whitespace
+NUMERIC = re.compile(r"\s*[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?\s*", re.ASCII)
+
+ConversionResult = int | str | bool
+
+
+def format_timestamp(timestamp: int) -> str | bool:
+    """
+    Format a Unix timestamp the way the API does.
+
+    The API renders the hour on a 12-hour clock without AM/PM, so midnight
+    and noon both come out as 12 (see docs/found_bugs.md).
+
+    The date is computed with integer arithmetic and the string assembled
+    from precomputed two-digit tables, without building a `datetime`.
+
+    Args:
+        timestamp: Seconds since the epoch, negative before 1970.
+
+    Returns:
+        Date string in 'YYYY-MM-DD hh:MM:SS' format in UTC, False when the
+        date is outside the years 1 to 9999.
+    """
+    if not MIN_TIMESTAMP <= timestamp <= MAX_TIMESTAMP:
+        return False
+    days, seconds = divmod(timestamp, 86400)
+    hour, seconds = divmod(seconds, 3600)
+
+    # civil date from the day count (Hinnant), in years starting on March 1st
+    era, day_of_era = divmod(days + EPOCH_SHIFT, ERA_DAYS)
+    year_of_era = (day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096) // 365
+    day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+    shifted_month = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * shifted_month + 2) // 5 + 1
+    if shifted_month < 10:
+        year, month = era * 400 + year_of_era, shifted_month + 3
+    else:
+        year, month = era * 400 + year_of_era + 1, shifted_month - 9
+
+    # years before 1000 are not zero-padded, like strftime's %Y
+    return f"{year}-{MONTH_DAY[month * 32 + day]} {HOUR_12[hour]}:{MINUTE_SECOND[seconds]}"
+
+
+def convert(value: str) -> ConversionResult:
+    """
+    Convert the `s` query parameter of the converter endpoint.
+
+    Args:
+        value: Unix timestamp, possibly with a fractional part, or date string.
+
+    Returns:
+        The date string for a timestamp, the timestamp for a date string,
+        False for anything else.
+    """
+    if NUMERIC.fullmatch(value):
+        number = value.strip()
+        try:
+            timestamp = int(number) if number.lstrip("+-").isdigit() else int(float(number))
+        except OverflowError:
+            return False
+        return format_timestamp(timestamp)
+    parsed = parse_datetime(value)
+    return False if parsed is None else parsed
+
+
+def encode(result: ConversionResult) -> bytes:
+    """
+    Encode a conversion result as the JSON response body.
+
+    Args:
+        result: Result of `convert`.
+
+    Returns:
+        UTF-8 encoded JSON document.
+    """
+    return json.dumps(result).encode()
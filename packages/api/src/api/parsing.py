@@ -0,0 +1,174 @@
+WHITESPACE = " \t\n\r\f\v"
+WHITESPACE_BYTES = WHITESPACE.encode()
+# separators between the date and the time, case-insensitive like the rest
+TIME_SEPARATORS = b" Tt"
+ZONE_NAMES = (b"utc", b"gmt")
+# days before the first of each month in a common year, indexed by month
+MONTH_START = (0, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
+ZERO, NINE, COLON, DASH, SLASH, PLUS, DOT = b"09:-/+."
+
+
+def days_from_civil(year: int, month: int, day: int) -> int:
+    """
+    Count the days from 1970-01-01 to a date of the proleptic Gregorian calendar.
+
+    Days past the end of the month count on into the next month, e.g.
+    2023-02-29 is 2023-03-01.
+
+    Args:
+        year: Year, may be 0 or negative.
+        month: Month, 1 to 12.
+        day: Day of the month, 1 to 31.
+
+    Returns:
+        Days since the epoch, negative before 1970.
+    """
+    # shift the year to start in March, so the leap day is its last day
+    if month <= 2:
+        year -= 1
+        month += 9
+    else:
+        month -= 3
+    era, year_of_era = divmod(year, 400)
+    day_of_year = (153 * month + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468
+
+
+# days since the epoch of each January 1st and leap years, for four digit years
+YEAR_START = [days_from_civil(year, 1, 1) for year in range(10001)]
+LEAP_YEAR = [YEAR_START[year + 1] - YEAR_START[year] == 366 for year in range(10000)]
+
+
+def parse_datetime(value: str) -> int | None:
+    """
+    Parse a date string the way the API does, in a single pass.
+
+    Accepts 'YYYY-MM-DD' and 'YYYY/MM/DD' dates from year 1 on, with one or
+    two digit months and days, optionally followed by a time with or without
+    seconds, an AM/PM marker and a UTC offset ('Z', 'UTC', 'GMT', '+H', '+HH',
+    '+HMM', '+HHMM', '+H:MM' or '+HH:MM', less than a day). Days past the end
+    of the month roll over into the next month, e.g. 2023-02-29 is 2023-03-01.
+
+    The string is scanned once as ASCII bytes, left to right, and the
+    numbers are accumulated from the digit codes without slicing.
+
+    Args:
+        value: Date string to parse, in UTC unless it carries an offset.
+
+    Returns:
+        Unix timestamp, None if the string is not a valid date.
+    """
+    if not value.isascii():
+        return None
+    s = value.strip(WHITESPACE).encode()
+    n = len(s)
+
+    # date: YYYY-M[M]-D[D], the same separator twice
+    if n < 8 or not s[:4].isdigit():
+        return None
+    sep = s[4]
+    if sep != DASH and sep != SLASH:
+        return None
+    year = s[0] * 1000 + s[1] * 100 + s[2] * 10 + s[3] - 1111 * ZERO
+    c = s[5]
+    if not ZERO <= c <= NINE:
+        return None
+    d = s[6]
+    if ZERO <= d <= NINE:
+        month, i = c * 10 + d - 11 * ZERO, 7
+    else:
+        month, i = c - ZERO, 6
+    if s[i] != sep or i + 1 == n:
+        return None
+    c = s[i + 1]
+    if not ZERO <= c <= NINE:
+        return None
+    if i + 2 < n and ZERO <= s[i + 2] <= NINE:
+        day, i = c * 10 + s[i + 2] - 11 * ZERO, i + 3
+    else:
+        day, i = c - ZERO, i + 2
+
+    # time: separators, H[H]:MM[:SS], an optional AM/PM marker
+    hour = minute = second = meridian = offset = 0
+    if i < n and s[i] in TIME_SEPARATORS:
+        j = i + 1
+        while j < n and s[j] in TIME_SEPARATORS:
+            j += 1
+        if j < n and ZERO <= s[j] <= NINE:
+            hour = s[j] - ZERO
+            j += 1
+            if j < n and ZERO <= s[j] <= NINE:
+                hour = hour * 10 + s[j] - ZERO
+                j += 1
+            if j + 3 > n or s[j] != COLON or not (ZERO <= s[j + 1] <= NINE and ZERO <= s[j + 2] <= NINE):
+                return None
+            minute = s[j + 1] * 10 + s[j + 2] - 11 * ZERO
+            i = j + 3
+            if i < n and s[i] == COLON:
+                if i + 3 > n or not (ZERO <= s[i + 1] <= NINE and ZERO <= s[i + 2] <= NINE):
+                    return None
+                second = s[i + 1] * 10 + s[i + 2] - 11 * ZERO
+                i += 3
+            j = i
+            while j < n and s[j] in WHITESPACE_BYTES:
+                j += 1
+            if j < n and s[j] in b"aApP":
+                meridian = s[j] | 0x20
+                j += 1
+                if j < n and s[j] == DOT:
+                    j += 1
+                if j == n or s[j] not in b"mM":
+                    return None
+                j += 1
+                if j < n and s[j] == DOT:
+                    j += 1
+                i = j
+
+    # zone: Z, UTC, GMT or a signed offset
+    while i < n and s[i] in WHITESPACE_BYTES:
+        i += 1
+    if i < n:
+        sign = s[i]
+        if sign in b"zZ":
+            i += 1
+        elif s[i : i + 3].lower() in ZONE_NAMES:
+            i += 3
+        elif sign == PLUS or sign == DASH:
+            # +H, +HH, +HMM, +HHMM, +H:MM or +HH:MM up to the end
+            digits = s[i + 1 :]
+            if len(digits) > 3 and digits[-3] == COLON:
+                hours, minutes = digits[:-3], digits[-2:]
+                if not 1 <= len(hours) <= 2:
+                    return None
+            elif len(digits) > 2:
+                hours, minutes = digits[:-2], digits[-2:]
+            else:
+                hours, minutes = digits, b"00"
+            if not (hours.isdigit() and len(hours) <= 2 and minutes.isdigit()):
+                return None
+            offset_hours, offset_minutes = int(hours), int(minutes)
+            # less than a day, like strptime's %z
+            if offset_hours > 23 or offset_minutes > 59:
+                return None
+            offset = offset_hours * 3600 + offset_minutes * 60
+            if sign == DASH:
+                offset = -offset
+            i = n
+        if i != n:
+            return None
+
+    # years start at 1 like datetime's, which rejects year 0
+    if not (year >= 1 and 1 <= month <= 12 and 1 <= day <= 31 and minute <= 59 and second <= 59):
+        return None
+    if not meridian:
+        if hour > 23:
+            return None
+    elif not 1 <= hour <= 12:
+        return None
+    else:
+        hour = hour % 12 + (12 if meridian == ord("p") else 0)
+
+    days = YEAR_START[year] + MONTH_START[month] + (month > 2 and LEAP_YEAR[year]) + day - 1
+    return days * 86400 + hour * 3600 + minute * 60 + second - offset
@@ -0,0 +1,412 @@
+import argparse
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections.abc import Callable, Sequence
+from email.utils import formatdate
+from http import HTTPStatus
+from typing import Self
+from urllib.parse import parse_qsl
+
+from api.bulk import BulkRequestError, convert_many, encode_many, format_timestamps, parse_binary, parse_json
+from api.cache import ConversionCache
+from api.converter import ConversionResult, convert, encode
+
+CONVERTER_PATH = "/api/unix-timestamp-converter/"
+BULK_PATH = "/api/unix-timestamp-converter/bulk/"
+# not part of the API, reports the request and cache counters
+STATS_PATH = "/_stats"
+# requests with a longer head are rejected
+MAX_HEAD_SIZE = 16 * 1024
+# requests with a larger body are rejected, about two million binary timestamps
+MAX_BODY_SIZE = 16 * 1024 * 1024
+# the API answers unknown paths and unparsable input with this body
+FALSE: bytes = encode(False)
+NOT_FOUND = b'"false"'
+
+logger = logging.getLogger(__name__)
+
+
+class _Date:
+    """`Date` header value, formatted at most once per second."""
+
+    def __init__(self) -> None:
+        self._second = 0
+        self._value = b""
+
+    def __call__(self) -> bytes:
+        now = int(time.time())
+        if now != self._second:
+            self._second = now
+            self._value = formatdate(now, usegmt=True).encode()
+        return self._value
+
+
+class HTTPProtocol(asyncio.Protocol):
+    """
+    Minimal HTTP/1.1 server connection answering converter requests.
+
+    Supports keep-alive and pipelining: all requests that arrived in one
+    read are answered with a single write.
+
+    Args:
+        server: Server the connection belongs to.
+    """
+
+    def __init__(self, server: "ConverterServer") -> None:
+        self.server = server
+        self.transport: asyncio.Transport | None = None
+        self._buffer = bytearray()
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        assert isinstance(transport, asyncio.Transport)
+        self.transport = transport
+
+    def data_received(self, data: bytes) -> None:
+        assert self.transport is not None
+        self._buffer += data
+        responses: list[bytes] = []
+        # set once the last response of the connection is queued, a request
+        # without keep-alive only ends the connection after it was answered
+        close = False
+        while not close:
+            end = self._buffer.find(b"\r\n\r\n")
+            if end < 0:
+                if len(self._buffer) > MAX_HEAD_SIZE:
+                    responses.append(self.server.response(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, b"", False))
+                    close = True
+                break
+            request = self._parse(bytes(self._buffer[:end]))
+            if request is None:
+                responses.append(self.server.response(HTTPStatus.BAD_REQUEST, b"", False))
+                close = True
+                break
+            method, target, keep_alive, body_size, content_type = request
+            if body_size > MAX_BODY_SIZE:
+                responses.append(self.server.response(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, b"", False))
+                close = True
+                break
+            if len(self._buffer) < end + 4 + body_size:
+                # wait for the rest of the request body
+                break
+            body = bytes(self._buffer[end + 4 : end + 4 + body_size])
+            del self._buffer[: end + 4 + body_size]
+            responses.append(self.server.handle(method, target, keep_alive, body, content_type))
+            close = not keep_alive
+        if responses:
+            self.transport.writelines(responses)
+        if close:
+            self.transport.close()
+
+    @staticmethod
+    def _parse(head: bytes) -> tuple[str, str, bool, int, str] | None:
+        """
+        Parse a request head.
+
+        Args:
+            head: Request line and headers, without the blank line.
+
+        Returns:
+            Method, request target, whether to keep the connection open, the
+            size of the request body and its media type, None for malformed
+            requests.
+        """
+        lines = head.split(b"\r\n")
+        parts = lines[0].split(b" ")
+        if len(parts) != 3 or not parts[2].startswith(b"HTTP/1."):
+            return None
+        keep_alive = parts[2] == b"HTTP/1.1"
+        body_size = 0
+        content_type = b""
+        for line in lines[1:]:
+            name, _, value = line.partition(b":")
+            name = name.strip().lower()
+            if name == b"connection":
+                token = value.strip().lower()
+                if token == b"close":
+                    keep_alive = False
+                elif token == b"keep-alive":
+                    keep_alive = True
+            elif name == b"content-length":
+                if not value.strip().isdigit():
+                    return None
+                body_size = int(value)
+            elif name == b"content-type":
+                content_type = value.partition(b";")[0].strip().lower()
+            elif name == b"transfer-encoding":
+                # chunked request bodies are not supported
+                return None
+        try:
+            method, target, media_type = (item.decode("ascii") for item in (parts[0], parts[1], content_type))
+            return method, target, keep_alive, body_size, media_type
+        except UnicodeDecodeError:
+            return None
+
+
+class ConverterServer:
+    """
+    Reference implementation of the Unix Timestamp Converter API.
+
+    Serves `GET /api/unix-timestamp-converter/` as specified by
+    unix-timestamp-converter-spec.yml, including the quirks of the live API
+    documented in docs/found_bugs.md, from a single asyncio event loop.
+
+    Unlike the live API, requests with the `cached` parameter are answered
+    from a conversion cache, and `POST /api/unix-timestamp-converter/bulk/`
+    converts many values per request.
+
+    Args:
+        host: Interface to listen on.
+        port: Port to listen on, 0 for any free port.
+        cache_size: Maximum number of cached conversions, 0 to ignore
+            `cached` like the live API.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8000, cache_size: int = 4096) -> None:
+        self.host = host
+        self.port = port
+        self.requests = 0
+        self.cache = ConversionCache(cache_size) if cache_size else None
+        self._date = _Date()
+        self._server: asyncio.Server | None = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server, e.g. http://127.0.0.1:8000."""
+        host = f"[{self.host}]" if ":" in self.host else self.host
+        return f"http://{host}:{self.port}"
+
+    async def start(self) -> None:
+        """Start listening, resolving `port` if it was 0."""
+        loop = asyncio.get_running_loop()
+        self._server = await loop.create_server(lambda: HTTPProtocol(self), self.host, self.port, backlog=1024)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        """Start listening if needed and serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        assert self._server is not None
+        await self._server.serve_forever()
+
+    async def aclose(self) -> None:
+        """Stop listening and close the open connections."""
+        if self._server is not None:
+            self._server.close()
+            self._server.close_clients()
+            await self._server.wait_closed()
+
+    def handle(self, method: str, target: str, keep_alive: bool, body: bytes = b"", content_type: str = "") -> bytes:
+        """
+        Answer one request.
+
+        Args:
+            method: Request method.
+            target: Request target, path and query string.
+            keep_alive: Whether the connection stays open afterwards.
+            body: Request body.
+            content_type: Media type of the request body, lower case and
+                without parameters.
+
+        Returns:
+            The complete HTTP response.
+        """
+        self.requests += 1
+        path, _, query = target.partition("?")
+        if path == BULK_PATH:
+            if method != "POST":
+                return self.response(HTTPStatus.METHOD_NOT_ALLOWED, b"", keep_alive, extra=b"Allow: POST\r\n")
+            status, response_body = self.convert_bulk(body, content_type)
+            return self.response(status, response_body, keep_alive)
+        if method not in ("GET", "HEAD"):
+            return self.response(HTTPStatus.METHOD_NOT_ALLOWED, b"", keep_alive, extra=b"Allow: GET, HEAD\r\n")
+        if path == CONVERTER_PATH:
+            status, response_body = HTTPStatus.OK, self.convert(query)
+        elif path == STATS_PATH:
+            status, response_body = HTTPStatus.OK, json.dumps(self.stats).encode()
+        else:
+            status, response_body = HTTPStatus.NOT_FOUND, NOT_FOUND
+        return self.response(status, response_body, keep_alive, head_only=method == "HEAD")
+
+    def convert(self, query: str) -> bytes:
+        """
+        Answer a converter request.
+
+        Requests with the `cached` parameter, whatever its value, are
+        answered from the conversion cache. Without `s` the API answers
+        false rather than the 404 the spec describes.
+
+        Args:
+            query: Query string of the request.
+
+        Returns:
+            JSON response body.
+        """
+        value = None
+        cached = False
+        for name, item in parse_qsl(query, keep_blank_values=True):
+            if name == "s":
+                value = item
+            elif name == "cached":
+                cached = True
+        if value is None:
+            return FALSE
+        if cached and self.cache is not None:
+            hit: bytes | None = self.cache.get(value)
+            if hit is not None:
+                return hit
+        body: bytes = encode(convert(value))
+        if cached and self.cache is not None:
+            self.cache.set(value, body)
+        return body
+
+    def convert_bulk(self, body: bytes, content_type: str) -> tuple[HTTPStatus, bytes]:
+        """
+        Answer a bulk converter request.
+
+        JSON arrays may mix Unix timestamps and date strings, binary bodies
+        carry only timestamps. Each value is converted like the `s`
+        parameter of the converter endpoint, timestamps in one vectorized
+        pass when numpy is installed. The conversion cache is not used.
+
+        Args:
+            body: Request body.
+            content_type: Media type of the request body.
+
+        Returns:
+            Response status and JSON response body, the array of results in
+            input order on success.
+        """
+        results: list[ConversionResult] | list[str | bool]
+        try:
+            if content_type == "application/octet-stream":
+                results = format_timestamps(parse_binary(body))
+            elif content_type in ("application/json", ""):
+                results = convert_many(parse_json(body))
+            else:
+                return HTTPStatus.UNSUPPORTED_MEDIA_TYPE, FALSE
+        except BulkRequestError:
+            return HTTPStatus.BAD_REQUEST, FALSE
+        return HTTPStatus.OK, encode_many(results)
+
+    @property
+    def stats(self) -> dict[str, object]:
+        """Request and conversion cache counters, served on `STATS_PATH`."""
+        return {
+            "requests": self.requests,
+            "cache": None if self.cache is None else self.cache.stats,
+        }
+
+    def response(
+        self, status: HTTPStatus, body: bytes, keep_alive: bool, extra: bytes = b"", head_only: bool = False
+    ) -> bytes:
+        """
+        Build an HTTP response.
+
+        Args:
+            status: Response status.
+            body: JSON response body.
+            keep_alive: Whether the connection stays open afterwards.
+            extra: Additional header lines, each ending with CRLF.
+            head_only: Leave out the body, for HEAD requests.
+
+        Returns:
+            Status line, headers and body.
+        """
+        return b"".join(
+            (
+                b"HTTP/1.1 %d %s\r\n" % (status.value, status.phrase.encode()),
+                b"Date: %s\r\n" % self._date(),
+                b"Content-Type: application/json\r\n",
+                b"Content-Length: %d\r\n" % len(body),
+                b"" if keep_alive else b"Connection: close\r\n",
+                extra,
+                b"\r\n",
+                b"" if head_only else body,
+            )
+        )
+
+
+class ServerThread:
+    """
+    Runs a `ConverterServer` on its own event loop in a daemon thread.
+
+    Used to serve the API tests and benchmarks from the same process.
+
+    Args:
+        host: Interface to listen on.
+        port: Port to listen on, 0 for any free port.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.server = ConverterServer(host, port)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="api-server", daemon=True)
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server."""
+        return self.server.url
+
+    def start(self) -> Self:
+        """Start the thread and wait until the server is listening."""
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self.server.start(), self._loop).result()
+        return self
+
+    def stop(self) -> None:
+        """Close the server and stop the thread."""
+        asyncio.run_coroutine_threadsafe(self.server.aclose(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self) -> Self:
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Use uvloop if it is installed, it roughly doubles the throughput."""
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:
+        return None
+    factory: Callable[[], asyncio.AbstractEventLoop] = uvloop.new_event_loop
+    return factory
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """
+    Run the reference server until interrupted.
+
+    Args:
+        argv: Command line arguments, defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(prog="api", description="Reference Unix Timestamp Converter API server")
+    parser.add_argument("--host", default="127.0.0.1", help="interface to listen on (default: %(default)s)")
+    parser.add_argument("--port", type=int, default=8000, help="port to listen on (default: %(default)s)")
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=4096,
+        help="conversions cached for requests with `cached`, 0 to ignore it (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="[%(asctime)s] %(levelname)s: %(message)s")
+
+    server = ConverterServer(args.host, args.port, args.cache_size)
+
+    async def serve() -> None:
+        await server.start()
+        logger.info("Serving the converter API on %s%s", server.url, CONVERTER_PATH)
+        await server.serve_forever()
+
+    try:
+        asyncio.run(serve(), loop_factory=_loop_factory())
+    except KeyboardInterrupt:
+        logger.info("Served %d requests, cache: %s", server.requests, server.stats["cache"])
@@ -2,4 +2,6 @@ pytest_plugins = [
     "packages.api.tests.fixtures.common",
     "packages.api.tests.fixtures.timestamp",
     "packages.api.tests.hooks.logging",
+    "packages.api.tests.hooks.local_api",
+    "packages.api.tests.hooks.sidecar",
 ]
@@ -1,17 +1,125 @@
+import os
+from pathlib import Path
 from typing import Generator
+from api.server import ServerThread
 from api_sdk import ApiClient, Configuration
 import pytest
 import logging
 
 # TODO should be part of config file
 BASE_URL = "https://helloacm.com"
+# overrides BASE_URL, e.g. with the reference server from packages/api (see --local-api)
+BASE_URL_ENV = "API_BASE_URL"
+RESPONSE_CACHE_MAXSIZE = 1024
+RESPONSE_CACHE_TTL = 300.0
+# the API begins to rate-limit after approximately 10 requests
+RATE_LIMIT = 2.0
+RATE_LIMIT_BURST = 10
+# at most one request in ten gets a hedge, and only when the rate limit allows
+HEDGE_PERCENTILE = 0.9
+HEDGE_BUDGET = 0.1
+# fail fast instead of timing out every remaining test while the API is down
+CIRCUIT_BREAKER_FAILURES = 5
+CIRCUIT_BREAKER_RESET_TIMEOUT = 30.0
+
+
+def api_base_url() -> str:
+    """
+    Get the base URL of the API under test.
+
+    Returns:
+        The URL from the `API_BASE_URL` environment variable, the live API by default.
+    """
+    return os.environ.get(BASE_URL_ENV, BASE_URL)
+
+
+@pytest.fixture(scope="session")
+def rate_limit_file(tmp_path_factory: pytest.TempPathFactory, testrun_uid: str) -> Path:
+    """
+    Session fixture for the file holding the shared rate limit budget.
+
+    The path is the same for all pytest-xdist workers of a test run, so
+    the workers draw from one token bucket instead of one each.
+    """
+    root_tmp_dir = tmp_path_factory.getbasetemp().parent
+    return root_tmp_dir / f"api-rate-limit-{testrun_uid}"
+
+
+def upstream_configuration(rate_limit_file: Path | None = None) -> Configuration:
+    """
+    Create the configuration for talking to the API itself.
+
+    Args:
+        rate_limit_file: File holding a rate limit budget shared between
+            processes, None to keep the budget in memory.
+
+    Returns:
+        Configuration with the rate limit, caching and resilience settings
+        of the test run. Only the live API is rate limited. Responses are
+        cached in memory for this test run only, so every run reaches the API.
+    """
+    base_url = api_base_url()
+    live = base_url == BASE_URL
+    configuration = Configuration(host=base_url)
+    # keep all workers together below the API rate limit
+    if live:
+        configuration.rate_limit = RATE_LIMIT
+        configuration.rate_limit_burst = RATE_LIMIT_BURST
+    if live and rate_limit_file is not None:
+        configuration.rate_limit_file = str(rate_limit_file)
+    configuration.rate_limit_adaptive = True
+    # concurrent identical conversions share one request
+    configuration.coalesce_requests = True
+    # repeated conversions (fixtures, flaky reruns) are served from memory
+    configuration.response_cache_maxsize = RESPONSE_CACHE_MAXSIZE
+    configuration.response_cache_ttl = RESPONSE_CACHE_TTL
+    # duplicate conversions slower than the observed p90 to cut tail latency
+    configuration.hedge_requests = True
+    configuration.hedge_percentile = HEDGE_PERCENTILE
+    configuration.hedge_budget = HEDGE_BUDGET
+    # back off when the API slows down or throttles, instead of a fixed pool size
+    configuration.adaptive_concurrency = True
+    configuration.circuit_breaker_failures = CIRCUIT_BREAKER_FAILURES
+    configuration.circuit_breaker_reset_timeout = CIRCUIT_BREAKER_RESET_TIMEOUT
+    # new connections skip the DNS lookup and resume the TLS session
+    configuration.dns_cache = True
+    configuration.tls_session_resumption = True
+    # ask for compressed responses
+    configuration.response_compression = True
+    return configuration
 
 
 @pytest.fixture(scope="session")
-def api_client(logger: logging.Logger) -> Generator[ApiClient, None, None]:
+def api_client(
+    logger: logging.Logger, rate_limit_file: Path, api_sidecar_url: str | None
+) -> Generator[ApiClient, None, None]:
     """Sessionfixture to create an API client"""
-    logger.info("Creating API client for host: %s", BASE_URL)
-    configuration = Configuration(host=BASE_URL)
-    with ApiClient(configuration) as client:
+    if api_sidecar_url is not None:
+        # the sidecar rate limits, caches and coalesces for all workers
+        logger.info("Creating API client for host: %s (sidecar for %s)", api_sidecar_url, api_base_url())
+        configuration = Configuration(host=api_sidecar_url)
+    else:
+        logger.info("Creating API client for host: %s", api_base_url())
+        configuration = upstream_configuration(rate_limit_file)
+    # immutable snapshot, safe to share between threads
+    with ApiClient(configuration.freeze()) as client:
+        # the first test on each worker should not pay for DNS, TCP and TLS setup
+        logger.info("API connection pool warm-up: %s", client.warm_up())
         yield client
+        logger.info("API connection pool stats: %s", client.rest_client.pool_stats())
+        if client.response_cache is not None:
+            logger.info("API response cache stats: %s", client.response_cache.stats)
+        if client.rest_client.hedging is not None:
+            logger.info("API request hedging stats: %s", client.rest_client.hedging.stats)
+        if client.rest_client.concurrency_limiter is not None:
+            logger.info("API concurrency limiter stats: %s", client.rest_client.concurrency_limiter.stats)
+        if client.rest_client.circuit_breaker is not None:
+            logger.info("API circuit breaker stats: %s", client.rest_client.circuit_breaker.stats)
     logger.info("API client closed")
+
+
+@pytest.fixture(scope="session")
+def reference_server() -> Generator[ServerThread, None, None]:
+    """Session fixture for a reference server of this worker, independent of --local-api."""
+    with ServerThread() as server:
+        yield server
@@ -1,9 +1,11 @@
 import pytest
-from api_sdk import ApiClient, TimestampApi, ApiResponse
+from api_sdk import ApiClient, TimestampApi, ApiResponse, RequestTimings
 from api_sdk.models.convert_timestamp200_response import ConvertTimestamp200Response
-from typing import Optional, Mapping, Union, Dict, Any
+from typing import Optional, Mapping, Union, Dict, Any, Iterable, Iterator
 import logging
 
+from packages.api.tests.utils.timing_tools import summarize_timings
+
 
 class ConvertedRes:
     """
@@ -70,6 +72,18 @@ class ConvertedRes:
         """
         return self._response.raw_data
 
+    @property
+    def timings(self) -> RequestTimings | None:
+        """
+        Get the latency breakdown of the HTTP request.
+
+        Returns:
+            Optional[RequestTimings]: Timestamps of the request phases (blocked,
+                                     connecting, TLS handshake, waiting, receiving),
+                                     or None if the response came from the client cache.
+        """
+        return self._response.timings
+
 
 class TestTimestampApi(TimestampApi):
     """
@@ -87,6 +101,16 @@ class TestTimestampApi(TimestampApi):
     def __init__(self, api_client: ApiClient, logger: logging.Logger) -> None:
         super().__init__(api_client)
         self.logger = logger
+        self.timings: list[RequestTimings] = []
+
+    def _record(self, res: ApiResponse[ConvertTimestamp200Response]) -> ConvertedRes:
+        self.logger.info("Conversion response status: %s", res.status_code)
+        self.logger.debug("Conversion response payload: %s", res.data)
+        if res.timings is not None:
+            self.logger.debug("Conversion response timings: %s", res.timings)
+            self.timings.append(res.timings)
+
+        return ConvertedRes(res)
 
     def convert(
         self,
@@ -114,14 +138,42 @@ class TestTimestampApi(TimestampApi):
 
         res = self.convert_timestamp_with_http_info(cached=cached, s=timestamp)
 
-        self.logger.info("Conversion response status: %s", res.status_code)
-        self.logger.debug("Conversion response payload: %s", res.data)
+        return self._record(res)
 
-        return ConvertedRes(res)
+    def convert_many(
+        self,
+        timestamps: Iterable[int | str],
+        cached: str | None = "",
+        max_in_flight: int | None = None,
+    ) -> Iterator[ConvertedRes]:
+        """
+        Convert many timestamps concurrently with logging and response wrapping.
+
+        Bulk counterpart of `convert`. Requests are pipelined over the shared
+        connection pool with at most `max_in_flight` of them outstanding, and
+        the results are yielded in input order.
+
+        Args:
+            timestamps (Iterable[int | str]): The Unix timestamps (integers) or
+                                              date strings to convert.
+            cached (str | None, optional): Enable caching for the conversion.
+                                          Defaults to "".
+            max_in_flight (int | None, optional): Maximum number of concurrent
+                                                 requests. Defaults to the
+                                                 connection pool size.
+
+        Returns:
+            Iterator[ConvertedRes]: Wrapped response objects in input order.
+        """
+        self.logger.info("Converting timestamps in bulk (max_in_flight=%s)", max_in_flight)
+
+        responses = self.convert_timestamps_with_http_info(timestamps, cached=cached, max_in_flight=max_in_flight)
+        for res in responses:
+            yield self._record(res)
 
 
 @pytest.fixture(scope="session")
-def timestamp_client(api_client: ApiClient, logger: logging.Logger) -> TestTimestampApi:
+def timestamp_client(api_client: ApiClient, logger: logging.Logger) -> Iterator[TestTimestampApi]:
     """
     Session fixture to create a Timestamp endpoint instance.
 
@@ -129,7 +181,8 @@ def timestamp_client(api_client: ApiClient, logger: logging.Logger) -> TestTimes
     in the session.
 
     This fixture also provides an enhanced API client with logging capabilities
-    for timestamp conversion operations.
+    for timestamp conversion operations. At the end of the session the latency
+    breakdown of all requests is logged, in the same terms as the k6 summary.
 
     Args:
         api_client (ApiClient): The base API client instance.
@@ -140,4 +193,7 @@ def timestamp_client(api_client: ApiClient, logger: logging.Logger) -> TestTimes
                          logging and convenience methods.
     """
     logger.info("Creating Timestamp API client")
-    return TestTimestampApi(api_client, logger)
+    client = TestTimestampApi(api_client, logger)
+    yield client
+    for phase, stats in summarize_timings(client.timings).items():
+        logger.info("http_req_%s: %s", phase, " ".join(f"{name}={value:.2f}ms" for name, value in stats.items()))
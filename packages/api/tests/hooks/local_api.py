@@ -0,0 +1,42 @@
+import os
+
+import pytest
+from api.server import ServerThread
+
+from packages.api.tests.fixtures.common import BASE_URL_ENV
+
+local_api_key = pytest.StashKey[ServerThread]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--local-api",
+        action="store_true",
+        default=False,
+        help="run the tests offline against the reference server in packages/api instead of the live API",
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Start the reference server before the sidecar proxy and the workers need its URL.
+
+    The URL is handed on through the environment, which the pytest-xdist
+    workers inherit.
+    """
+    if hasattr(config, "workerinput") or not config.getoption("local_api"):
+        return
+    server = ServerThread().start()
+    config.stash[local_api_key] = server
+    os.environ[BASE_URL_ENV] = server.url
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_unconfigure(config: pytest.Config) -> None:
+    server = config.stash.get(local_api_key, None)
+    if server is None:
+        return
+    server.stop()
+    os.environ.pop(BASE_URL_ENV, None)
+    del config.stash[local_api_key]
@@ -0,0 +1,74 @@
+import logging
+from typing import Any
+
+import pytest
+from api_sdk import ApiClient
+
+from packages.api.tests.fixtures.common import upstream_configuration
+from packages.api.tests.hooks.logging import setup_logging
+from packages.api.tests.utils.sidecar import SidecarProxy
+
+SIDECAR_URL_KEY = "api_sidecar_url"
+sidecar_key = pytest.StashKey[SidecarProxy]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--no-api-sidecar",
+        action="store_true",
+        default=False,
+        help="let every pytest-xdist worker talk to the API directly instead of through the shared sidecar proxy",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Start the sidecar proxy in the pytest-xdist controller process.
+
+    Without the sidecar every worker opens its own connections and keeps its
+    own cache, so N workers fetch the same conversions N times. Runs without
+    workers talk to the API directly.
+    """
+    if hasattr(config, "workerinput") or config.getoption("no_api_sidecar"):
+        return
+    if not config.getoption("numprocesses", default=None):
+        return
+
+    logger = setup_logging("sidecar")
+    # the sidecar is the only process talking to the API, so the rate limit budget can stay in memory
+    client = ApiClient(upstream_configuration())
+    logger.info("API connection pool warm-up: %s", client.warm_up())
+    sidecar = SidecarProxy(client, logger).start()
+    logger.info("Sidecar proxy for %s listening on %s", client.configuration.host, sidecar.url)
+    config.stash[sidecar_key] = sidecar
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node: Any) -> None:
+    """Hand the sidecar URL to a pytest-xdist worker."""
+    sidecar = node.config.stash.get(sidecar_key, None)
+    if sidecar is not None:
+        node.workerinput[SIDECAR_URL_KEY] = sidecar.url
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    sidecar = config.stash.get(sidecar_key, None)
+    if sidecar is None:
+        return
+    sidecar.logger.info("Sidecar proxy stats: %s", sidecar.stats)
+    sidecar.close()
+    del config.stash[sidecar_key]
+
+
+@pytest.fixture(scope="session")
+def api_sidecar_url(request: pytest.FixtureRequest, logger: logging.Logger) -> str | None:
+    """
+    Session fixture for the URL of the sidecar proxy shared by the workers.
+
+    Returns None when the tests talk to the API directly.
+    """
+    workerinput = getattr(request.config, "workerinput", {})
+    url: str | None = workerinput.get(SIDECAR_URL_KEY)
+    if url is not None:
+        logger.info("Using the sidecar proxy at %s", url)
+    return url
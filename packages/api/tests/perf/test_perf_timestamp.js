@@ -2,7 +2,9 @@
 import { check, group, sleep } from "k6";
 import http from "k6/http";
 
-const BASE_URL = "https://helloacm.com/api/unix-timestamp-converter/";
+// API_BASE_URL points the test at another server, e.g. the reference server from `make run-api`
+const API_ORIGIN = __ENV.API_BASE_URL || "https://helloacm.com";
+const BASE_URL = `${API_ORIGIN}/api/unix-timestamp-converter/`;
 
 export const options = {
     stages: [
@@ -100,7 +102,7 @@ export default function () {
     } else {
 
         group("Handle 404 error", () => {
-            const response = http.get("https://helloacm.com/api/nonexistent-endpoint/");
+            const response = http.get(`${API_ORIGIN}/api/nonexistent-endpoint/`);
 
             check(response, {
                 "404 status for non-existent endpoint": (r) => r.status === 404,
@@ -0,0 +1,135 @@
+import http.client
+import json
+import struct
+import urllib.error
+import urllib.request
+
+import pytest
+from api import bulk
+from api.converter import format_timestamp
+from api.server import BULK_PATH, ServerThread
+
+TIMESTAMPS = [0, 1672531200, -1, 253402300799, 253402300800]
+FORMATTED = ["1970-01-01 12:00:00", "2023-01-01 12:00:00", "1969-12-31 11:59:59", "9999-12-31 11:59:59", False]
+
+
+def post(server: ServerThread, body: bytes, content_type: str) -> tuple[int, str | None, object]:
+    """
+    Post a bulk request with urllib, which sends `Connection: close`.
+
+    Args:
+        server: The server to send the request to.
+        body: The request body.
+        content_type: Media type of the body.
+
+    Returns:
+        Status code, Connection header and decoded JSON body of the response.
+    """
+    request = urllib.request.Request(
+        server.url + BULK_PATH, data=body, headers={"Content-Type": content_type}, method="POST"
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, response.headers["Connection"], json.load(response)
+    except urllib.error.HTTPError as e:
+        with e:
+            return e.code, e.headers["Connection"], json.load(e)
+
+
+def test_bulk_json_connection_close(reference_server: ServerThread) -> None:
+    """
+    Test converting a JSON array of timestamps and date strings over a non-persistent connection.
+    """
+    status, connection, payload = post(
+        reference_server, json.dumps([*TIMESTAMPS, "2023-01-01"]).encode(), "application/json"
+    )
+
+    assert status == 200
+    assert connection == "close"
+    assert payload == [*FORMATTED, 1672531200]
+
+
+def test_bulk_binary_connection_close(reference_server: ServerThread) -> None:
+    """
+    Test converting little-endian 64-bit timestamps over a non-persistent connection.
+    """
+    status, _, payload = post(
+        reference_server, struct.pack(f"<{len(TIMESTAMPS)}q", *TIMESTAMPS), "application/octet-stream"
+    )
+
+    assert status == 200
+    assert payload == FORMATTED
+
+
+def test_bulk_keep_alive(reference_server: ServerThread) -> None:
+    """
+    Test sending several bulk requests over one persistent connection.
+    """
+    connection = http.client.HTTPConnection(reference_server.server.host, reference_server.server.port, timeout=5)
+    try:
+        for size in (1, 100, 10_000):
+            body = json.dumps(TIMESTAMPS * size).encode()
+            connection.request("POST", BULK_PATH, body, {"Content-Type": "application/json"})
+            response = connection.getresponse()
+
+            assert response.status == 200
+            assert response.getheader("Connection") is None
+            assert json.load(response) == FORMATTED * size
+    finally:
+        connection.close()
+
+
+@pytest.mark.parametrize(
+    ("body", "content_type"),
+    [
+        (b"[0,", "application/json"),
+        (b'{"s": 0}', "application/json"),
+        (b"[0, 1.5]", "application/json"),
+        (b"[null]", "application/json"),
+        (b"\x00" * 7, "application/octet-stream"),
+    ],
+    ids=["truncated", "object", "float", "null", "partial-int64"],
+)
+def test_bulk_malformed_body(reference_server: ServerThread, body: bytes, content_type: str) -> None:
+    """
+    Test that malformed bulk bodies are rejected with 400 and the API's false body.
+    """
+    status, _, payload = post(reference_server, body, content_type)
+
+    assert status == 400
+    assert payload is False
+
+
+def test_bulk_wrong_content_type(reference_server: ServerThread) -> None:
+    """
+    Test that bulk bodies of other media types are rejected with 415.
+    """
+    status, _, payload = post(reference_server, b"s=0", "application/x-www-form-urlencoded")
+
+    assert status == 415
+    assert payload is False
+
+
+def test_bulk_get_not_allowed(reference_server: ServerThread) -> None:
+    """
+    Test that the bulk endpoint only accepts POST.
+    """
+    with pytest.raises(urllib.error.HTTPError) as e:
+        urllib.request.urlopen(reference_server.url + BULK_PATH, timeout=5)
+
+    assert e.value.code == 405
+    assert e.value.headers["Allow"] == "POST"
+
+
+@pytest.mark.parametrize("vectorized", [True, False], ids=["numpy", "scalar"])
+def test_format_timestamps_matches_format_timestamp(monkeypatch: pytest.MonkeyPatch, vectorized: bool) -> None:
+    """
+    Test that vectorized formatting agrees with one-by-one formatting, also outside the numpy range.
+    """
+    if vectorized:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(bulk, "np", None)
+    timestamps = [*TIMESTAMPS, bulk.VECTOR_MIN - 1, bulk.VECTOR_MIN, -62135596800, -62135596801, 951782400]
+
+    assert bulk.format_timestamps(timestamps) == [format_timestamp(timestamp) for timestamp in timestamps]
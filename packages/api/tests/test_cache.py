@@ -0,0 +1,113 @@
+from pathlib import Path
+
+import pytest
+from api.cache import ConversionCache
+from api.converter import encode
+from api.server import ConverterServer, ServerThread
+from api_sdk import ApiClient, TimestampApi
+
+from packages.api.tests.fixtures.common import BASE_URL_ENV, upstream_configuration
+
+
+def test_cache_hit_and_miss() -> None:
+    """
+    Test that stored bodies are returned and counted as hits, unknown keys as misses.
+    """
+    cache = ConversionCache(2)
+    cache.set("0", b'"1970-01-01 12:00:00"')
+
+    assert cache.get("0") == b'"1970-01-01 12:00:00"'
+    assert cache.get("1") is None
+    assert cache.stats == {"size": 1, "maxsize": 2, "hits": 1, "misses": 1, "evictions": 0}
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    """
+    Test that a full cache evicts the entry that was used least recently, not the oldest one.
+    """
+    cache = ConversionCache(2)
+    cache.set("a", b"1")
+    cache.set("b", b"2")
+    cache.get("a")
+    cache.set("c", b"3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1"
+    assert cache.get("c") == b"3"
+    assert len(cache) == 2
+    assert cache.evictions == 1
+
+
+def test_cache_overwrite_does_not_evict() -> None:
+    """
+    Test that storing an existing key replaces its body and refreshes it without evicting.
+    """
+    cache = ConversionCache(2)
+    cache.set("a", b"1")
+    cache.set("b", b"2")
+    cache.set("a", b"3")
+    cache.set("c", b"4")
+
+    assert cache.get("a") == b"3"
+    assert cache.get("b") is None
+    assert cache.evictions == 1
+
+
+def test_cache_maxsize_must_be_positive() -> None:
+    """
+    Test that an empty cache is rejected, the server disables caching with cache_size=0 instead.
+    """
+    with pytest.raises(ValueError):
+        ConversionCache(0)
+
+
+def test_server_caches_only_cached_requests() -> None:
+    """
+    Test that only requests with the `cached` parameter, whatever its value, use the cache.
+    """
+    server = ConverterServer(cache_size=2)
+    assert server.cache is not None
+
+    assert server.convert("s=0") == encode("1970-01-01 12:00:00")
+    assert len(server.cache) == 0
+    assert server.convert("s=0&cached") == server.convert("cached=false&s=0") == encode("1970-01-01 12:00:00")
+    assert server.cache.stats == {"size": 1, "maxsize": 2, "hits": 1, "misses": 1, "evictions": 0}
+    assert server.convert("s=foo&cached") == encode(False)
+    assert server.convert("s=2023-01-01&cached") == encode(1672531200)
+    assert server.cache.evictions == 1
+
+
+def test_server_without_cache_ignores_cached() -> None:
+    """
+    Test that a server with cache_size=0 answers `cached` requests like the live API.
+    """
+    server = ConverterServer(cache_size=0)
+
+    assert server.cache is None
+    assert server.convert("s=0&cached") == encode("1970-01-01 12:00:00")
+    assert server.stats["cache"] is None
+
+
+def test_client_response_cache_file_serves_reruns(
+    reference_server: ServerThread, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that the test client configuration with an on-disk response cache answers a rerun from disk.
+
+    The test suite keeps its cache in memory, this is the only place the disk cache is enabled.
+    """
+    monkeypatch.setenv(BASE_URL_ENV, reference_server.url)
+    configuration = upstream_configuration()
+    configuration.response_cache_file = str(tmp_path / "responses.sqlite3")
+
+    with ApiClient(configuration) as client:
+        first = TimestampApi(client).convert_timestamp_with_http_info(cached="", s=0)
+    # a new client, as in the next test run
+    with ApiClient(configuration) as client:
+        second = TimestampApi(client).convert_timestamp_with_http_info(cached="", s=0)
+        assert client.response_cache is not None
+        assert client.response_cache.stats["hits"] == 1
+
+    assert first.timings is not None
+    assert second.timings is None
+    assert second.data.actual_instance == first.data.actual_instance == "1970-01-01 12:00:00"
@@ -0,0 +1,104 @@
+import random
+from datetime import UTC, datetime
+
+import pytest
+from api.converter import MAX_TIMESTAMP, MIN_TIMESTAMP, convert, format_timestamp
+
+from packages.api.tests.utils.time_tools import unix_to_datetime_string
+
+
+def strftime(timestamp: int, fmt: str = "%Y-%m-%d %I:%M:%S") -> str:
+    """Format with `datetime`, on the API's 12-hour clock by default."""
+    return datetime.fromtimestamp(timestamp, UTC).strftime(fmt)
+
+
+def random_timestamps(count: int, seed: int = 0) -> list[int]:
+    """Random timestamps over the whole range of `datetime`."""
+    rng = random.Random(seed)
+    return [rng.randrange(MIN_TIMESTAMP, MAX_TIMESTAMP + 1) for _ in range(count)]
+
+
+@pytest.mark.parametrize(
+    ("timestamp", "expected"),
+    [
+        (0, "1970-01-01 12:00:00"),
+        (-1, "1969-12-31 11:59:59"),
+        (1, "1970-01-01 12:00:01"),
+        (43_199, "1970-01-01 11:59:59"),
+        (43_200, "1970-01-01 12:00:00"),
+        (86_399, "1970-01-01 11:59:59"),
+        (-86_400, "1969-12-31 12:00:00"),
+        (-1_234_567_890, "1930-11-18 12:28:30"),
+        (2**31 - 1, "2038-01-19 03:14:07"),
+        (2**31, "2038-01-19 03:14:08"),
+        (951_782_400, "2000-02-29 12:00:00"),
+        (951_868_799, "2000-02-29 11:59:59"),
+        (1_709_164_800, "2024-02-29 12:00:00"),
+        (-2_203_891_200, "1900-03-01 12:00:00"),
+        (-30_610_224_000, "1000-01-01 12:00:00"),
+        (32_503_680_000, "3000-01-01 12:00:00"),
+        (MIN_TIMESTAMP, "1-01-01 12:00:00"),
+        (MAX_TIMESTAMP, "9999-12-31 11:59:59"),
+    ],
+)
+def test_format_timestamp(timestamp: int, expected: str) -> None:
+    """
+    Test formatting around the epoch, 2038, leap days, century years and the range ends.
+    """
+    assert format_timestamp(timestamp) == expected
+
+
+@pytest.mark.parametrize("timestamp", [MIN_TIMESTAMP - 1, MAX_TIMESTAMP + 1, -(2**63), 2**63 - 1])
+def test_format_timestamp_out_of_range(timestamp: int) -> None:
+    """
+    Test that timestamps outside the years 1 to 9999 are formatted as False like on the API.
+    """
+    assert format_timestamp(timestamp) is False
+
+
+def test_format_timestamp_matches_strftime() -> None:
+    """
+    Test the integer formatter against `datetime` on random timestamps and every leap day.
+    """
+    leap_days = [
+        int(datetime(year, 2, 29, 23, 59, 59, tzinfo=UTC).timestamp())
+        for year in range(4, 10000, 4)
+        if year % 100 or not year % 400
+    ]
+    for timestamp in leap_days + random_timestamps(20_000):
+        assert format_timestamp(timestamp) == strftime(timestamp), timestamp
+
+
+def test_unix_to_datetime_string_matches_strftime() -> None:
+    """
+    Test the test suite's integer formatter against `datetime`, including its 24-hour hotfix for hour 0.
+    """
+    for timestamp in [MIN_TIMESTAMP, MAX_TIMESTAMP, -1, 0, 43_200] + random_timestamps(5_000, seed=1):
+        dt = datetime.fromtimestamp(timestamp, UTC)
+
+        assert unix_to_datetime_string(timestamp, force_12h=True) == strftime(timestamp)
+        assert unix_to_datetime_string(timestamp) == dt.strftime(
+            "%Y-%m-%d 12:%M:%S" if dt.hour == 0 else "%Y-%m-%d %H:%M:%S"
+        )
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("0", "1970-01-01 12:00:00"),
+        (" -1 ", "1969-12-31 11:59:59"),
+        ("+43200", "1970-01-01 12:00:00"),
+        ("1.9", "1970-01-01 12:00:01"),
+        ("1e3", "1970-01-01 12:16:40"),
+        ("1e400", False),
+        ("253402300800", False),
+        ("2023-01-01", 1672531200),
+        ("foo", False),
+        ("", False),
+    ],
+)
+def test_convert(value: str, expected: int | str | bool) -> None:
+    """
+    Test converting the `s` parameter, numeric strings like PHP's is_numeric() and date strings.
+    """
+    assert convert(value) == expected
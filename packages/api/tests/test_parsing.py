@@ -0,0 +1,143 @@
+import random
+from datetime import UTC, date, datetime, timedelta
+
+import pytest
+from api.parsing import YEAR_START, days_from_civil, parse_datetime
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+# strptime formats of the forms the API accepts, %z covers every offset notation
+STRPTIME_FORMATS = [
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d",
+    "%Y/%m/%d %H:%M:%S",
+    "%Y/%m/%d",
+    "%Y-%m-%d %I:%M:%S %p",
+    "%Y-%m-%d %I:%M %p",
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%Y-%m-%d %H:%M:%S %z",
+]
+
+
+def strptime_unix(value: str, fmt: str) -> int:
+    """Parse with strptime, in UTC unless the value carries an offset."""
+    dt = datetime.strptime(value, fmt)
+    return int(dt.replace(tzinfo=dt.tzinfo or UTC).timestamp())
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("1970-01-01", 0),
+        ("1970-01-01 00:00:00", 0),
+        ("1969-12-31 23:59:59", -1),
+        ("2023-01-01", 1672531200),
+        ("2023-1-1", 1672531200),
+        ("2023/01/01", 1672531200),
+        ("  2023-01-01 12:00  ", 1672574400),
+        ("2023-01-01T12:00:00", 1672574400),
+        ("2023-01-01 12:00:00 AM", 1672531200),
+        ("2023-01-01 12:00:00 PM", 1672574400),
+        ("2023-01-01 1:05 p.m.", 1672578300),
+        ("2023-01-01 12:00:00Z", 1672574400),
+        ("2023-01-01 12:00:00 UTC", 1672574400),
+        ("2023-01-01 12:00:00 gmt", 1672574400),
+        ("2023-01-01 12:00:00+1", 1672570800),
+        ("2023-01-01 12:00:00+01", 1672570800),
+        ("2023-01-01 12:00:00+130", 1672569000),
+        ("2023-01-01 12:00:00+0130", 1672569000),
+        ("2023-01-01 12:00:00+1:30", 1672569000),
+        ("2023-01-01 12:00:00-01:30", 1672579800),
+        ("2023-01-01+2359", 1672444860),
+        ("2000-02-29", 951782400),
+        ("0001-01-01", -62135596800),
+        ("9999-12-31 23:59:59", 253402300799),
+    ],
+)
+def test_parse_datetime(value: str, expected: int) -> None:
+    """
+    Test parsing the date string forms accepted by the API.
+    """
+    assert parse_datetime(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "",
+        "   ",
+        "foo",
+        "ünïcødé",
+        "2023",
+        "2023-01",
+        "2023-01/01",
+        "2023-13-01",
+        "2023-00-01",
+        "2023-01-32",
+        "2023-01-00",
+        "0000-01-01",
+        "0000-01-01 00:00:00",
+        "0000/12/31 23:59:59",
+        "2023-01-01 24:00:00",
+        "2023-01-01 10:60:00",
+        "2023-01-01 10:00:60",
+        "2023-01-01 10",
+        "2023-01-01 13:00:00 PM",
+        "2023-01-01 00:00:00 AM",
+        "2023-01-01 10:00:00 X",
+        "2023-01-01+0199",
+        "2023-01-01+1:60",
+        "2023-01-01+24",
+        "2023-01-01+2400",
+        "2023-01-01-99:00",
+        "2023-01-01+123:45",
+        "2023-01-01+",
+        "2023-01-01+01:0a",
+    ],
+)
+def test_parse_datetime_invalid(value: str) -> None:
+    """
+    Test that malformed dates, times and UTC offsets are rejected.
+    """
+    assert parse_datetime(value) is None
+
+
+def test_parse_datetime_day_overflow() -> None:
+    """
+    Test that days past the end of the month roll over into the next month like on the API.
+    """
+    assert parse_datetime("2023-02-29") == parse_datetime("2023-03-01")
+    assert parse_datetime("2024-02-30") == parse_datetime("2024-03-01")
+    assert parse_datetime("2023-04-31 12:00") == parse_datetime("2023-05-01 12:00")
+    assert parse_datetime("2023-12-32") is None
+
+
+def test_parse_datetime_matches_strptime() -> None:
+    """
+    Test the parser against strptime on random dates and offsets in every form.
+    """
+    rng = random.Random(0)
+    start = datetime(1000, 1, 1)
+    seconds = int((datetime(9999, 12, 30) - start).total_seconds())
+    for _ in range(5000):
+        dt = start + timedelta(seconds=rng.randrange(seconds))
+        fmt = rng.choice(STRPTIME_FORMATS)
+        value = dt.strftime(fmt.removesuffix("%z"))
+        if fmt.endswith("%z"):
+            hours, minutes = divmod(rng.randrange(24 * 60), 60)
+            value += f"{rng.choice('+-')}{hours:02d}{rng.choice(['', ':'])}{minutes:02d}"
+
+        assert parse_datetime(value) == strptime_unix(value, fmt), value
+
+
+def test_days_from_civil() -> None:
+    """
+    Test the day count against date ordinals, including the year tables built from it.
+    """
+    for ordinal in range(1, date.max.toordinal() + 1, 997):
+        day = date.fromordinal(ordinal)
+
+        assert days_from_civil(day.year, day.month, day.day) == ordinal - EPOCH_ORDINAL
+    for year in (1, 4, 100, 400, 1900, 1970, 2000, 9999):
+        assert YEAR_START[year] == date(year, 1, 1).toordinal() - EPOCH_ORDINAL
+    assert days_from_civil(0, 3, 1) == -719468
@@ -0,0 +1,83 @@
+import socket
+import time
+
+import pytest
+from api.server import CONVERTER_PATH, ServerThread
+
+BODY = b"[1672531200]"
+HEAD = (
+    b"POST /api/unix-timestamp-converter/bulk/ %s\r\n"
+    b"Host: localhost\r\n"
+    b"Content-Type: application/json\r\n"
+    b"Content-Length: %d\r\n"
+    b"%s"
+    b"\r\n"
+)
+CONVERTED = b'["2023-01-01 12:00:00"]'
+
+
+def exchange(server: ServerThread, *writes: bytes) -> bytes:
+    """
+    Send raw request bytes in separate writes and read until the server closes the connection.
+
+    Args:
+        server: The server to talk to.
+        writes: The chunks to send, each in its own TCP segment.
+
+    Returns:
+        Everything the server sent.
+    """
+    with socket.create_connection((server.server.host, server.server.port), timeout=5) as sock:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        for data in writes:
+            sock.sendall(data)
+            # give the server a read of its own for each chunk
+            time.sleep(0.05)
+        chunks = []
+        while chunk := sock.recv(65536):
+            chunks.append(chunk)
+    return b"".join(chunks)
+
+
+@pytest.mark.parametrize(
+    ("version", "connection"),
+    [(b"HTTP/1.1", b"Connection: close\r\n"), (b"HTTP/1.0", b"")],
+    ids=["connection-close", "http-1.0"],
+)
+def test_body_after_head_without_keep_alive(reference_server: ServerThread, version: bytes, connection: bytes) -> None:
+    """
+    Test that a request without keep-alive is answered when its body arrives after the head.
+    """
+    response = exchange(reference_server, HEAD % (version, len(BODY), connection), BODY)
+
+    assert response.startswith(b"HTTP/1.1 200 OK\r\n")
+    assert b"\r\nConnection: close\r\n" in response
+    assert response.endswith(b"\r\n\r\n" + CONVERTED)
+
+
+def test_body_in_pieces_with_keep_alive(reference_server: ServerThread) -> None:
+    """
+    Test that a keep-alive connection stays open for the rest of a body and the next request.
+    """
+    last = b"GET %s?s=0 HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n" % CONVERTER_PATH.encode()
+
+    response = exchange(reference_server, HEAD % (b"HTTP/1.1", len(BODY), b""), BODY[:5], BODY[5:], last)
+
+    first, _, second = response.partition(CONVERTED)
+    assert first.startswith(b"HTTP/1.1 200 OK\r\n")
+    assert b"Connection: close" not in first
+    assert second.startswith(b"HTTP/1.1 200 OK\r\n")
+    assert second.endswith(b'"1970-01-01 12:00:00"')
+
+
+def test_pipelined_requests_after_close_are_dropped(reference_server: ServerThread) -> None:
+    """
+    Test that the connection ends with the response to the request asking to close it.
+    """
+    query = b"GET %s?s=0 HTTP/1.1\r\nHost: localhost\r\n%s\r\n"
+    close = query % (CONVERTER_PATH.encode(), b"Connection: close\r\n")
+    keep_alive = query % (CONVERTER_PATH.encode(), b"")
+
+    response = exchange(reference_server, close + keep_alive)
+
+    assert response.count(b"HTTP/1.1 200 OK\r\n") == 1
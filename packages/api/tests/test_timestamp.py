@@ -1,5 +1,7 @@
 import logging
 import pytest
+from api_sdk import ApiClient, Configuration, TimestampApi
+from packages.api.tests.fixtures.common import BASE_URL, api_base_url
 from packages.api.tests.fixtures.timestamp import TestTimestampApi
 from packages.api.tests.utils.time_tools import unix_to_datetime_string, datetime_string_to_unix
 
@@ -335,3 +337,35 @@ def test_convert_boolean_input(timestamp_client: TestTimestampApi, logger: loggi
 
     assert res.status_code == 200
     assert not res.payload, f"Expected no payload for boolean input, got {res.payload}"
+
+
+def test_convert_many_timestamps(timestamp_client: TestTimestampApi, logger: logging.Logger) -> None:
+    """
+    Test converting several timestamps in one bulk call keeps the input order.
+    """
+    timestamps = [1672531201, 2147483647, 1672531200]
+    logger.info("Testing timestamps in bulk: %s", timestamps)
+
+    results = list(timestamp_client.convert_many(timestamps, max_in_flight=2))
+
+    assert [res.status_code for res in results] == [200, 200, 200]
+    assert [res.payload for res in results] == [unix_to_datetime_string(ts) for ts in timestamps]
+
+
+@pytest.mark.skipif(api_base_url() == BASE_URL, reason="only the reference server (--local-api) has the bulk endpoint")
+def test_convert_bulk_matches_single_conversions(timestamp_client: TestTimestampApi, logger: logging.Logger) -> None:
+    """
+    Test the bulk endpoint converts JSON and binary arrays like the single endpoint.
+    """
+    values: list[int | str] = [1672531200, 1672603800, -1, "2023-02-29", "1672574400", "foo"]
+    logger.info("Testing values on the bulk endpoint: %s", values)
+
+    # directly, the sidecar proxy only forwards GET requests
+    with ApiClient(Configuration(host=api_base_url())) as client:
+        api = TimestampApi(client)
+        results = api.convert_timestamps_bulk(values)
+        binary = api.convert_timestamps_bulk(values[:3], _content_type="application/octet-stream")
+
+    expected = [timestamp_client.convert(timestamp=value).payload for value in values]
+    assert [res.to_dict() for res in results] == expected
+    assert [res.to_dict() for res in binary] == expected[:3]
@@ -0,0 +1,159 @@
+import json
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import urllib3
+from api_sdk import ApiClient
+from api_sdk.cache import CachedResponse
+from api_sdk.exceptions import ApiException
+
+STATS_PATH = "/_sidecar/stats"
+# hop-by-hop headers, and the ones describing the body as read from the upstream
+DROPPED_HEADERS = frozenset(
+    {
+        "connection",
+        "keep-alive",
+        "transfer-encoding",
+        "content-encoding",
+        "content-length",
+    }
+)
+
+
+class SidecarProxy:
+    """
+    Local HTTP proxy sharing one upstream API client between pytest-xdist workers.
+
+    The workers send their requests to the proxy instead of the API, so the
+    whole test run goes through a single connection pool, rate limiter and
+    response cache. Identical requests in flight are sent upstream once.
+
+    Args:
+        client: API client for the upstream, with the rate limit, caching and
+            request coalescing of the test run enabled.
+        logger: Logger for the forwarded requests.
+    """
+
+    def __init__(self, client: ApiClient, logger: logging.Logger) -> None:
+        self.client = client
+        self.logger = logger
+        self.forwarded = 0
+        self.failed = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(self))
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="api-sidecar", daemon=True)
+
+    @property
+    def url(self) -> str:
+        """Base URL the workers use as their API host."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def start(self) -> "SidecarProxy":
+        """Start serving in a background thread."""
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """Stop serving and close the upstream client."""
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self.client.close()
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """
+        Counters of the proxy and of the shared upstream client.
+
+        Returns:
+            Mapping of component name to its stats.
+        """
+        with self._lock:
+            stats: dict[str, Any] = {"requests": {"forwarded": self.forwarded, "failed": self.failed}}
+        rest_client = self.client.rest_client
+        stats["pool"] = rest_client.pool_stats()
+        if self.client.response_cache is not None:
+            stats["cache"] = self.client.response_cache.stats
+        if self.client.single_flight is not None:
+            stats["coalesced"] = {"calls": self.client.single_flight.calls, "shared": self.client.single_flight.shared}
+        if rest_client.rate_limiter is not None:
+            stats["rate_limiter"] = {"throttled": rest_client.rate_limiter.throttled}
+        if rest_client.concurrency_limiter is not None:
+            stats["concurrency_limiter"] = rest_client.concurrency_limiter.stats
+        if rest_client.circuit_breaker is not None:
+            stats["circuit_breaker"] = rest_client.circuit_breaker.stats
+        return stats
+
+    def forward(self, path: str, headers: dict[str, str]) -> tuple[int, str, list[tuple[str, str]], bytes]:
+        """
+        Send a GET request upstream, or answer it from the shared cache.
+
+        Args:
+            path: Request path including the query string.
+            headers: Request headers to pass on.
+
+        Returns:
+            Status, reason, headers and body of the response. Failing to reach
+            the upstream is answered with 502 Bad Gateway.
+        """
+        url = self.client.configuration.host + path
+        try:
+            response = self.client.call_api("GET", url, header_params=headers, _cacheable=True)
+            data = response.read()
+        except (ApiException, urllib3.exceptions.HTTPError) as e:
+            self.logger.warning("Sidecar failed to forward %s: %s", path, e)
+            with self._lock:
+                self.failed += 1
+            return 502, "Bad Gateway", [("Content-Type", "text/plain")], str(e).encode()
+
+        with self._lock:
+            self.forwarded += 1
+        if response.cache_key is not None and 200 <= response.status <= 299:
+            self.client.response_cache.set(response.cache_key, CachedResponse.from_response(response))
+        response_headers = [
+            (name, value) for name, value in response.getheaders().items() if name.lower() not in DROPPED_HEADERS
+        ]
+        return response.status, response.reason, response_headers, data
+
+
+def _make_handler(proxy: SidecarProxy) -> type[BaseHTTPRequestHandler]:
+    """
+    Create the request handler class serving `proxy`.
+
+    Args:
+        proxy: Proxy the handler forwards the requests to.
+
+    Returns:
+        Keep-alive request handler class for the proxy's HTTP server.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        # the workers keep their connections to the proxy open
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            if self.path == STATS_PATH:
+                status, reason = 200, "OK"
+                headers = [("Content-Type", "application/json")]
+                body = json.dumps(proxy.stats).encode()
+            else:
+                forwarded = {name: value for name, value in self.headers.items() if name.lower() == "accept"}
+                status, reason, headers, body = proxy.forward(self.path, forwarded)
+            # the upstream's Server and Date headers are passed on instead of the proxy's own
+            self.log_request(status)
+            self.send_response_only(status, reason)
+            for name, value in headers:
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            proxy.logger.debug("Sidecar %s - %s", self.address_string(), format % args)
+
+    return Handler
@@ -1,5 +1,36 @@
 from datetime import datetime, timezone
 
+# 0001-01-01 00:00:00 to 9999-12-31 23:59:59, the range of datetime
+MIN_TIMESTAMP = -62135596800
+MAX_TIMESTAMP = 253402300799
+
+TWO_DIGITS = [f"{i:02d}" for i in range(100)]
+HOURS_12 = [TWO_DIGITS[(hour + 11) % 12 + 1] for hour in range(24)]
+HOURS_24 = ["12"] + TWO_DIGITS[1:24]
+
+
+def civil_from_days(days: int) -> tuple[int, int, int]:
+    """
+    Convert days since 1970-01-01 to a proleptic Gregorian date.
+
+    Uses Howard Hinnant's civil_from_days algorithm, with years starting on
+    March 1st so the leap day is the last day of the year.
+
+    Args:
+        days: Days since the epoch, negative before 1970
+
+    Returns:
+        Year, month and day
+    """
+    era, day_of_era = divmod(days + 719468, 146097)
+    year_of_era = (day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096) // 365
+    day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+    month = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * month + 2) // 5 + 1
+    if month < 10:
+        return era * 400 + year_of_era, month + 3, day
+    return era * 400 + year_of_era + 1, month - 9, day
+
 
 def unix_to_datetime_string(timestamp: int, force_12h: bool = False) -> str:
     """
@@ -14,21 +45,23 @@ def unix_to_datetime_string(timestamp: int, force_12h: bool = False) -> str:
 
     NOTE: There is a bug in the API that returns timestamps for the 12th hour as
     00:00:00 instead of 12:00:00.
+
+    The date is computed with integer arithmetic and two-digit lookup tables,
+    without building a datetime, so sweeping many timestamps stays cheap.
     """
-    dt = datetime.fromtimestamp(timestamp, timezone.utc)
+    if not MIN_TIMESTAMP <= timestamp <= MAX_TIMESTAMP:
+        raise ValueError(f"timestamp {timestamp} is out of range")
+    days, seconds = divmod(timestamp, 86400)
+    hour, seconds = divmod(seconds, 3600)
+    year, month, day = civil_from_days(days)
 
     # BUG api inconsistent around 12h and 24h formats
     # this is where a Jira ticket or similar would be to track the bug
-    if dt.hour == 0:
-        # hotfix for the API defect around the 12th hour
-        return dt.strftime("%Y-%m-%d 12:%M:%S")
-
-    # BUG api inconsistent around 12h and 24h formats
-    if force_12h:
-        # hotfix for the API returning 12h date time format instead of 24h
-        return dt.strftime("%Y-%m-%d %I:%M:%S")
-
-    return dt.strftime("%Y-%m-%d %H:%M:%S")
+    # hotfix for the API defect around the 12th hour: HOURS_24 renders hour 0 as 12
+    # hotfix for the API returning 12h date time format instead of 24h: HOURS_12
+    hours = HOURS_12 if force_12h else HOURS_24
+    minute, second = divmod(seconds, 60)
+    return f"{year}-{TWO_DIGITS[month]}-{TWO_DIGITS[day]} {hours[hour]}:{TWO_DIGITS[minute]}:{TWO_DIGITS[second]}"
 
 
 def datetime_string_to_unix(datetime_string: str) -> int:
@@ -0,0 +1,35 @@
+import math
+import statistics
+from collections.abc import Iterable
+
+from api_sdk import RequestTimings
+
+# same phases as the k6 `http_req_*` metrics
+PHASES = ("blocked", "connecting", "tls_handshaking", "waiting", "receiving", "duration")
+
+
+def summarize_timings(timings: Iterable[RequestTimings]) -> dict[str, dict[str, float]]:
+    """
+    Summarize request timings the way the k6 end-of-test summary does.
+
+    Args:
+        timings: Timings of the requests sent during the test run.
+
+    Returns:
+        Mapping of phase name to its avg, min, med, max and p(95) in milliseconds.
+        Phases without any recorded value are left out.
+    """
+    summary: dict[str, dict[str, float]] = {}
+    records = [t.as_dict() for t in timings]
+    for phase in PHASES:
+        values = sorted(value * 1000 for r in records if (value := r[phase]) is not None)
+        if not values:
+            continue
+        summary[phase] = {
+            "avg": statistics.fmean(values),
+            "min": values[0],
+            "med": statistics.median(values),
+            "max": values[-1],
+            "p(95)": values[math.ceil(len(values) * 0.95) - 1],
+        }
+    return summary
@@ -6,8 +6,12 @@
 # This script performs the following steps:
 # 1. Checks for the`openapi-generator-cli` python dependency
 # 2. Validates the OpenAPI specification file
-# 3. Cleans up the output directory before generation
-# 4. Generates the API client SDK
+# 3. Deletes the files of the previous generation
+# 4. Generates the API client SDK with the templates in utils/api-gen-templates
+#
+# The SDK is generated code with customized templates next to hand-written
+# modules and tests. Those are listed in the package's .openapi-generator-ignore
+# and survive regeneration, edit the templates rather than the generated files.
 #
 
 set -o errexit
@@ -35,9 +39,17 @@ if ! openapi-generator-cli validate -i "$API_SPEC_FILE"; then
 fi
 echo "INFO: API specification is valid."
 
-echo "INFO: Cleaning up output directory: $PACKAGE_SRC_DIR/$PACKAGE_NAME"
-# Delete all files and directories inside, except for py.typed
-find "$PACKAGE_SRC_DIR/$PACKAGE_NAME" -mindepth 1 ! -name "py.typed" -delete
+echo "INFO: Cleaning up the generated files in: $PACKAGE_SRC_DIR"
+# Delete only what the previous generation wrote, so that files dropped from
+# the spec disappear while the hand-written modules are kept
+GENERATED_FILES="$PACKAGE_SRC_DIR/.openapi-generator/FILES"
+if [[ -f "$GENERATED_FILES" ]]; then
+    while IFS= read -r file; do
+        if [[ -n "$file" && "$file" != ".openapi-generator-ignore" ]]; then
+            rm -f "$PACKAGE_SRC_DIR/$file"
+        fi
+    done < "$GENERATED_FILES"
+fi
 echo "INFO: Cleanup complete."
 
 echo "INFO: Generating Python API client from $API_SPEC_FILE..."